@@ -24,24 +24,24 @@ class LogComparator:
         Returns:
             Dictionary with comparison results
         """
-        # Normalize entries for comparison
-        log1_normalized = [self._normalize_entry(entry) for entry in log1_results]
-        log2_normalized = [self._normalize_entry(entry) for entry in log2_results]
+        # Normalize each entry to its hashed key once; dict keys dedupe like a set
+        # but keep first-seen order, so the unique lists follow the files
+        log1_keys = dict.fromkeys(map(self._normalize_entry, log1_results))
+        log2_keys = dict.fromkeys(map(self._normalize_entry, log2_results))
         
-        # Convert to sets for comparison
-        log1_set = set(log1_normalized)
-        log2_set = set(log2_normalized)
-        
-        # Find unique and common entries
-        unique_to_log1 = log1_set - log2_set
-        unique_to_log2 = log2_set - log1_set
-        common = log1_set & log2_set
+        # Find unique and common entries with one hashed lookup per key
+        unique_to_log1 = [entry for entry in log1_keys if entry not in log2_keys]
+        unique_to_log2 = [entry for entry in log2_keys if entry not in log1_keys]
+        common = [entry for entry in log1_keys if entry in log2_keys]
         
         # Convert back to readable format
         unique_to_log1_list = [self._denormalize_entry(entry) for entry in unique_to_log1]
         unique_to_log2_list = [self._denormalize_entry(entry) for entry in unique_to_log2]
         common_list = [self._denormalize_entry(entry) for entry in common]
         
+        # Jaccard similarity from the counts already known - no set operations needed
+        similarity = self._calculate_similarity(len(log1_keys), len(log2_keys), len(common))
+        
         return {
             'unique_to_log1': unique_to_log1_list,
             'unique_to_log1_count': len(unique_to_log1_list),
@@ -51,7 +51,7 @@ class LogComparator:
             'common_count': len(common_list),
             'log1_total': len(log1_results),
             'log2_total': len(log2_results),
-            'similarity_score': self._calculate_similarity(log1_set, log2_set)
+            'similarity_score': similarity
         }
     
     def _normalize_entry(self, entry: Dict) -> str:
@@ -93,21 +93,21 @@ class LogComparator:
             return parts[0]  # Return main content
         return normalized
     
-    def _calculate_similarity(self, set1: set, set2: set) -> float:
+    def _calculate_similarity(self, count1: int, count2: int, common_count: int) -> float:
         """
-        Calculate similarity score between two sets (Jaccard similarity)
+        Calculate similarity score between two sets (Jaccard similarity) from their
+        sizes and the size of their intersection
         Returns value between 0.0 (completely different) and 1.0 (identical)
         """
-        if not set1 and not set2:
+        if not count1 and not count2:
             return 1.0
         
-        if not set1 or not set2:
+        if not count1 or not count2:
             return 0.0
         
-        intersection = len(set1 & set2)
-        union = len(set1 | set2)
+        union = count1 + count2 - common_count
         
-        return intersection / union if union > 0 else 0.0
+        return common_count / union if union > 0 else 0.0
     
     def generate_diff_report(self, comparison: Dict) -> str:
         """Generate a human-readable diff report"""
@@ -4,16 +4,23 @@ With Dark Mode, Keyboard Shortcuts, Analytics, Filtering, Comparison, and Histor
 """
 
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import ttk, filedialog, scrolledtext, messagebox
 try:
     from tkinterdnd2 import DND_FILES, TkinterDnD
     TKINTERDND_AVAILABLE = True
 except ImportError:
     TKINTERDND_AVAILABLE = False
+import codecs
+import hashlib
 import json
+import mmap
 import os
 import re
-from collections import Counter
+from bisect import bisect_right
+from contextlib import contextmanager
+from collections import Counter, OrderedDict, defaultdict
+from itertools import accumulate, islice
 from xml_log_parser import XMLLogParser, NRCCodeExplainer, HexExplainer
 from text_log_parser import TextLogParser
 from simplified_report import SimplifiedReportGenerator
@@ -24,7 +31,7 @@ from comparison_engine import LogComparator
 from database_manager import DatabaseManager
 from fdrs_log_parser import FDRSLogParser
 from performance_manager import PerformanceManager, ProgressDialog
-from ui_enhancements import ToolTipManager, LoadingAnimation, StatusBarEnhancer, ModernButton, add_tooltip
+from ui_enhancements import ToolTipManager, LoadingAnimation, StatusBarEnhancer, ModernButton, VirtualTextView, VirtualListbox, MonoLogView, add_tooltip
 try:
     from module_dependency_tracker import ModuleDependencyTracker
     DEPENDENCY_TRACKER_AVAILABLE = True
@@ -50,7 +57,443 @@ try:
     CRITICAL_DIAGNOSTICS_AVAILABLE = True
 except ImportError:
     CRITICAL_DIAGNOSTICS_AVAILABLE = False
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+import queue
 import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Status keywords used to classify parsed results for the summary cards,
+# matched in a single pass (Aho-Corasick automaton, or regex alternation)
+_SUMMARY_KEYWORDS = ('not successful', 'error', 'fail', 'exception', 'warning', 'caution', 'warn', 'success', 'pass')
+_SUMMARY_RX = re.compile('|'.join(_SUMMARY_KEYWORDS))
+_ERROR_TOKENS = frozenset(('error', 'fail', 'exception', 'not successful'))
+_WARNING_TOKENS = frozenset(('warning', 'caution'))
+_SUCCESS_TOKENS = frozenset(('success', 'pass'))
+if AHOCORASICK_AVAILABLE:
+    # One automaton walk reports every keyword, including overlapping ones
+    _SUMMARY_AUTOMATON = ahocorasick.Automaton()
+    for _keyword in _SUMMARY_KEYWORDS:
+        _SUMMARY_AUTOMATON.add_word(_keyword, _keyword)
+    _SUMMARY_AUTOMATON.make_automaton()
+
+
+# Each keyword is one bit of a per-row mask; every possible mask is classified once
+# up front so counting a row is a table lookup instead of a chain of set tests
+_SUMMARY_KEYWORD_BITS = {keyword: 1 << i for i, keyword in enumerate(_SUMMARY_KEYWORDS)}
+_SUMMARY_COUNT_KEYS = ('errors', 'warnings', 'success',  # summary cards
+                       'summary_errors', 'summary_successes', 'summary_warnings')  # DB summary
+
+
+def _classify_keyword_mask(mask):
+    """Per-category 0/1 increments (in _SUMMARY_COUNT_KEYS order) for a keyword mask"""
+    tokens = {keyword for keyword, bit in _SUMMARY_KEYWORD_BITS.items() if mask & bit}
+    
+    # Summary cards: error and warning are independent, success excludes errors
+    is_error = not tokens.isdisjoint(_ERROR_TOKENS)
+    is_warning = not tokens.isdisjoint(_WARNING_TOKENS)
+    is_success = not is_error and not tokens.isdisjoint(_SUCCESS_TOKENS)
+    
+    # DB summary: first matching category wins
+    summary_error = 'error' in tokens or 'fail' in tokens
+    summary_success = not summary_error and (
+        'success' in tokens or 'pass' in tokens or 'not successful' in tokens)
+    summary_warning = not summary_error and not summary_success and (
+        'warning' in tokens or 'warn' in tokens)
+    return tuple(int(flag) for flag in (is_error, is_warning, is_success,
+                                        summary_error, summary_success, summary_warning))
+
+
+_SUMMARY_CATEGORY_TABLE = tuple(_classify_keyword_mask(mask)
+                                for mask in range(1 << len(_SUMMARY_KEYWORDS)))
+
+
+def _iter_summary_keywords(text):
+    """Yield (position, keyword) for each status keyword in an already lowered text"""
+    if AHOCORASICK_AVAILABLE:
+        yield from _SUMMARY_AUTOMATON.iter(text)
+    else:
+        for match in _SUMMARY_RX.finditer(text):
+            yield match.start(), match.group()
+
+
+# Module ID at the start of a primary module selection like "716 (GWM - Gateway Module)"
+_PRIMARY_MODULE_RX = re.compile(r'([0-9A-F]{3})')
+
+# Line styling for the simple text report: section header emojis
+_SIMPLE_HEADER_PREFIXES = ('📊', '🎯', '🔍', '❌')
+_SIMPLE_INFO_PREFIXES = ('   ', '  •')
+
+# Line styling for the critical diagnostics report: all section headers are matched
+# by one startswith() call over the tuple (a C loop, no per-prefix Python branch)
+_CRIT_SECTION_HEADERS = (
+    '🚗 VEHICLE IDENTIFICATION',
+    '🔋 BATTERY/VOLTAGE STATUS',
+    '🔧 DIAGNOSTIC TROUBLE CODES',
+    '❌ FAILED OPERATIONS',
+    '✅ SUCCESSFUL OPERATIONS',
+    '📋 DATA IDENTIFIER',
+    '🔍 HEX/ASCII COMMUNICATION',
+    '🎯 PROXIMATE CAUSE ANALYSIS',
+    '⏰ DIAGNOSTIC EVENT TIMELINE',
+)
+_BOX_PREFIXES = ('╔', '╚', '║')
+
+
+def _classify_simple_report_line(line):
+    """Text tag for a line of the simple text report (None for plain text)"""
+    if line.startswith(_SIMPLE_HEADER_PREFIXES):
+        return "section_header"
+    upper = line.upper()
+    if 'ERROR' in upper or '❌' in line or '✗' in line:
+        return "error"
+    if 'WARNING' in upper or '⚠' in line:
+        return "warning"
+    if 'SUCCESS' in upper or '✓' in line or '✅' in line:
+        return "success"
+    if line.startswith(_SIMPLE_INFO_PREFIXES):
+        return "info"
+    if '═' in line or '─' in line:
+        return "bold"
+    return None
+
+
+def _classify_critical_line(line):
+    """Text tag for a line of the critical diagnostics report"""
+    if line.startswith(_BOX_PREFIXES):
+        return "bold"
+    if line.startswith(_CRIT_SECTION_HEADERS):
+        return "section_header"
+    if '❌' in line or 'CRITICAL:' in line or '🚨' in line:
+        return "critical_status"
+    if '⚠️' in line or 'WARNING:' in line:
+        return "warning"
+    lower = line.lower()
+    if '✅' in line or 'good' in lower or 'normal' in lower:
+        return "success"
+    if line.startswith('  '):
+        return "info"
+    if line.startswith('='):
+        return "bold"
+    return "normal"
+
+
+# Line styling for the standalone critical report window: one precompiled alternation
+# per tag class, tried in priority order
+_REPORT_WINDOW_PATTERNS = (
+    (re.compile('🚨|CRITICAL|❌'), "critical"),
+    (re.compile('⚠️|WARNING'), "warning"),
+    (re.compile('✅|SUCCESS|GOOD'), "success"),
+)
+_REPORT_WINDOW_SECTION_PREFIXES = ('🚗 ', '🔋 ', '🔧 ', '📋 ', '🔍 ', '🎯 ', '⏰ ')
+_REPORT_WINDOW_INFO_PREFIXES = ('  •', '    ')
+
+
+_REPORT_WINDOW_TAG_STYLES = {
+    "critical": {'foreground': "red", 'font': ('Courier New', 10, 'bold')},
+    "warning": {'foreground': "orange"},
+    "success": {'foreground': "green"},
+    "info": {'foreground': "cyan"},
+    "header": {'foreground': "yellow", 'font': ('Courier New', 12, 'bold')},
+    "section": {'foreground': "magenta", 'font': ('Courier New', 11, 'bold')},
+}
+
+
+def _classify_report_window_line(line):
+    """Text tag for a line of the critical report window (None for plain text)"""
+    for pattern, tag in _REPORT_WINDOW_PATTERNS:
+        if pattern.search(line):
+            return tag
+    if line.startswith(_BOX_PREFIXES):
+        return "header"
+    if line.startswith(_REPORT_WINDOW_SECTION_PREFIXES):
+        return "section"
+    if line.startswith(_REPORT_WINDOW_INFO_PREFIXES):
+        return "info"
+    return None
+
+
+# Line styling for the module dependency report
+_DEPENDENCY_HEADER_PREFIXES = ('🔗', '📊', '💡', '📡')
+_DEPENDENCY_PATTERNS = (
+    (re.compile('❌|FAILED', re.IGNORECASE), "error"),
+    (re.compile('⚠️|WARNING', re.IGNORECASE), "warning"),
+    (re.compile('✅|Successful:'), "success"),
+)
+
+
+def _classify_dependency_line(line):
+    """Text tag for a line of the module dependency report (None for plain text)"""
+    if line.startswith(_DEPENDENCY_HEADER_PREFIXES):
+        return "header"
+    for pattern, tag in _DEPENDENCY_PATTERNS:
+        if pattern.search(line):
+            return tag
+    if '(' in line and ')' in line and any(c.isdigit() for c in line):
+        # Module names with IDs
+        return "module"
+    if line.startswith('  '):
+        # Indented lines
+        return "info"
+    if '═' in line or '─' in line:
+        # Separator lines
+        return "header"
+    return None
+
+
+def _perf_severity(line_lower):
+    """Severity of an already lower-cased line for the chunked text parser"""
+    for rx, severity in _PERF_SEVERITY_PATTERNS:
+        if rx.search(line_lower):
+            return severity
+    return 'INFO'
+
+
+def _build_line_matcher(keywords):
+    """Matcher for the chunked text parser: lower-cased line -> severity, or None without a keyword
+    
+    With pyahocorasick the filter keywords and the severity words share one automaton,
+    so each line is scanned once for both; otherwise a keyword alternation is searched
+    and only matching lines are classified.
+    """
+    keywords = [k.lower() for k in keywords if k.strip()]
+    if not keywords:
+        return lambda line_lower: None
+    
+    if AHOCORASICK_AVAILABLE:
+        # word -> (is filter keyword, severity rank); a word can be both
+        entries = {}
+        for rank, (_, words) in enumerate(_PERF_SEVERITY_WORDS):
+            for word in words:
+                entries.setdefault(word, (False, rank))
+        for keyword in keywords:
+            entries[keyword] = (True, entries.get(keyword, (False, len(_PERF_SEVERITY_WORDS)))[1])
+        automaton = ahocorasick.Automaton()
+        for word, entry in entries.items():
+            automaton.add_word(word, entry)
+        automaton.make_automaton()
+        
+        def match(line_lower):
+            matched = False
+            best = len(_PERF_SEVERITY_WORDS)
+            for _, (is_keyword, rank) in automaton.iter(line_lower):
+                matched = matched or is_keyword
+                if rank < best:
+                    best = rank
+            return _PERF_SEVERITY_NAMES[best] if matched else None
+        return match
+    
+    keyword_rx = re.compile('|'.join(map(re.escape, keywords)))
+    
+    def match(line_lower):
+        return _perf_severity(line_lower) if keyword_rx.search(line_lower) else None
+    return match
+
+
+def _iter_lines(text):
+    """Lines of text, exactly as text.split('\n') would give them, without building the list"""
+    find = text.find
+    start = 0
+    while True:
+        end = find('\n', start)
+        if end < 0:
+            yield text[start:]
+            return
+        yield text[start:end]
+        start = end + 1
+
+
+def _pretty_json(obj):
+    """Indented JSON for the expert view, using orjson's C encoder when installed"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+        except TypeError:
+            pass  # e.g. non-string keys or big ints - let the stdlib encoder handle it
+    return json.dumps(obj, indent=2)
+
+
+def _json_export_bytes(obj):
+    """Indented JSON document as bytes, using orjson's C encoder when installed"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass  # e.g. non-string keys or big ints - let the stdlib encoder handle it
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
+# Threat card styling per severity: (border color, background color) and icon
+_SEVERITY_COLORS = {
+    'critical': ('#e74c3c', '#fadbd8'),
+    'high': ('#e67e22', '#fdebd0'),
+    'medium': ('#f39c12', '#fef5e7'),
+    'low': ('#27ae60', '#d5f4e6'),
+}
+_DEFAULT_SEVERITY_COLORS = ('#95a5a6', '#ecf0f1')
+_SEVERITY_ICONS = {
+    'critical': '🔴',
+    'high': '🟠',
+    'medium': '🟡',
+    'low': '🟢',
+}
+
+# Severity breakdown chart: bars in display order, each (severity, color)
+_CHART_SEVERITIES = (
+    ('CRITICAL', '#e74c3c'),
+    ('HIGH', '#e67e22'),
+    ('MEDIUM', '#f39c12'),
+    ('LOW', '#27ae60'),
+)
+_CHART_BAR_WIDTH = (400 - 80) // len(_CHART_SEVERITIES)
+
+# Text templates filled in on every security / FDRS update
+_FS_SUMMARY_TEMPLATE = """FAILURES: {total_failures} total
+  • Critical: {critical_failures}
+  • High Impact: {high_impact_failures}
+  • Timeouts: {timeout_failures}
+  • Communication Errors: {comm_failures}
+
+SUCCESSES: {total_successes} total
+  • Read Operations: {read_operations}
+  • Write Operations: {write_operations}
+  • Security Operations: {security_operations}
+
+Overall Success Rate: {overall_success_rate:.1f}%"""
+
+_FDRS_WELCOME = """🔧 FDRS (Ford Diagnostic and Repair System) Analysis
+
+This tab provides specialized analysis for Ford diagnostic logs including:
+
+🏗️ System Information:
+• FDRS version and dependency tracking
+• FDSP server connection status
+• Module dependency analysis
+
+📡 UDS Communication Analysis:
+• Diagnostic service breakdown (Read DID, Security Access, etc.)
+• Success/failure rates
+• Communication timing analysis
+
+⚠️ Error Analysis:
+• NRC (Negative Response Code) detailed explanations
+• Request Out of Range (NRC 31) specific guidance
+• Security access issue identification
+
+💡 Smart Recommendations:
+• Troubleshooting steps for common issues
+• DID compatibility checks
+• ECU session requirements
+
+📋 To get started:
+1. Load a FDRS log file (text format)
+2. Click 'Parse Log' to begin analysis
+3. Review the detailed breakdown in each tab
+
+Supported formats:
+✅ FDRS text logs with system information
+✅ UDS diagnostic communications
+✅ ISO15765 CAN frame data
+✅ NRC error responses
+"""
+
+_FDRS_SYSTEM_TEMPLATE = """🔧 FDRS System Information
+────────────────────────────────
+Version: {version}
+Server: {server}
+Dependency Modules: {dependency_count}
+
+📦 Key Dependencies:
+"""
+
+_FDRS_COMM_TEMPLATE = """📡 UDS Communication Analysis
+────────────────────────────────
+Latest Communication:
+  Service: {service}
+  Status: {status}
+  Time: {timestamp}
+  Error: {nrc_error}
+
+Read DID (0x22) Analysis:
+  Total Attempts: {total_attempts}
+  Failed Attempts: {failed_attempts}
+  Success Rate: {success_rate:.1f}%
+"""
+
+_FDRS_BEST_PRACTICES = ("\n" + "─" * 50 + "\n\n"
+                        "📋 General FDRS Best Practices:\n\n"
+                        "• Ensure stable 12V power supply during diagnostics\n"
+                        "• Verify ECU is in proper diagnostic session\n"
+                        "• Check CAN bus communication quality\n"
+                        "• Use appropriate security access credentials\n"
+                        "• Allow sufficient time delays between operations\n")
+
+# Quick line classification of the chunked text parser: substring alternations per
+# severity (in priority order) and timestamp formats (most specific first)
+_PERF_SEVERITY_WORDS = (
+    ('ERROR', ('error', 'critical', 'fatal', 'exception')),
+    ('WARNING', ('warning', 'warn', 'caution')),
+    ('SUCCESS', ('success', 'pass', 'ok', 'complete')),
+)
+_PERF_SEVERITY_PATTERNS = tuple((re.compile('|'.join(words)), severity)
+                                for severity, words in _PERF_SEVERITY_WORDS)
+_PERF_SEVERITY_NAMES = tuple(severity for severity, _ in _PERF_SEVERITY_WORDS) + ('INFO',)
+_PERF_DATETIME_PATTERNS = (
+    re.compile(r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}'),
+    re.compile(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}'),
+)
+_PERF_TIME_RX = re.compile(r'\d{2}:\d{2}:\d{2}')
+
+# Text export: lines fetched from the results widget per call, and file write buffer size
+_EXPORT_LINES_PER_BLOCK = 2000
+_EXPORT_BUFFER_SIZE = 1 << 17
+
+# Service count above which the FDRS services tab only renders the visible lines
+_VIRTUAL_SERVICES_THRESHOLD = 500
+
+# Chunked text parsing: never below the former fixed 1000-line chunks; from ~125 MB up,
+# one line per 128 KiB keeps the chunk count (progress updates and their 1 ms yields)
+# roughly constant as files grow
+_CHUNK_LINES_MIN = 1000
+_CHUNK_LINES_MAX = 8000
+_CHUNK_BYTES_PER_LINE = 128 * 1024
+
+# Longest wait on exit for log sessions still queued for the database writer
+_DB_WRITER_JOIN_TIMEOUT = 5.0
+
+# Quiet period after the last keystroke before smart filter suggestions are refreshed
+_SUGGESTION_DEBOUNCE_MS = 150
+_SUGGESTION_CACHE_SIZE = 32
+
+# Listbox foreground per suggestion type; other types keep the listbox's own color
+_SUGGESTION_COLORS = {
+    'preset': '#3498db',
+    'service': '#9b59b6',
+    'nrc': '#e67e22',
+    'learned': '#2ecc71',
+    'history': '#95a5a6'
+}
+
+# Keyword separators in the smart filter entry besides whitespace
+_KEYWORD_SEPARATORS = str.maketrans({',': ' ', ';': ' '})
+
+# Hover time before a smart filter preset shows its description
+_TOOLTIP_DELAY_MS = 500
+
+# Severity levels the advanced filter panel can switch off
+_ADVANCED_FILTER_SEVERITIES = frozenset(('CRITICAL', 'ERROR', 'WARNING', 'INFO'))
+
+# The professional analyzer ships next to this module
+_PROFESSIONAL_ANALYZER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                           "professional_diagnostic_analyzer.py")
 
 
 class EnhancedLogParserGUI:
@@ -62,6 +505,21 @@ class EnhancedLogParserGUI:
         self.config = ConfigManager()
         self.db = DatabaseManager()
         
+        # Log sessions are persisted by a single writer thread so the UI never
+        # waits on the database and only one thread ever writes to it
+        self._db_writer_queue = queue.Queue()
+        self._db_writer_closing = False  # Set on exit - stored sessions are no longer reported
+        self._db_writer_thread = threading.Thread(target=self._db_writer_loop, name="db-writer",
+                                                  daemon=True)
+        self._db_writer_thread.start()
+        
+        # Parses run one at a time on a persistent worker; a newer request
+        # supersedes queued or running ones (checked between parse stages)
+        self._parse_queue = queue.Queue()
+        self._parse_generation = 0
+        self._cache_hit_key = None  # Parse cache key of the latest request if it was a cache hit
+        threading.Thread(target=self._parse_worker_loop, daemon=True).start()
+        
         # Initialize performance manager
         self.performance = PerformanceManager()
         self.performance.set_progress_callback(self._on_progress_update)
@@ -95,6 +553,8 @@ class EnhancedLogParserGUI:
         
         # State variables
         self.current_results = []
+        self._results_lowered = ()  # str(r).lower() of each result, parallel to the results list
+        self._results_lowered_source = None
         self.current_file_type = None
         self.current_filepath = None
         self.dependency_report = None  # Store dependency analysis results
@@ -102,6 +562,33 @@ class EnhancedLogParserGUI:
         self.enhanced_diagnostics = None  # Store enhanced diagnostic analysis (voltage, SOC, temp, etc.)
         self.critical_diagnostics = None  # Store critical diagnostic view (VIN, voltage, DTCs, errors, etc.)
         self.active_filter_keywords = []  # Currently active filter keywords
+        self._all_results = []  # Unfiltered results of the current log, advanced filters select from these
+        self._main_buttons_cache = None  # (number of built tabs, main window buttons)
+        self._smart_filter_panel = None  # SmartFilterPanel, reused across opens
+        self._filter_keywords_cache = None  # (filter entry string, keywords split from it)
+        self._crit_report_cache = None  # (critical_diagnostics, formatted report text)
+        self._crit_window_cache = None  # (critical_diagnostics, classified report window lines)
+        self._dependency_lines_cache = None  # (dependency_report, classified dependency report lines)
+        self._services_view = None  # VirtualTextView over the FDRS services tab for long service lists
+        self._chart_items = None  # Severity chart canvas item ids, created on first draw
+        self._dependency_tracker = None  # Shared ModuleDependencyTracker, created on first use
+        self._critical_analyzer = None  # Shared CriticalDiagnosticView, created on first use
+        self._shown_security_report = None  # security_report the Cybersecurity cards were built from
+        self._shown_fdrs = None  # (fdrs_analysis, fdrs_detailed) the FDRS tab was built from
+        self._fdrs_placeholders_shown = False  # FDRS views hold the welcome/no-data text
+        self._fdrs_dirty = set()  # FDRS detail sub-tabs (frame names) not yet rendered for this analysis
+        self._threat_card_pool = []  # Reusable threat card widgets of the Cybersecurity tab
+        self._pending_renders = set()  # Views with a display already queued for the next idle cycle
+        self._simple_report_cache = None  # (report inputs, simple report text)
+        self._results_version = 0  # Bumped whenever current_results or its analysis reports change
+        self._display_cache = OrderedDict()  # (version, mode, primary) -> (segments, summary cards)
+        self._display_cache_size = 4
+        self._shown_segments = ()  # Segments of the last results render (the unfiltered view)
+        self._raw_results_text = None  # Their joined text, built when a smart filter needs it
+        
+        # Parsed results of recently opened files, keyed by content hash (LRU)
+        self._parse_cache = OrderedDict()
+        self._parse_cache_size = 16
         
         # Apply theme
         self._apply_theme()
@@ -301,9 +788,7 @@ class EnhancedLogParserGUI:
         nrc7f_count = 0
         nrc22_count = 0
         
-        for result in self.current_results:
-            result_str = str(result)
-            result_lower = result_str.lower()
+        for result, result_lower in zip(self.current_results, self._lowered_for(self.current_results)):
             
             # Check for NRC 7F patterns
             if any(pattern in result_lower for pattern in [
@@ -379,8 +864,8 @@ class EnhancedLogParserGUI:
         
         # Analyze complexity indicators
         total_results = len(self.current_results)
-        error_count = sum(1 for r in self.current_results if 
-                         'error' in str(r).lower() or 'fail' in str(r).lower())
+        results_lowered = self._lowered_for(self.current_results)
+        error_count = sum(1 for r in results_lowered if 'error' in r or 'fail' in r)
         
         critical_indicators = 0
         
@@ -396,15 +881,14 @@ class EnhancedLogParserGUI:
             critical_indicators += 2
         
         # Check for multiple modules/ECUs
-        content_str = ' '.join(str(r) for r in self.current_results)
+        content_str = ' '.join(results_lowered)
         ecu_patterns = ['7d0', '7e0', '726', '716', '720', '754', 'bcm', 'pcm', 'apim', 'tcm']
-        detected_ecus = sum(1 for pattern in ecu_patterns if pattern in content_str.lower())
+        detected_ecus = sum(1 for pattern in ecu_patterns if pattern in content_str)
         if detected_ecus > 3:
             critical_indicators += 1
         
         # Check success rate
-        success_count = sum(1 for r in self.current_results if 
-                           'success' in str(r).lower() or 'pass' in str(r).lower())
+        success_count = sum(1 for r in results_lowered if 'success' in r or 'pass' in r)
         if total_results > 0:
             success_rate = success_count / total_results
             if success_rate < 0.3:  # Less than 30% success
@@ -758,7 +1242,7 @@ NRC 22 means "Conditions Not Correct" or "Request Sequence Error"
             ("📋 Copy All Issues", lambda: self._copy_nrc7f_issues()),
             ("💾 Save Troubleshooting Report", lambda: self._save_nrc7f_report()),
             ("📧 Email Support Info", lambda: self._prepare_support_email()),
-            ("🔄 Re-analyze Log", lambda: (detail_window.destroy(), self._parse_log()))
+            ("🔄 Re-analyze Log", lambda: (detail_window.destroy(), self._parse_log(use_cache=False)))
         ]
         
         for i, (text, command) in enumerate(action_buttons):
@@ -1101,32 +1585,42 @@ Best regards,
         self.notebook = ttk.Notebook(main_frame)
         self.notebook.grid(row=6, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), pady=5)
         
-        # 1. Results tab
+        # 1. Results tab - the only tab built eagerly, it is visible at startup
         self._create_results_tab()
         
-        # 2. Analytics tab (NEW)
-        self._create_analytics_tab()
-        
-        # 3. Comparison tab (NEW)
-        self._create_comparison_tab()
-        
-        # 4. History tab (NEW)
-        self._create_history_tab()
-        
-        # 5. Dependencies tab (NEW)
-        self._create_dependencies_tab()
-        
-        # 6. Cybersecurity tab (NEW)
-        self._create_cybersecurity_tab()
-        
-        # 7. FDRS Analysis tab (NEW)
-        self._create_fdrs_tab()
-        
-        # 8. Hex Decoder tab
-        self._create_hex_tab()
+        # 2-9. Remaining tabs get an empty frame now; their bodies are built
+        # the first time the tab is selected (see _on_tab_changed)
+        self._tab_builders = {
+            'analytics': (self._create_analytics_tab_body, None),
+            'comparison': (self._create_comparison_tab_body, None),
+            'history': (self._create_history_tab_body, None),
+            'dependencies': (self._create_dependencies_tab_body, self._display_dependencies),
+            'cybersecurity': (self._create_cybersecurity_tab_body, self._display_security),
+            'fdrs': (self._create_fdrs_tab_body, self._display_fdrs),
+            'hex': (self._create_hex_tab_body, None),
+            'nrc': (self._create_nrc_tab_body, None),
+        }
+        self._tab_built = set()
+        self._tab_frames = {}
+        self._tab_keys = {}
+        
+        lazy_tabs = [
+            ('analytics', "📈 Analytics"),
+            ('comparison', "🔀 Compare"),
+            ('history', "📚 History"),
+            ('dependencies', "🔗 Dependencies"),
+            ('cybersecurity', "🔒 Cybersecurity"),
+            ('fdrs', "🔧 FDRS Analysis"),
+            ('hex', "🔢 Hex Decoder"),
+            ('nrc', "⚠️ NRC Decoder"),
+        ]
+        for key, title in lazy_tabs:
+            frame = ttk.Frame(self.notebook)
+            self.notebook.add(frame, text=title)
+            self._tab_frames[key] = frame
+            self._tab_keys[str(frame)] = key
         
-        # 9. NRC Decoder tab
-        self._create_nrc_tab()
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
         
         # Status bar with enhanced styling
         self.status = tk.StringVar(value="Ready - Drag & drop log files or use File > Open")
@@ -1186,10 +1680,26 @@ Best regards,
         # Configure color tags for results display
         self._configure_text_tags()
     
-    def _create_analytics_tab(self):
+    def _on_tab_changed(self, event=None):
+        """Build a deferred tab body the first time the tab is selected"""
+        key = self._tab_keys.get(self.notebook.select())
+        if key:
+            self._ensure_tab_built(key)
+    
+    def _ensure_tab_built(self, key):
+        """Construct the widgets of a lazily created tab if not done yet"""
+        if key in self._tab_built:
+            return
+        builder, refresher = self._tab_builders[key]
+        self._tab_built.add(key)
+        builder(self._tab_frames[key])
+        
+        # Tab was hidden while a log was analyzed - render what it missed
+        if refresher and self.current_results:
+            refresher()
+    
+    def _create_analytics_tab_body(self, analytics_frame):
         """Create analytics/charts tab"""
-        analytics_frame = ttk.Frame(self.notebook)
-        self.notebook.add(analytics_frame, text="📈 Analytics")
         
         analytics_frame.columnconfigure(0, weight=1)
         analytics_frame.rowconfigure(0, weight=1)
@@ -1204,10 +1714,8 @@ Best regards,
                                    foreground='red')
             error_label.grid(row=0, column=0, padx=20, pady=20)
     
-    def _create_comparison_tab(self):
+    def _create_comparison_tab_body(self, comparison_frame):
         """Create log comparison tab"""
-        comparison_frame = ttk.Frame(self.notebook)
-        self.notebook.add(comparison_frame, text="🔀 Compare")
         
         comparison_frame.columnconfigure(0, weight=1)
         comparison_frame.columnconfigure(1, weight=1)
@@ -1262,10 +1770,8 @@ Best regards,
         )
         self.compare_right.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
     
-    def _create_history_tab(self):
+    def _create_history_tab_body(self, history_frame):
         """Create database history tab"""
-        history_frame = ttk.Frame(self.notebook)
-        self.notebook.add(history_frame, text="📚 History")
         
         history_frame.columnconfigure(0, weight=1)
         history_frame.rowconfigure(1, weight=1)
@@ -1323,10 +1829,8 @@ Best regards,
         # Load initial history
         self._refresh_history()
     
-    def _create_dependencies_tab(self):
+    def _create_dependencies_tab_body(self, dep_frame):
         """Create module dependencies tab"""
-        dep_frame = ttk.Frame(self.notebook)
-        self.notebook.add(dep_frame, text="🔗 Dependencies")
         
         dep_frame.columnconfigure(0, weight=1)
         dep_frame.rowconfigure(1, weight=1)
@@ -1339,7 +1843,8 @@ Best regards,
         self.dependencies_text = scrolledtext.ScrolledText(
             dep_frame, wrap=tk.WORD, width=120, height=30,
             bg=self.colors['text_bg'], fg=self.colors['text_fg'],
-            font=('Courier New', 9)
+            font=('Courier New', 9),
+            undo=False, autoseparators=False, maxundo=0
         )
         self.dependencies_text.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), padx=10, pady=5)
         
@@ -1352,18 +1857,19 @@ Best regards,
         self.dependencies_text.tag_config("info", foreground="#B0B0B0")
         
         # Initial message
-        self.dependencies_text.insert(tk.END, "Parse a log file to see module dependency analysis.\n\n", "info")
-        self.dependencies_text.insert(tk.END, "This feature helps identify:\n", "header")
-        self.dependencies_text.insert(tk.END, "  • Which modules communicated during update/programming\n", "info")
-        self.dependencies_text.insert(tk.END, "  • Missing dependency modules that may cause failures\n", "info")
-        self.dependencies_text.insert(tk.END, "  • Communication success/failure patterns\n", "info")
-        self.dependencies_text.insert(tk.END, "  • Recommendations for resolving dependency issues\n", "info")
+        self.dependencies_text.insert(
+            '1.0',
+            "Parse a log file to see module dependency analysis.\n\n", "info",
+            "This feature helps identify:\n", "header",
+            "  • Which modules communicated during update/programming\n"
+            "  • Missing dependency modules that may cause failures\n"
+            "  • Communication success/failure patterns\n"
+            "  • Recommendations for resolving dependency issues\n", "info"
+        )
         self.dependencies_text.config(state=tk.DISABLED)
     
-    def _create_cybersecurity_tab(self):
+    def _create_cybersecurity_tab_body(self, security_frame):
         """Create cybersecurity analysis tab with modern card-based layout"""
-        security_frame = ttk.Frame(self.notebook)
-        self.notebook.add(security_frame, text="🔒 Cybersecurity")
         
         security_frame.columnconfigure(0, weight=1)
         security_frame.rowconfigure(2, weight=1)
@@ -1414,10 +1920,8 @@ Best regards,
         modules_frame = ttk.LabelFrame(info_frame, text="🎯 Affected Modules", padding=10)
         modules_frame.grid(row=0, column=1, sticky=(tk.W, tk.E, tk.N, tk.S), padx=5)
         
-        self.modules_text = tk.Text(modules_frame, height=5, wrap=tk.WORD, 
-                                     bg=self.colors['text_bg'], fg=self.colors['text_fg'],
-                                     font=('Arial', 10), relief=tk.FLAT)
-        self.modules_text.pack(fill=tk.BOTH, expand=True)
+        self.modules_tree = ttk.Treeview(modules_frame, show='tree', height=5, selectmode='none')
+        self.modules_tree.pack(fill=tk.BOTH, expand=True)
         
         # Threats list with scrollable cards
         threats_frame = ttk.LabelFrame(security_frame, text="� Security Threats", padding=10)
@@ -1477,24 +1981,15 @@ Best regards,
             ("🟢", "LOW", "Low risk - Diagnostic anomalies or informational security events", "#27ae60")
         ]
         
+        # One Treeview row per level instead of a frame/label stack per card
+        lvl_tree = ttk.Treeview(welcome_card, columns=('desc',), show='tree',
+                                height=len(severity_info), selectmode='none')
+        lvl_tree.column('#0', width=120, stretch=False)
+        lvl_tree.column('desc', width=500)
         for icon, level, description, color in severity_info:
-            level_frame = tk.Frame(welcome_card, bg='white', relief=tk.RIDGE, borderwidth=1)
-            level_frame.pack(fill=tk.X, padx=20, pady=3)
-            
-            icon_label = tk.Label(level_frame, text=icon, font=('Segoe UI Emoji', 14), 
-                                 bg='white', fg=color, width=3)
-            icon_label.pack(side=tk.LEFT, padx=5)
-            
-            text_frame = tk.Frame(level_frame, bg='white')
-            text_frame.pack(side=tk.LEFT, fill=tk.X, expand=True, pady=5, padx=5)
-            
-            level_label = tk.Label(text_frame, text=level, font=('Arial', 10, 'bold'), 
-                                  bg='white', fg=color, anchor=tk.W)
-            level_label.pack(anchor=tk.W)
-            
-            desc_label = tk.Label(text_frame, text=description, font=('Arial', 9), 
-                                 bg='white', fg='#34495e', anchor=tk.W, wraplength=550, justify=tk.LEFT)
-            desc_label.pack(anchor=tk.W)
+            lvl_tree.insert('', tk.END, text=f"{icon} {level}", values=(description,), tags=(level,))
+            lvl_tree.tag_configure(level, foreground=color)
+        lvl_tree.pack(fill=tk.X, padx=20, pady=3)
         
         separator2 = tk.Frame(welcome_card, height=2, bg='#bdc3c7')
         separator2.pack(fill=tk.X, padx=20, pady=10)
@@ -1514,26 +2009,19 @@ Best regards,
             ("🚫", "Potential denial-of-service patterns")
         ]
         
+        features_tree = ttk.Treeview(welcome_card, show='tree',
+                                     height=len(features), selectmode='none')
+        features_tree.column('#0', width=620)
         for icon, text in features:
-            feature_frame = tk.Frame(welcome_card, bg='#ecf0f1')
-            feature_frame.pack(fill=tk.X, padx=30, pady=2)
-            
-            icon_label = tk.Label(feature_frame, text=icon, font=('Segoe UI Emoji', 11), 
-                                 bg='#ecf0f1', width=3)
-            icon_label.pack(side=tk.LEFT)
-            
-            text_label = tk.Label(feature_frame, text=text, font=('Arial', 10), 
-                                 bg='#ecf0f1', fg='#34495e', anchor=tk.W)
-            text_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
+            features_tree.insert('', tk.END, text=f"{icon}  {text}")
+        features_tree.pack(fill=tk.X, padx=30, pady=2)
         
         instruction = tk.Label(welcome_card, text="Click 'Parse Log' to begin security analysis", 
                               font=('Arial', 11, 'italic'), bg='#ecf0f1', fg='#7f8c8d')
         instruction.pack(pady=(15, 20))
     
-    def _create_fdrs_tab(self):
+    def _create_fdrs_tab_body(self, fdrs_frame):
         """Create FDRS (Ford Diagnostic and Repair System) analysis tab"""
-        fdrs_frame = ttk.Frame(self.notebook)
-        self.notebook.add(fdrs_frame, text="🔧 FDRS Analysis")
         
         fdrs_frame.columnconfigure(0, weight=1)
         fdrs_frame.rowconfigure(2, weight=1)
@@ -1579,7 +2067,8 @@ Best regards,
         self.fdrs_system_text = scrolledtext.ScrolledText(
             system_frame, height=8, wrap=tk.WORD,
             bg=self.colors['text_bg'], fg=self.colors['text_fg'],
-            font=('Consolas', 10), relief=tk.FLAT
+            font=('Consolas', 10), relief=tk.FLAT,
+            undo=False, autoseparators=False, maxundo=0
         )
         self.fdrs_system_text.pack(fill=tk.BOTH, expand=True)
         
@@ -1590,7 +2079,8 @@ Best regards,
         self.fdrs_comm_text = scrolledtext.ScrolledText(
             comm_frame, height=8, wrap=tk.WORD,
             bg=self.colors['text_bg'], fg=self.colors['text_fg'],
-            font=('Consolas', 10), relief=tk.FLAT
+            font=('Consolas', 10), relief=tk.FLAT,
+            undo=False, autoseparators=False, maxundo=0
         )
         self.fdrs_comm_text.pack(fill=tk.BOTH, expand=True)
         
@@ -1609,7 +2099,8 @@ Best regards,
         self.fdrs_services_text = scrolledtext.ScrolledText(
             services_frame, wrap=tk.WORD,
             bg=self.colors['text_bg'], fg=self.colors['text_fg'],
-            font=('Consolas', 9), relief=tk.FLAT
+            font=('Consolas', 9), relief=tk.FLAT,
+            undo=False, autoseparators=False, maxundo=0
         )
         self.fdrs_services_text.pack(fill=tk.BOTH, expand=True)
         
@@ -1620,7 +2111,8 @@ Best regards,
         self.fdrs_errors_text = scrolledtext.ScrolledText(
             errors_frame, wrap=tk.WORD,
             bg=self.colors['text_bg'], fg=self.colors['text_fg'],
-            font=('Consolas', 9), relief=tk.FLAT
+            font=('Consolas', 9), relief=tk.FLAT,
+            undo=False, autoseparators=False, maxundo=0
         )
         self.fdrs_errors_text.pack(fill=tk.BOTH, expand=True)
         
@@ -1631,58 +2123,29 @@ Best regards,
         self.fdrs_recommendations_text = scrolledtext.ScrolledText(
             recommendations_frame, wrap=tk.WORD,
             bg=self.colors['text_bg'], fg=self.colors['text_fg'],
-            font=('Arial', 10), relief=tk.FLAT
+            font=('Arial', 10), relief=tk.FLAT,
+            undo=False, autoseparators=False, maxundo=0
         )
         self.fdrs_recommendations_text.pack(fill=tk.BOTH, expand=True)
         
+        # Detail sub-tabs are filled in when first shown after an analysis
+        self._fdrs_subtab_updaters = {
+            str(services_frame): self._update_fdrs_services_tab,
+            str(errors_frame): self._update_fdrs_errors_tab,
+            str(recommendations_frame): self._update_fdrs_recommendations_tab,
+        }
+        self.fdrs_notebook.bind('<<NotebookTabChanged>>', self._on_fdrs_tab_changed)
+        
         # Initialize with welcome message
         self._initialize_fdrs_welcome()
     
     def _initialize_fdrs_welcome(self):
         """Initialize FDRS tab with welcome message"""
-        welcome_msg = """🔧 FDRS (Ford Diagnostic and Repair System) Analysis
-
-This tab provides specialized analysis for Ford diagnostic logs including:
-
-🏗️ System Information:
-• FDRS version and dependency tracking
-• FDSP server connection status
-• Module dependency analysis
-
-📡 UDS Communication Analysis:
-• Diagnostic service breakdown (Read DID, Security Access, etc.)
-• Success/failure rates
-• Communication timing analysis
-
-⚠️ Error Analysis:
-• NRC (Negative Response Code) detailed explanations
-• Request Out of Range (NRC 31) specific guidance
-• Security access issue identification
-
-💡 Smart Recommendations:
-• Troubleshooting steps for common issues
-• DID compatibility checks
-• ECU session requirements
-
-📋 To get started:
-1. Load a FDRS log file (text format)
-2. Click 'Parse Log' to begin analysis
-3. Review the detailed breakdown in each tab
-
-Supported formats:
-✅ FDRS text logs with system information
-✅ UDS diagnostic communications
-✅ ISO15765 CAN frame data
-✅ NRC error responses
-"""
-        
-        self.fdrs_system_text.insert("1.0", welcome_msg)
+        self.fdrs_system_text.insert("1.0", _FDRS_WELCOME)
         self.fdrs_system_text.config(state=tk.DISABLED)
     
-    def _create_hex_tab(self):
+    def _create_hex_tab_body(self, hex_frame):
         """Create hex decoder tab"""
-        hex_frame = ttk.Frame(self.notebook)
-        self.notebook.add(hex_frame, text="🔢 Hex Decoder")
         
         hex_frame.columnconfigure(0, weight=1)
         hex_frame.rowconfigure(3, weight=1)
@@ -1698,10 +2161,8 @@ Supported formats:
         )
         self.hex_output.grid(row=3, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), padx=10, pady=5)
     
-    def _create_nrc_tab(self):
+    def _create_nrc_tab_body(self, nrc_frame):
         """Create NRC decoder tab"""
-        nrc_frame = ttk.Frame(self.notebook)
-        self.notebook.add(nrc_frame, text="⚠️ NRC Decoder")
         
         nrc_frame.columnconfigure(0, weight=1)
         nrc_frame.rowconfigure(3, weight=1)
@@ -1721,12 +2182,13 @@ Supported formats:
         ttk.Label(nrc_frame, text="Common NRC Codes Reference:", font=('Arial', 10, 'bold')).grid(row=4, column=0, sticky=tk.W, padx=10, pady=5)
         nrc_ref = scrolledtext.ScrolledText(
             nrc_frame, wrap=tk.WORD, width=100, height=10,
-            bg=self.colors['text_bg'], fg=self.colors['text_fg']
+            bg=self.colors['text_bg'], fg=self.colors['text_fg'],
+            undo=False, autoseparators=False, maxundo=0
         )
         nrc_ref.grid(row=5, column=0, sticky=(tk.W, tk.E), padx=10, pady=5)
         
-        for code, description in NRCCodeExplainer.NRC_CODES.items():
-            nrc_ref.insert(tk.END, f"{code}: {description}\n")
+        nrc_ref.insert('1.0', "".join(f"{code}: {description}\n"
+                                      for code, description in NRCCodeExplainer.NRC_CODES.items()))
         nrc_ref.config(state=tk.DISABLED)
     
     def _configure_text_tags(self):
@@ -1912,7 +2374,90 @@ Supported formats:
             self.progress_bar.stop()
             self.progress_frame.grid_remove()
     
-    def _parse_log(self):
+    def _correlate_logs(self):
+        """Correlate all logs in the workspace"""
+        try:
+            # Show progress (improvement #5)
+            self._show_progress("Correlating logs...")
+            
+            # Placeholder for correlation logic
+            self.results_text.insert(tk.END, "🔗 Cross-Correlation Analysis\n", "heading")
+            self.results_text.insert(tk.END, "=" * 50 + "\n\n", "normal")
+            self.results_text.insert(tk.END, "This feature will correlate multiple log files\n", "info")
+            self.results_text.insert(tk.END, "to identify patterns and relationships.\n\n", "info")
+            
+            self._hide_progress()
+            self.status.set("Log correlation completed")
+            
+        except Exception as e:
+            self._hide_progress()
+            self.status.set(f"Error correlating logs: {str(e)}")
+    
+    def _test_sample_data(self):
+        """Load and analyze sample diagnostic data"""
+        try:
+            # Show progress (improvement #5)
+            self._show_progress("Loading sample data...")
+            
+            # Placeholder for test sample logic
+            self.results_text.insert(tk.END, "🧪 Sample Data Analysis\n", "heading")
+            self.results_text.insert(tk.END, "=" * 50 + "\n\n", "normal")
+            self.results_text.insert(tk.END, "Sample diagnostic data loaded successfully.\n", "success")
+            self.results_text.insert(tk.END, "This demonstrates the analysis capabilities.\n\n", "info")
+            
+            self._hide_progress()
+            self.status.set("Sample data analysis completed")
+            
+        except Exception as e:
+            self._hide_progress()
+            self.status.set(f"Error loading sample data: {str(e)}")
+    
+    def _show_progress(self, message):
+        """Show progress indicator (improvement #5)"""
+        self.progress_label.config(text=message)
+        self.progress_frame.grid()
+        self.progress_bar.start(10)
+        
+        # Disable action buttons to prevent double-clicks
+        self._set_buttons_state('disabled')
+        
+        self.root.update_idletasks()
+    
+    def _hide_progress(self):
+        """Hide progress indicator (improvement #5)"""
+        self.progress_frame.grid_remove()
+        self.progress_bar.stop()
+        
+        # Re-enable action buttons
+        self._set_buttons_state('normal')
+    
+    def _set_buttons_state(self, state):
+        """Set the state of every button in the main window"""
+        for button in self._main_window_buttons():
+            try:
+                button.config(state=state)
+            except tk.TclError:
+                pass  # Destroyed since the list was collected
+    
+    def _main_window_buttons(self):
+        """Flat list of the main window's buttons
+        
+        Collected by one walk of the widget tree, repeated only after another lazy tab
+        has been built (the only time buttons are added to the main window).
+        """
+        cached = self._main_buttons_cache
+        if cached is None or cached[0] != len(self._tab_built):
+            buttons = []
+            pending = list(self.root.winfo_children())
+            while pending:
+                widget = pending.pop()
+                if isinstance(widget, (ttk.Button, tk.Button)):
+                    buttons.append(widget)
+                pending.extend(widget.winfo_children())
+            cached = self._main_buttons_cache = (len(self._tab_built), buttons)
+        return cached[1]
+    
+    def _parse_log(self, use_cache=True):
         """Parse the selected log file"""
         # Use current_filepath if available (for pasted content), otherwise use file_path
         if self.current_filepath:
@@ -1928,29 +2473,141 @@ Supported formats:
             messagebox.showerror("File Not Found", f"File not found: {filepath}")
             return
         
+        # Reopening a log we already analyzed - skip straight to rendering
+        cache_key = self._parse_cache_key(filepath)
+        if use_cache and cache_key and cache_key in self._parse_cache:
+            self._parse_cache.move_to_end(cache_key)
+            # A parse still running for an earlier request must not overwrite these results
+            self._parse_generation += 1
+            self._cache_hit_key = cache_key
+            self._hide_progress_dialog()
+            self._show_progress_indicator(False)
+            self._render_results(self._parse_cache[cache_key])
+            return
+        
         # Show progress indication immediately
         self.status.set("🔍 Analyzing log file...")
         self._show_progress_indicator(True)
         self.root.update()
         
-        # Parse in background thread
-        thread = threading.Thread(target=self._parse_in_background, args=(filepath,))
-        thread.daemon = True
-        thread.start()
+        # Parse on the background worker
+        self._parse_generation += 1
+        self._cache_hit_key = None
+        self._parse_queue.put((filepath, cache_key, self._parse_generation))
     
-    def _parse_in_background(self, filepath):
-        """Enhanced parsing with performance monitoring and progress tracking"""
+    def _parse_worker_loop(self):
+        """Run queued parse jobs one at a time (runs on the parse worker thread)"""
+        while True:
+            filepath, cache_key, generation = self._parse_queue.get()
+            if generation != self._parse_generation:
+                continue  # A newer parse was requested before this one started
+            self._parse_in_background(filepath, cache_key, generation)
+    
+    def _on_parse_superseded(self, overwrote_results):
+        """Clean up after a parse that a newer request overtook
+        
+        A newer parse takes over the progress UI and renders its own results. After a
+        cache hit nothing else will hide the stale parse's progress UI, and what it already
+        stored before noticing (always the file type, possibly the results and reports) is
+        replaced by the cached analysis again.
+        """
+        if self._cache_hit_key is None:
+            return
+        self._hide_progress_dialog()
+        self._show_progress_indicator(False)
+        
+        cached = self._parse_cache.get(self._cache_hit_key)
+        if cached is None:
+            return
+        if overwrote_results:
+            self._render_results(cached)
+        else:
+            self.current_file_type = cached['file_type']
+    
+    def _parse_cache_key(self, filepath):
+        """Build the parse cache key: hash of the first 1 MiB + file size + active filters"""
         try:
-            # Get file information for performance planning
-            file_info = self.performance.get_file_info(filepath)
-            
-            # Show progress dialog for large files
-            if file_info.get('size_mb', 0) > 5:  # Show progress for files > 5MB
-                self.root.after(0, self._show_progress_dialog, f"Processing {file_info.get('size_mb', 0):.1f} MB file")
-            
-            # Detect file type and choose appropriate parsing strategy
-            if filepath.lower().endswith('.xml'):
-                self.current_file_type = 'xml'
+            with open(filepath, 'rb') as f:
+                digest = hashlib.blake2b(f.read(1 << 20), digest_size=16).hexdigest()
+            return f"{digest}:{os.path.getsize(filepath)}:{self.filters.get()}"
+        except OSError:
+            return None
+    
+    def _store_parse_cache(self, cache_key):
+        """Remember the analysis state of the current log, evicting the oldest entry"""
+        self._parse_cache[cache_key] = {
+            'results': self._all_results,
+            'file_type': self.current_file_type,
+            'dependency_report': self.dependency_report,
+            'security_report': self.security_report,
+            'enhanced_diagnostics': self.enhanced_diagnostics,
+            'critical_diagnostics': self.critical_diagnostics,
+            'fdrs_analysis': self.fdrs_analysis,
+            'fdrs_detailed': self.fdrs_detailed,
+        }
+        self._parse_cache.move_to_end(cache_key)
+        while len(self._parse_cache) > self._parse_cache_size:
+            self._parse_cache.popitem(last=False)
+    
+    def _render_results(self, cached):
+        """Restore a cached analysis and refresh all views without re-parsing"""
+        self.current_results = self._all_results = cached['results']
+        self._results_version += 1
+        self.current_file_type = cached['file_type']
+        self.dependency_report = cached['dependency_report']
+        self.security_report = cached['security_report']
+        self.enhanced_diagnostics = cached['enhanced_diagnostics']
+        self.critical_diagnostics = cached['critical_diagnostics']
+        self.fdrs_analysis = cached['fdrs_analysis']
+        self.fdrs_detailed = cached['fdrs_detailed']
+        
+        self._schedule_render('results', self._display_results)
+        self._schedule_render('dependencies', self._display_dependencies)
+        self._schedule_render('security', self._display_security)
+        self._schedule_render('fdrs', self._display_fdrs)
+        self.status.set(f"✅ Loaded {len(self.current_results)} items from cache")
+    
+    def _schedule_render(self, name, fn):
+        """Run a view's display function once the event loop is idle
+        
+        Repeated requests for the same view before then collapse into one render, which
+        reads whatever analysis is current at that point. Safe to call from the parse worker.
+        """
+        if name in self._pending_renders:
+            return
+        # Marked pending before scheduling so the idle callback can never run first
+        self._pending_renders.add(name)
+        self.root.after_idle(self._run_render, name, fn)
+    
+    def _run_render(self, name, fn):
+        self._pending_renders.discard(name)
+        fn()
+    
+    def _map_file(self, filepath):
+        """Map a file read-only; empty files (which cannot be mapped) yield b''"""
+        with open(filepath, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return b''
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    
+    def _parse_in_background(self, filepath, cache_key=None, generation=None):
+        """Enhanced parsing with performance monitoring and progress tracking"""
+        raw_bytes = b''
+        try:
+            # Get file information for performance planning
+            file_info = self.performance.get_file_info(filepath)
+            
+            # Read the file once - cybersecurity, FDRS and smart filter learning
+            # all share the same mapped bytes / decoded text
+            raw_bytes = self._map_file(filepath)
+            
+            # Show progress dialog for large files
+            if file_info.get('size_mb', 0) > 5:  # Show progress for files > 5MB
+                self.root.after(0, self._show_progress_dialog, f"Processing {file_info.get('size_mb', 0):.1f} MB file")
+            
+            # Detect file type and choose appropriate parsing strategy
+            if filepath.lower().endswith('.xml'):
+                self.current_file_type = 'xml'
                 
                 # For large XML files, use performance-enhanced parsing
                 if file_info.get('use_streaming', False):
@@ -1959,7 +2616,7 @@ Supported formats:
                     results = self.xml_parser.parse_file(filepath)
             else:
                 self.current_file_type = 'text'
-                keywords = [k.strip() for k in self.filters.get().split(',')]
+                keywords = self._filter_keywords()
                 
                 # For large text files, use chunked parsing
                 if file_info.get('use_streaming', False):
@@ -1967,154 +2624,320 @@ Supported formats:
                 else:
                     results = self.text_parser.parse_file(filepath, keywords)
             
-            self.current_results = results if results else []
+            if generation is not None and generation != self._parse_generation:
+                self.root.after(0, self._on_parse_superseded, False)
+                return  # Superseded by a newer request
+            
+            self.current_results = self._all_results = results if results else []
+            self._results_version += 1
+            self._lowered_for(self.current_results)
             
             # Update status with file info
             result_count = len(self.current_results) if self.current_results else 0
             self.root.after(0, lambda: self.status.set(f"Parsed {result_count} items from {file_info.get('size_mb', 0):.1f} MB file"))
             
-            # Generate dependency analysis
-            if DEPENDENCY_TRACKER_AVAILABLE and self.current_results:
-                self.root.after(0, lambda: self.status.set("Analyzing module dependencies..."))
-                tracker = ModuleDependencyTracker()
-                self.dependency_report = tracker.parse_log_for_dependencies(self.current_results)
-            else:
-                self.dependency_report = None
+            self.root.after(0, lambda: self.status.set("Running diagnostic analyzers..."))
+            self._run_post_parse_analyses(results, raw_bytes)
             
-            # Generate cybersecurity analysis with enhanced UDS parsing
-            if CYBERSECURITY_AVAILABLE and results:
-                security_analyzer = CybersecurityAnalyzer()
-                
-                # Try enhanced analysis with UDS parser if available
-                try:
-                    with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                        raw_content = f.read()
-                    self.security_report = security_analyzer.analyze_with_uds_parser(raw_content)
-                except Exception as e:
-                    print(f"Enhanced cybersecurity analysis failed, using basic: {e}")
-                    # Fall back to basic analysis
-                    self.security_report = security_analyzer.analyze(results)
-            else:
-                self.security_report = None
+            if generation is not None and generation != self._parse_generation:
+                self.root.after(0, self._on_parse_superseded, True)
+                return  # Superseded by a newer request
             
-            # Generate enhanced diagnostic analysis (voltage, SOC, temp, etc.)
-            if ENHANCED_DIAGNOSTICS_AVAILABLE and results:
-                diagnostic_analyzer = EnhancedDiagnosticAnalyzer()
-                self.enhanced_diagnostics = diagnostic_analyzer.analyze(results)
-            else:
-                self.enhanced_diagnostics = None
-            
-            # Generate critical diagnostic analysis (VIN, voltage, DTCs, errors, success, DID, hex/ascii)
-            if CRITICAL_DIAGNOSTICS_AVAILABLE and results:
-                critical_analyzer = CriticalDiagnosticView()
-                self.critical_diagnostics = critical_analyzer.extract_critical_diagnostics(results)
-                
-                # Ensure critical_diagnostics is always a dict or None, never False or other types
-                if not isinstance(self.critical_diagnostics, dict):
-                    print(f"Warning: Critical diagnostics returned unexpected type: {type(self.critical_diagnostics)}")
-                    self.critical_diagnostics = None
-            else:
-                self.critical_diagnostics = None
-            
-            # Generate FDRS analysis for text logs
-            if self.current_file_type == 'text':
-                try:
-                    with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
-                    
-                    # Check if this looks like an FDRS log
-                    if '[SYSTEM]' in content and 'fdrsVersion' in content:
-                        fdrs_parser = FDRSLogParser()
-                        self.fdrs_analysis = fdrs_parser.parse_log_text(content)
-                        # Also get detailed analysis
-                        self.fdrs_detailed = fdrs_parser.get_detailed_analysis()
-                    else:
-                        self.fdrs_analysis = None
-                        self.fdrs_detailed = None
-                except Exception as e:
-                    print(f"FDRS analysis error: {e}")
-                    self.fdrs_analysis = None
-                    self.fdrs_detailed = None
-            else:
-                self.fdrs_analysis = None
-                self.fdrs_detailed = None
-            
-            # Let smart filter learn from content
-            if SMART_FILTER_AVAILABLE and self.smart_filter:
-                try:
-                    with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
-                        self.smart_filter.learn_from_content(content)
-                except Exception as e:
-                    pass  # Silent failure for learning
-            
-            # Store in database
-            summary = self._calculate_summary(results)
+            # Store in database - summary and simple report are computed on exactly the
+            # inputs _display_simple_results uses, so the display reuses both memoized
+            # results instead of classifying and generating the report a second time
+            summary = self._calculate_summary(self.current_results)
             root_cause = None
             
             if self.simple_mode.get():
                 # Pass FDRS analysis if available for better module detection
                 fdrs_data = getattr(self, 'fdrs_analysis', None)
                 manual_primary = self._get_manual_primary_module()
-                report = self.report_generator.generate_simple_report(results, self.current_file_type, fdrs_data, manual_primary)
+                report = self._simple_report(self.current_results, self.current_file_type, fdrs_data, manual_primary)
                 if 'root_cause_analysis' in report:
                     root_cause = report['root_cause_analysis']
             
-            log_id = self.db.store_log_session(
-                os.path.basename(filepath),
-                filepath,
-                self.current_file_type,
-                results,
-                summary,
-                root_cause
-            )
+            if cache_key:
+                self.root.after(0, self._store_parse_cache, cache_key)
+            
+            # Renders made while the analyzers ran (mode toggle, primary module change)
+            # were cached without their reports - make sure none of them is replayed
+            self._results_version += 1
             
             # Update display
-            self.root.after(0, self._display_results)
-            self.root.after(0, self._display_dependencies)
-            self.root.after(0, self._display_security)
-            self.root.after(0, self._display_fdrs)
-            self.root.after(0, lambda: self.status.set(f"✅ Parsed {len(results)} items successfully (Log ID: {log_id})"))
+            self._schedule_render('results', self._display_results)
+            self._schedule_render('dependencies', self._display_dependencies)
+            self._schedule_render('security', self._display_security)
+            self._schedule_render('fdrs', self._display_fdrs)
+            self.root.after(0, lambda: self.status.set(f"✅ Parsed {len(results)} items successfully"))
             
             # Hide progress indicators
             self.root.after(0, self._hide_progress_dialog)
             self.root.after(0, lambda: self._show_progress_indicator(False))
             
-            # Refresh charts if on analytics tab
-            if hasattr(self, 'charts_panel'):
-                self.root.after(0, self.charts_panel.refresh_charts)
+            # Persist in the background, the log ID is shown once it is stored
+            self._db_writer_queue.put({
+                'filename': os.path.basename(filepath),
+                'filepath': filepath,
+                'file_type': self.current_file_type,
+                'results': results,
+                'summary': summary,
+                'root_cause': root_cause,
+                'callback': lambda log_id: self._on_log_session_stored(log_id, len(results))
+            })
             
         except Exception as e:
             self.root.after(0, lambda: messagebox.showerror("Parse Error", f"Error parsing file: {str(e)}"))
             self.root.after(0, lambda: self.status.set("Parse failed"))
             self.root.after(0, self._hide_progress_dialog)
+        finally:
+            if isinstance(raw_bytes, mmap.mmap):
+                raw_bytes.close()
+    
+    def _run_post_parse_analyses(self, results, raw_bytes):
+        """Run the post-parse analyzers that apply to this log and store their reports
+        
+        The analyzers are independent of each other, so they run concurrently. Analyzers
+        that cannot apply (no results, not an FDRS log) are never constructed, and the
+        raw log is decoded at most once - only when an analyzer needs the text.
+        """
+        self.dependency_report = None
+        self.security_report = None
+        self.enhanced_diagnostics = None
+        self.critical_diagnostics = None
+        self.fdrs_analysis = None
+        self.fdrs_detailed = None
+        
+        # Check if this looks like an FDRS log on the raw bytes (no decode needed);
+        # mmap has no substring 'in' operator, find() scans the mapped pages in C
+        is_fdrs = (self.current_file_type == 'text' and
+                   raw_bytes.find(b'[SYSTEM]') >= 0 and raw_bytes.find(b'fdrsVersion') >= 0)
+        learn = SMART_FILTER_AVAILABLE and self.smart_filter
+        if not results and not is_fdrs and not learn:
+            return
+        
+        tasks = {}
+        with ThreadPoolExecutor(max_workers=min(6, os.cpu_count() or 1)) as pool:
+            # Result-based analyzers start first, they don't need the decoded text
+            if results:
+                if DEPENDENCY_TRACKER_AVAILABLE:
+                    tasks[pool.submit(self._analyze_dependencies, results)] = 'dependency_report'
+                if ENHANCED_DIAGNOSTICS_AVAILABLE:
+                    tasks[pool.submit(self._analyze_enhanced_diagnostics, results)] = 'enhanced_diagnostics'
+                if CRITICAL_DIAGNOSTICS_AVAILABLE:
+                    tasks[pool.submit(self._analyze_critical_diagnostics, results)] = 'critical_diagnostics'
+            
+            if learn:
+                tasks[pool.submit(self._learn_from_raw, raw_bytes)] = None
+            
+            needs_security = CYBERSECURITY_AVAILABLE and results
+            if needs_security or is_fdrs:
+                content = raw_bytes[:].decode('utf-8', errors='ignore')
+                if '\r' in content:
+                    # Same newline translation as text-mode open()
+                    content = content.replace('\r\n', '\n').replace('\r', '\n')
+                
+                if needs_security:
+                    tasks[pool.submit(self._analyze_security, results, content)] = 'security_report'
+                if is_fdrs:
+                    tasks[pool.submit(self._analyze_fdrs, content)] = 'fdrs_analysis'
+            
+            for future in as_completed(tasks):
+                name = tasks[future]
+                try:
+                    value = future.result()
+                except Exception as e:
+                    if name:
+                        print(f"Analysis '{name}' failed: {e}")
+                    continue  # Silent failure for smart filter learning
+                
+                if name == 'fdrs_analysis':
+                    self.fdrs_analysis, self.fdrs_detailed = value
+                elif name:
+                    setattr(self, name, value)
+    
+    def _learn_from_raw(self, raw_bytes, chunk_size=1 << 20):
+        """Feed the smart filter learner line-aligned chunks of the raw log
+        
+        Chunks are cut at the last newline byte, so peak memory is one decoded chunk
+        rather than the whole file. A window without any newline is cut at its end,
+        which can split a UTF-8 sequence - the incremental decoder carries such a
+        partial character over into the next chunk.
+        """
+        decoder = codecs.getincrementaldecoder('utf-8')('ignore')
+        start = 0
+        size = len(raw_bytes)
+        while start < size:
+            end = min(start + chunk_size, size)
+            if end < size:
+                newline = raw_bytes.rfind(b'\n', start, end)
+                if newline >= start:
+                    end = newline + 1
+            chunk = decoder.decode(raw_bytes[start:end], final=end >= size)
+            self.smart_filter.learn_from_chunk(chunk.replace('\r\n', '\n').replace('\r', '\n'))
+            start = end
+    
+    def _get_dependency_tracker(self):
+        """Shared dependency tracker - it resets its own state on every parse"""
+        if self._dependency_tracker is None:
+            self._dependency_tracker = ModuleDependencyTracker()
+        return self._dependency_tracker
+    
+    def _get_critical_analyzer(self):
+        """Shared critical diagnostics analyzer - pattern tables are built once"""
+        if self._critical_analyzer is None:
+            self._critical_analyzer = CriticalDiagnosticView()
+        return self._critical_analyzer
+    
+    def _analyze_dependencies(self, results):
+        """Generate module dependency analysis"""
+        return self._get_dependency_tracker().parse_log_for_dependencies(results)
+    
+    def _analyze_security(self, results, raw_content):
+        """Generate cybersecurity analysis, enhanced with UDS parsing when possible"""
+        security_analyzer = CybersecurityAnalyzer()
+        
+        # Try enhanced analysis with UDS parser if available
+        try:
+            return security_analyzer.analyze_with_uds_parser(raw_content)
+        except Exception as e:
+            print(f"Enhanced cybersecurity analysis failed, using basic: {e}")
+            # Fall back to basic analysis
+            return security_analyzer.analyze(results)
+    
+    def _analyze_enhanced_diagnostics(self, results):
+        """Generate enhanced diagnostic analysis (voltage, SOC, temp, etc.)"""
+        diagnostic_analyzer = EnhancedDiagnosticAnalyzer()
+        return diagnostic_analyzer.analyze(results)
+    
+    def _analyze_critical_diagnostics(self, results):
+        """Generate critical diagnostic analysis (VIN, voltage, DTCs, errors, success, DID, hex/ascii)"""
+        critical = self._get_critical_analyzer().extract_critical_diagnostics(results)
+        
+        # Ensure critical_diagnostics is always a dict or None, never False or other types
+        if not isinstance(critical, dict):
+            print(f"Warning: Critical diagnostics returned unexpected type: {type(critical)}")
+            return None
+        return critical
+    
+    def _analyze_fdrs(self, raw_content):
+        """Generate FDRS analysis for text logs, returns (analysis, detailed analysis)"""
+        try:
+            fdrs_parser = FDRSLogParser()
+            analysis = fdrs_parser.parse_log_text(raw_content)
+            # Also get detailed analysis
+            return analysis, fdrs_parser.get_detailed_analysis()
+        except Exception as e:
+            print(f"FDRS analysis error: {e}")
+            return None, None
+    
+    def _lowered_for(self, results):
+        """Lowered string form of each result, computed once per results list"""
+        if self._results_lowered_source is not results:
+            self._results_lowered = tuple(str(r).lower() for r in results)
+            self._results_lowered_source = results
+        return self._results_lowered
+    
+    def _count_result_categories(self, results):
+        """Classify every result once, shared by the DB summary and the summary cards"""
+        cached = getattr(self, '_category_counts', None)
+        if cached and cached[0] is results:
+            return cached[1]
+        
+        # One keyword scan over all rows joined by newlines (no keyword spans a newline);
+        # hits are mapped back to their row, rows without any keyword are never visited
+        lowered = self._lowered_for(results)
+        row_starts = list(accumulate((len(row) + 1 for row in lowered), initial=0))
+        row_masks = defaultdict(int)
+        for position, keyword in _iter_summary_keywords('\n'.join(lowered)):
+            row_masks[bisect_right(row_starts, position) - 1] |= _SUMMARY_KEYWORD_BITS[keyword]
+        
+        # Rows sharing a keyword mask share a category - classify each distinct mask once
+        totals = [0] * len(_SUMMARY_COUNT_KEYS)
+        for mask, row_count in Counter(row_masks.values()).items():
+            for i, flag in enumerate(_SUMMARY_CATEGORY_TABLE[mask]):
+                totals[i] += flag * row_count
+        counts = dict(zip(_SUMMARY_COUNT_KEYS, totals))
+        
+        self._category_counts = (results, counts)
+        return counts
+    
+    def _db_writer_loop(self):
+        """Store queued log sessions one at a time (runs on the DB writer thread)
+        
+        A None job is the exit sentinel queued by _final_cleanup; sessions queued before
+        it are still stored.
+        """
+        while True:
+            job = self._db_writer_queue.get()
+            if job is None:
+                return
+            callback = job.pop('callback')
+            try:
+                log_id = self.db.store_log_session(**job)
+            except Exception as e:
+                print(f"Failed to store log session: {e}")
+                log_id = None
+            if self._db_writer_closing:
+                continue  # The UI thread is waiting for us to drain the queue
+            try:
+                self.root.after(0, callback, log_id)
+            except (RuntimeError, tk.TclError):
+                pass  # The window was destroyed meanwhile
+    
+    def _on_log_session_stored(self, log_id, result_count):
+        """Report the stored log ID and refresh views that read from the database"""
+        if log_id is None:
+            self.status.set(f"✅ Parsed {result_count} items successfully (not saved to history)")
+            return
+        
+        self.status.set(f"✅ Parsed {result_count} items successfully (Log ID: {log_id})")
+        
+        # Refresh charts if on analytics tab
+        if hasattr(self, 'charts_panel'):
+            self.charts_panel.refresh_charts()
     
     def _calculate_summary(self, results):
         """Calculate summary statistics"""
-        summary = {
+        counts = self._count_result_categories(results)
+        return {
             'total': len(results),
-            'errors': 0,
-            'successes': 0,
-            'warnings': 0
+            'errors': counts['summary_errors'],
+            'successes': counts['summary_successes'],
+            'warnings': counts['summary_warnings']
         }
-        
-        for result in results:
-            result_str = str(result).lower()
-            if 'error' in result_str or 'fail' in result_str:
-                summary['errors'] += 1
-            elif 'success' in result_str or 'pass' in result_str:
-                summary['successes'] += 1
-            elif 'warning' in result_str or 'warn' in result_str:
-                summary['warnings'] += 1
-        
-        return summary
     
     def _display_results(self):
-        """Display parsed results"""
-        if self.simple_mode.get():
-            self._display_simple_results()
+        """Display parsed results
+        
+        The rendered segments are kept per (results version, mode, primary module), so
+        toggling back to a mode or module already shown just replays them.
+        """
+        key = (self._results_version, self.simple_mode.get(), self._get_manual_primary_module())
+        cached = self._display_cache.get(key)
+        if cached:
+            self._display_cache.move_to_end(key)
+            segments, cards = cached
         else:
-            self._display_expert_results()
+            segments = []
+            if self.simple_mode.get():
+                cards = self._display_simple_results(segments)
+            else:
+                cards = None
+                self._display_expert_results(segments)
+            self._display_cache[key] = (segments, cards)
+            while len(self._display_cache) > self._display_cache_size:
+                self._display_cache.popitem(last=False)
+        
+        if cards:
+            self._update_summary_cards(*cards)
+        
+        # The whole report (delete + inserts) is rebuilt as one batch
+        with self._bulk_text_update(self.results_text):
+            self.results_text.delete('1.0', tk.END)
+            self._bulk_insert(self.results_text, segments)
+        self._shown_segments = segments
+        self._raw_results_text = None
         
         # Check for NRC 7F issues after displaying results
         self._check_nrc7f_issues()
@@ -2122,111 +2945,185 @@ Supported formats:
         # Smart suggestion for Professional Analyzer
         self._check_for_professional_mode_suggestion()
     
-    def _display_simple_results(self):
-        """Display simplified results with enhanced diagnostics"""
-        self.results_text.delete('1.0', tk.END)
-        
+    def _raw_results_content(self):
+        """Unfiltered text of the results view, joined from the rendered segments on first use"""
+        if self._raw_results_text is None:
+            self._raw_results_text = ''.join(chars for chars, _ in self._shown_segments)
+        return self._raw_results_text
+    
+    def _display_simple_results(self, segments):
+        """Render simplified results with enhanced diagnostics, returns the summary card values"""
         if not self.current_results:
-            self.results_text.insert(tk.END, "No results to display.\n")
-            self._update_summary_cards(0, 0, 0, 0)
-            return
+            segments.append(("No results to display.\n", None))
+            return (0, 0, 0, 0)
         
         # Update summary cards with improved logic
         total = len(self.current_results)
         
-        # Better error detection
-        errors = sum(1 for r in self.current_results if 
-                    'error' in str(r).lower() or 
-                    'fail' in str(r).lower() or 
-                    'exception' in str(r).lower() or
-                    'not successful' in str(r).lower())
-        
-        warnings = sum(1 for r in self.current_results if 
-                      'warning' in str(r).lower() or 
-                      'caution' in str(r).lower())
-        
-        # Better success detection - exclude items with error indicators
-        success = sum(1 for r in self.current_results if 
-                     ('success' in str(r).lower() or 'pass' in str(r).lower()) and
-                     not ('error' in str(r).lower() or 
-                          'fail' in str(r).lower() or 
-                          'exception' in str(r).lower() or
-                          'not successful' in str(r).lower()))
-        
-        self._update_summary_cards(total, errors, warnings, success)
+        counts = self._count_result_categories(self.current_results)
+        errors, warnings, success = counts['errors'], counts['warnings'], counts['success']
         
         # Show Critical Diagnostics First (if available)
         if self.critical_diagnostics and CRITICAL_DIAGNOSTICS_AVAILABLE:
-            self._insert_critical_diagnostics()
+            self._add_critical_diagnostics(segments)
         # Otherwise show Enhanced Diagnostics (if available)
         elif self.enhanced_diagnostics:
-            self._insert_enhanced_diagnostics()
+            self._add_enhanced_diagnostics(segments)
         
         # Generate simple report (returns a string)
         fdrs_data = getattr(self, 'fdrs_analysis', None)
         manual_primary = self._get_manual_primary_module()
-        report_text = self.report_generator.generate_simple_report(
+        report_text = self._simple_report(
             self.current_results,
             self.current_file_type,
             fdrs_data,
             manual_primary
         )
         
-        # Insert the text report directly with basic coloring
-        self._insert_simple_text_report(report_text)
+        # Add the text report directly with basic coloring
+        self._add_simple_text_report(report_text, segments)
+        
+        return (total, errors, warnings, success)
+    
+    def _formatted_critical_report(self):
+        """Formatted critical diagnostics report, re-formatted only after a new analysis"""
+        cached = self._crit_report_cache
+        if cached and cached[0] is self.critical_diagnostics:
+            return cached[1]
+        report_text = format_critical_diagnostics_report(self.critical_diagnostics)
+        self._crit_report_cache = (self.critical_diagnostics, report_text)
+        return report_text
+    
+    def _critical_report_window_lines(self):
+        """(tag, line) pairs of the critical report window, re-classified only after a new analysis"""
+        cached = self._crit_window_cache
+        if cached and cached[0] is self.critical_diagnostics:
+            return cached[1]
+        lines = [(_classify_report_window_line(line), line)
+                 for line in _iter_lines(self._formatted_critical_report())]
+        self._crit_window_cache = (self.critical_diagnostics, lines)
+        return lines
+    
+    def _dependency_report_lines(self):
+        """(tag, line) pairs of the dependency report, re-formatted only after a new analysis"""
+        cached = self._dependency_lines_cache
+        if cached and cached[0] is self.dependency_report:
+            return cached[1]
+        formatted_text = self._get_dependency_tracker().format_dependency_report_text(self.dependency_report)
+        lines = [(_classify_dependency_line(line), line) for line in _iter_lines(formatted_text)]
+        self._dependency_lines_cache = (self.dependency_report, lines)
+        return lines
+    
+    def _simple_report(self, results, file_type, fdrs_data, manual_primary):
+        """Simple report text, regenerated only when its inputs change
+        
+        Mode toggles and re-renders reuse the report built for the same results,
+        FDRS analysis and primary module selection.
+        """
+        cached = self._simple_report_cache
+        if (cached and cached[0][0] is results and cached[0][2] is fdrs_data
+                and cached[0][1] == file_type and cached[0][3] == manual_primary):
+            return cached[1]
+        report_text = self.report_generator.generate_simple_report(results, file_type, fdrs_data, manual_primary)
+        self._simple_report_cache = ((results, file_type, fdrs_data, manual_primary), report_text)
+        return report_text
+    
+    @contextmanager
+    def _bulk_text_update(self, text):
+        """Rebuild a Text widget's content without undo bookkeeping
+        
+        The widget is made editable and undo/autoseparators are switched off for the
+        duration, then the previous settings are restored and the (meaningless) edit
+        history of the regenerated content is dropped.
+        """
+        prev_state = text.cget('state')
+        prev_undo = text.cget('undo')
+        prev_separators = text.cget('autoseparators')
+        text.config(state=tk.NORMAL, undo=False, autoseparators=False)
+        try:
+            yield text
+        finally:
+            text.config(undo=prev_undo, autoseparators=prev_separators)
+            text.edit_reset()
+            text.config(state=prev_state)
+    
+    def _bulk_insert(self, text, segments):
+        """Insert (chars, tag) segments at the end of a Text widget with one Tk call
+        
+        Consecutive segments sharing a tag are merged, the whole batch is passed to
+        a single multi-argument insert so Tk does the tagging itself.
+        """
+        args = []
+        run_tag = run_chars = None
+        for chars, tag in segments:
+            if run_chars is not None and tag == run_tag:
+                run_chars.append(chars)
+                continue
+            if run_chars is not None:
+                args += [''.join(run_chars), run_tag or '']
+            run_tag, run_chars = tag, [chars]
+        if run_chars is not None:
+            args += [''.join(run_chars), run_tag or '']
+        if args:
+            text.insert(tk.END, *args)
+    
+    def _bulk_insert_tagged(self, text, classified_lines):
+        """Insert (tag, line) pairs as newline-terminated lines with one Tk call"""
+        self._bulk_insert(text, [(line + '\n', tag) for tag, line in classified_lines])
     
     def _insert_colorized_report(self, report):
         """Insert report with colors"""
         text = self.results_text
+        segments = []
         
         # Title
-        text.insert(tk.END, "═" * 80 + "\n")
-        text.insert(tk.END, "  DIAGNOSTIC LOG ANALYSIS REPORT\n", "title")
-        text.insert(tk.END, "═" * 80 + "\n\n")
+        segments.append(("═" * 80 + "\n", None))
+        segments.append(("  DIAGNOSTIC LOG ANALYSIS REPORT\n", "title"))
+        segments.append(("═" * 80 + "\n\n", None))
         
         # Summary
-        text.insert(tk.END, "📊 SUMMARY\n", "section_header")
-        text.insert(tk.END, "─" * 80 + "\n")
+        segments.append(("📊 SUMMARY\n", "section_header"))
+        segments.append(("─" * 80 + "\n", None))
         
         summary = report.get('summary', {})
-        text.insert(tk.END, f"Total Items Analyzed: {summary.get('total', 0)}\n")
+        segments.append((f"Total Items Analyzed: {summary.get('total', 0)}\n", None))
         
         errors = summary.get('errors', 0)
         successes = summary.get('successes', 0)
         warnings = summary.get('warnings', 0)
         
         if errors > 0:
-            text.insert(tk.END, f"❌ Errors Found: {errors}\n", "error")
+            segments.append((f"❌ Errors Found: {errors}\n", "error"))
         if warnings > 0:
-            text.insert(tk.END, f"⚠️  Warnings: {warnings}\n", "warning")
+            segments.append((f"⚠️  Warnings: {warnings}\n", "warning"))
         if successes > 0:
-            text.insert(tk.END, f"✅ Successful Operations: {successes}\n", "success")
+            segments.append((f"✅ Successful Operations: {successes}\n", "success"))
         
-        text.insert(tk.END, "\n")
+        segments.append(("\n", None))
         
         # Root Cause Analysis
         if 'root_cause_analysis' in report:
             root_cause = report['root_cause_analysis']
-            text.insert(tk.END, "🔍 ROOT CAUSE ANALYSIS\n", "section_header")
-            text.insert(tk.END, "─" * 80 + "\n")
+            segments.append(("🔍 ROOT CAUSE ANALYSIS\n", "section_header"))
+            segments.append(("─" * 80 + "\n", None))
             
-            text.insert(tk.END, "Most Likely Issue: ", "root_cause")
-            text.insert(tk.END, f"{root_cause.get('most_likely_issue', 'Unknown')}\n\n")
+            segments.append(("Most Likely Issue: ", "root_cause"))
+            segments.append((f"{root_cause.get('most_likely_issue', 'Unknown')}\n\n", None))
             
-            text.insert(tk.END, "Proximate Cause:\n", "bold")
-            text.insert(tk.END, f"{root_cause.get('proximate_cause', 'N/A')}\n\n")
+            segments.append(("Proximate Cause:\n", "bold"))
+            segments.append((f"{root_cause.get('proximate_cause', 'N/A')}\n\n", None))
             
             if root_cause.get('recommended_actions'):
-                text.insert(tk.END, "Recommended Actions:\n", "action")
+                segments.append(("Recommended Actions:\n", "action"))
                 for i, action in enumerate(root_cause['recommended_actions'], 1):
-                    text.insert(tk.END, f"  {i}. {action}\n")
+                    segments.append((f"  {i}. {action}\n", None))
             
-            text.insert(tk.END, "\n")
+            segments.append(("\n", None))
         
         # Issues
         if 'issues' in report:
-            text.insert(tk.END, "⚠️  ISSUES FOUND\n", "section_header")
-            text.insert(tk.END, "─" * 80 + "\n")
+            segments.append(("⚠️  ISSUES FOUND\n", "section_header"))
+            segments.append(("─" * 80 + "\n", None))
             
             for issue in report['issues'][:20]:  # Show first 20
                 severity = issue.get('severity', '').upper()
@@ -2240,60 +3137,40 @@ Supported formats:
                 else:
                     tag = "info"
                 
-                text.insert(tk.END, f"[{severity}] ", tag)
-                text.insert(tk.END, f"{issue.get('description', '')}\n")
+                segments.append((f"[{severity}] ", tag))
+                segments.append((f"{issue.get('description', '')}\n", None))
                 
                 if issue.get('explanation'):
-                    text.insert(tk.END, f"  → {issue['explanation']}\n", "info")
+                    segments.append((f"  → {issue['explanation']}\n", "info"))
                 
-                text.insert(tk.END, "\n")
+                segments.append(("\n", None))
         
         # ECU Context
         if 'ecu_context' in report:
-            text.insert(tk.END, "🚗 ECU MODULES INVOLVED\n", "section_header")
-            text.insert(tk.END, "─" * 80 + "\n")
+            segments.append(("🚗 ECU MODULES INVOLVED\n", "section_header"))
+            segments.append(("─" * 80 + "\n", None))
             
             for ecu_info in report['ecu_context'][:10]:
                 if ecu_info.get('is_critical'):
-                    text.insert(tk.END, f"⚠️  {ecu_info.get('name', 'Unknown')} ", "ecu_critical")
-                    text.insert(tk.END, "(CRITICAL SYSTEM)\n", "ecu_critical")
+                    segments.append((f"⚠️  {ecu_info.get('name', 'Unknown')} ", "ecu_critical"))
+                    segments.append(("(CRITICAL SYSTEM)\n", "ecu_critical"))
                 else:
-                    text.insert(tk.END, f"  • {ecu_info.get('name', 'Unknown')}\n")
+                    segments.append((f"  • {ecu_info.get('name', 'Unknown')}\n", None))
                 
                 if ecu_info.get('context'):
-                    text.insert(tk.END, f"    {ecu_info['context']}\n", "info")
+                    segments.append((f"    {ecu_info['context']}\n", "info"))
             
-            text.insert(tk.END, "\n")
+            segments.append(("\n", None))
         
-        text.insert(tk.END, "═" * 80 + "\n")
-    
-    def _insert_simple_text_report(self, report_text):
-        """Insert simple text report with coloring"""
-        text = self.results_text
+        segments.append(("═" * 80 + "\n", None))
         
+        self._bulk_insert(text, segments)
+    
+    def _add_simple_text_report(self, report_text, segments):
+        """Add simple text report segments with coloring"""
         # Split into lines and colorize based on content
-        for line in report_text.split('\n'):
-            if line.startswith('📊') or line.startswith('🎯') or line.startswith('🔍') or line.startswith('❌'):
-                # Section headers
-                text.insert(tk.END, line + '\n', "section_header")
-            elif 'ERROR' in line.upper() or '❌' in line or '✗' in line:
-                # Error lines
-                text.insert(tk.END, line + '\n', "error")
-            elif 'WARNING' in line.upper() or '⚠' in line:
-                # Warning lines
-                text.insert(tk.END, line + '\n', "warning")
-            elif 'SUCCESS' in line.upper() or '✓' in line or '✅' in line:
-                # Success lines
-                text.insert(tk.END, line + '\n', "success")
-            elif line.startswith('   ') or line.startswith('  •'):
-                # Indented info lines
-                text.insert(tk.END, line + '\n', "info")
-            elif '═' in line or '─' in line:
-                # Separator lines
-                text.insert(tk.END, line + '\n', "bold")
-            else:
-                # Normal text
-                text.insert(tk.END, line + '\n')
+        for line in _iter_lines(report_text):
+            segments.append((line + '\n', _classify_simple_report_line(line)))
     
     def _update_summary_cards(self, total, errors, warnings, success):
         """Update the summary metric cards in Results tab"""
@@ -2302,209 +3179,171 @@ Supported formats:
         self.results_summary_cards['warnings'].config(text=str(warnings))
         self.results_summary_cards['success'].config(text=str(success))
     
-    def _insert_enhanced_diagnostics(self):
-        """Insert enhanced diagnostic information (voltage, SOC, temp, etc.)"""
+    def _add_enhanced_diagnostics(self, segments):
+        """Add enhanced diagnostic information segments (voltage, SOC, temp, etc.)"""
         if not self.enhanced_diagnostics:
             return
         
-        text = self.results_text
         diag = self.enhanced_diagnostics
         
         # Header
-        text.insert(tk.END, "╔" + "═" * 78 + "╗\n", "bold")
-        text.insert(tk.END, "║" + " " * 20 + "⚡ ENHANCED DIAGNOSTIC OVERVIEW" + " " * 27 + "║\n", "section_header")
-        text.insert(tk.END, "╚" + "═" * 78 + "╝\n\n", "bold")
+        segments.append(("╔" + "═" * 78 + "╗\n", "bold"))
+        segments.append(("║" + " " * 20 + "⚡ ENHANCED DIAGNOSTIC OVERVIEW" + " " * 27 + "║\n", "section_header"))
+        segments.append(("╚" + "═" * 78 + "╝\n\n", "bold"))
         
         # Critical Issues Section
         critical_issues = diag.get('critical_issues', [])
         if critical_issues:
-            text.insert(tk.END, "🚨 CRITICAL DIAGNOSTICS\n", "critical_status")
-            text.insert(tk.END, "─" * 80 + "\n")
+            segments.append(("🚨 CRITICAL DIAGNOSTICS\n", "critical_status"))
+            segments.append(("─" * 80 + "\n", None))
             
             for issue in critical_issues:
                 if issue['severity'] == 'critical':
-                    text.insert(tk.END, f"{issue['icon']} {issue['message']}\n", "critical_status")
+                    segments.append((f"{issue['icon']} {issue['message']}\n", "critical_status"))
                 elif issue['severity'] == 'warning':
-                    text.insert(tk.END, f"{issue['icon']} {issue['message']}\n", "warning")
+                    segments.append((f"{issue['icon']} {issue['message']}\n", "warning"))
                 else:
-                    text.insert(tk.END, f"{issue['icon']} {issue['message']}\n", "info")
-            text.insert(tk.END, "\n")
+                    segments.append((f"{issue['icon']} {issue['message']}\n", "info"))
+            segments.append(("\n", None))
         
         # Voltage Analysis
         voltage = diag.get('voltage', {})
         if voltage.get('status') != 'unknown':
-            text.insert(tk.END, "🔋 VOLTAGE ANALYSIS\n", "bold")
-            text.insert(tk.END, "─" * 80 + "\n")
+            segments.append(("🔋 VOLTAGE ANALYSIS\n", "bold"))
+            segments.append(("─" * 80 + "\n", None))
             
             status = voltage['status']
             if status == 'critical':
-                text.insert(tk.END, voltage['message'] + "\n", "critical_status")
+                segments.append((voltage['message'] + "\n", "critical_status"))
             elif status == 'warning':
-                text.insert(tk.END, voltage['message'] + "\n", "warning")
+                segments.append((voltage['message'] + "\n", "warning"))
             else:
-                text.insert(tk.END, voltage['message'] + "\n", "success")
+                segments.append((voltage['message'] + "\n", "success"))
             
-            text.insert(tk.END, f"  • Average: {voltage.get('average', 'N/A')}V\n", "info")
-            text.insert(tk.END, f"  • Range: {voltage.get('min', 'N/A')}V - {voltage.get('max', 'N/A')}V\n", "info")
-            text.insert(tk.END, f"  • Readings: {len(voltage.get('readings', []))}\n", "info")
-            text.insert(tk.END, "\n")
+            segments.append((f"  • Average: {voltage.get('average', 'N/A')}V\n", "info"))
+            segments.append((f"  • Range: {voltage.get('min', 'N/A')}V - {voltage.get('max', 'N/A')}V\n", "info"))
+            segments.append((f"  • Readings: {len(voltage.get('readings', []))}\n", "info"))
+            segments.append(("\n", None))
         
         # State of Charge Analysis
         soc = diag.get('state_of_charge', {})
         if soc.get('status') != 'unknown':
-            text.insert(tk.END, "⚡ STATE OF CHARGE (SOC)\n", "bold")
-            text.insert(tk.END, "─" * 80 + "\n")
+            segments.append(("⚡ STATE OF CHARGE (SOC)\n", "bold"))
+            segments.append(("─" * 80 + "\n", None))
             
             status = soc['status']
             if status == 'critical':
-                text.insert(tk.END, soc['message'] + "\n", "critical_status")
+                segments.append((soc['message'] + "\n", "critical_status"))
             elif status == 'warning':
-                text.insert(tk.END, soc['message'] + "\n", "warning")
+                segments.append((soc['message'] + "\n", "warning"))
             else:
-                text.insert(tk.END, soc['message'] + "\n", "success")
+                segments.append((soc['message'] + "\n", "success"))
             
-            text.insert(tk.END, f"  • Average: {soc.get('average', 'N/A')}%\n", "info")
-            text.insert(tk.END, f"  • Minimum: {soc.get('min', 'N/A')}%\n", "info")
-            text.insert(tk.END, f"  • Readings: {len(soc.get('readings', []))}\n", "info")
-            text.insert(tk.END, "\n")
+            segments.append((f"  • Average: {soc.get('average', 'N/A')}%\n", "info"))
+            segments.append((f"  • Minimum: {soc.get('min', 'N/A')}%\n", "info"))
+            segments.append((f"  • Readings: {len(soc.get('readings', []))}\n", "info"))
+            segments.append(("\n", None))
         
         # Temperature Analysis
         temp = diag.get('temperature', {})
         if temp.get('status') != 'unknown':
-            text.insert(tk.END, "🌡️ TEMPERATURE MONITORING\n", "bold")
-            text.insert(tk.END, "─" * 80 + "\n")
+            segments.append(("🌡️ TEMPERATURE MONITORING\n", "bold"))
+            segments.append(("─" * 80 + "\n", None))
             
             status = temp['status']
             if status == 'critical':
-                text.insert(tk.END, temp['message'] + "\n", "critical_status")
+                segments.append((temp['message'] + "\n", "critical_status"))
             elif status == 'warning':
-                text.insert(tk.END, temp['message'] + "\n", "warning")
+                segments.append((temp['message'] + "\n", "warning"))
             else:
-                text.insert(tk.END, temp['message'] + "\n", "success")
+                segments.append((temp['message'] + "\n", "success"))
             
-            text.insert(tk.END, f"  • Average: {temp.get('average', 'N/A')}°C\n", "info")
-            text.insert(tk.END, f"  • Range: {temp.get('min', 'N/A')}°C - {temp.get('max', 'N/A')}°C\n", "info")
-            text.insert(tk.END, f"  • Readings: {len(temp.get('readings', []))}\n", "info")
-            text.insert(tk.END, "\n")
+            segments.append((f"  • Average: {temp.get('average', 'N/A')}°C\n", "info"))
+            segments.append((f"  • Range: {temp.get('min', 'N/A')}°C - {temp.get('max', 'N/A')}°C\n", "info"))
+            segments.append((f"  • Readings: {len(temp.get('readings', []))}\n", "info"))
+            segments.append(("\n", None))
         
         # DTC Codes
         dtc_codes = diag.get('dtc_codes', [])
         if dtc_codes:
-            text.insert(tk.END, "🔧 DIAGNOSTIC TROUBLE CODES (DTCs)\n", "bold")
-            text.insert(tk.END, "─" * 80 + "\n")
-            text.insert(tk.END, f"Found {len(dtc_codes)} DTC(s):\n", "warning")
+            segments.append(("🔧 DIAGNOSTIC TROUBLE CODES (DTCs)\n", "bold"))
+            segments.append(("─" * 80 + "\n", None))
+            segments.append((f"Found {len(dtc_codes)} DTC(s):\n", "warning"))
             
             for dtc in dtc_codes[:10]:  # Show first 10
-                text.insert(tk.END, f"  • {dtc['code']}", "error")
-                text.insert(tk.END, f" (Line {dtc['index']})\n", "info")
+                segments.append((f"  • {dtc['code']}", "error"))
+                segments.append((f" (Line {dtc['index']})\n", "info"))
             
             if len(dtc_codes) > 10:
-                text.insert(tk.END, f"  ... and {len(dtc_codes) - 10} more\n", "info")
-            text.insert(tk.END, "\n")
+                segments.append((f"  ... and {len(dtc_codes) - 10} more\n", "info"))
+            segments.append(("\n", None))
         
         # Programming Preconditions
         preconditions = diag.get('preconditions', {})
         if preconditions:
-            text.insert(tk.END, "⚙️ PROGRAMMING PRECONDITIONS\n", "bold")
-            text.insert(tk.END, "─" * 80 + "\n")
+            segments.append(("⚙️ PROGRAMMING PRECONDITIONS\n", "bold"))
+            segments.append(("─" * 80 + "\n", None))
             
             for condition, checks in preconditions.items():
                 met = all(check['met'] for check in checks)
                 if met:
-                    text.insert(tk.END, f"  ✅ {condition.title()}\n", "success")
+                    segments.append((f"  ✅ {condition.title()}\n", "success"))
                 else:
-                    text.insert(tk.END, f"  ❌ {condition.title()} - NOT MET\n", "error")
-            text.insert(tk.END, "\n")
+                    segments.append((f"  ❌ {condition.title()} - NOT MET\n", "error"))
+            segments.append(("\n", None))
         
         # Software Versions
         sw_versions = diag.get('software_versions', {})
         if sw_versions:
-            text.insert(tk.END, "💾 SOFTWARE VERSIONS\n", "bold")
-            text.insert(tk.END, "─" * 80 + "\n")
+            segments.append(("💾 SOFTWARE VERSIONS\n", "bold"))
+            segments.append(("─" * 80 + "\n", None))
             
             for module, versions in sw_versions.items():
-                text.insert(tk.END, f"  • Module {module}: ", "info")
+                segments.append((f"  • Module {module}: ", "info"))
                 if versions:
-                    text.insert(tk.END, f"{versions[0]['version']}\n")
+                    segments.append((f"{versions[0]['version']}\n", None))
                 else:
-                    text.insert(tk.END, "Unknown\n")
-            text.insert(tk.END, "\n")
+                    segments.append(("Unknown\n", None))
+            segments.append(("\n", None))
         
-        text.insert(tk.END, "═" * 80 + "\n\n", "bold")
+        segments.append(("═" * 80 + "\n\n", "bold"))
     
-    def _insert_critical_diagnostics(self):
-        """Insert critical diagnostic information (VIN, voltage, DTCs, errors, DID responses, hex/ascii)"""
+    def _add_critical_diagnostics(self, segments):
+        """Add critical diagnostic information segments (VIN, voltage, DTCs, errors, DID responses, hex/ascii)"""
         if not self.critical_diagnostics:
             return
         
-        text = self.results_text
-        
         # Generate and insert the formatted critical diagnostics report
         try:
-            report_text = format_critical_diagnostics_report(self.critical_diagnostics)
+            report_text = self._formatted_critical_report()
             
             # Insert with appropriate formatting
-            lines = report_text.split('\n')
-            for line in lines:
-                if line.startswith('╔') or line.startswith('╚') or line.startswith('║'):
-                    text.insert(tk.END, line + "\n", "bold")
-                elif line.startswith('🚗 VEHICLE IDENTIFICATION'):
-                    text.insert(tk.END, line + "\n", "section_header")
-                elif line.startswith('🔋 BATTERY/VOLTAGE STATUS'):
-                    text.insert(tk.END, line + "\n", "section_header")
-                elif line.startswith('🔧 DIAGNOSTIC TROUBLE CODES'):
-                    text.insert(tk.END, line + "\n", "section_header")
-                elif line.startswith('❌ FAILED OPERATIONS'):
-                    text.insert(tk.END, line + "\n", "section_header")
-                elif line.startswith('✅ SUCCESSFUL OPERATIONS'):
-                    text.insert(tk.END, line + "\n", "section_header")
-                elif line.startswith('📋 DATA IDENTIFIER'):
-                    text.insert(tk.END, line + "\n", "section_header")
-                elif line.startswith('🔍 HEX/ASCII COMMUNICATION'):
-                    text.insert(tk.END, line + "\n", "section_header")
-                elif line.startswith('🎯 PROXIMATE CAUSE ANALYSIS'):
-                    text.insert(tk.END, line + "\n", "section_header")
-                elif line.startswith('⏰ DIAGNOSTIC EVENT TIMELINE'):
-                    text.insert(tk.END, line + "\n", "section_header")
-                elif '❌' in line or 'CRITICAL:' in line or '🚨' in line:
-                    text.insert(tk.END, line + "\n", "critical_status")
-                elif '⚠️' in line or 'WARNING:' in line:
-                    text.insert(tk.END, line + "\n", "warning")
-                elif '✅' in line or 'good' in line.lower() or 'normal' in line.lower():
-                    text.insert(tk.END, line + "\n", "success")
-                elif line.startswith('  •') or line.startswith('    ') or line.startswith('  '):
-                    text.insert(tk.END, line + "\n", "info")
-                elif line.startswith('='):
-                    text.insert(tk.END, line + "\n", "bold")
-                else:
-                    text.insert(tk.END, line + "\n", "normal")
+            for line in _iter_lines(report_text):
+                segments.append((line + "\n", _classify_critical_line(line)))
             
-            text.insert(tk.END, "\n", "normal")
+            segments.append(("\n", "normal"))
             
         except Exception as e:
             # Fallback if formatting fails
-            text.insert(tk.END, "🚨 CRITICAL DIAGNOSTIC DATA AVAILABLE\n", "critical_status")
+            segments.append(("🚨 CRITICAL DIAGNOSTIC DATA AVAILABLE\n", "critical_status"))
             # Safe access: only call len() if it's a dict
             if isinstance(self.critical_diagnostics, dict):
-                text.insert(tk.END, f"Analysis completed - {len(self.critical_diagnostics)} sections available\n", "info")
+                segments.append((f"Analysis completed - {len(self.critical_diagnostics)} sections available\n", "info"))
             else:
-                text.insert(tk.END, f"Analysis completed but data format unexpected (type: {type(self.critical_diagnostics).__name__})\n", "info")
-            text.insert(tk.END, f"Note: Display formatting error: {e}\n", "warning")
-            text.insert(tk.END, "\n")
+                segments.append((f"Analysis completed but data format unexpected (type: {type(self.critical_diagnostics).__name__})\n", "info"))
+            segments.append((f"Note: Display formatting error: {e}\n", "warning"))
+            segments.append(("\n", None))
     
-    def _display_expert_results(self):
-        """Display expert/technical results"""
-        self.results_text.delete('1.0', tk.END)
-        
+    def _display_expert_results(self, segments):
+        """Render expert/technical results"""
         if not self.current_results:
-            self.results_text.insert(tk.END, "No results to display.\n")
+            segments.append(("No results to display.\n", None))
             return
         
-        self.results_text.insert(tk.END, f"=== EXPERT MODE - {len(self.current_results)} ITEMS ===\n\n", "title")
-        
+        segments.append((f"=== EXPERT MODE - {len(self.current_results)} ITEMS ===\n\n", "title"))
         for i, result in enumerate(self.current_results, 1):
-            self.results_text.insert(tk.END, f"--- Item {i} ---\n", "bold")
-            self.results_text.insert(tk.END, json.dumps(result, indent=2) + "\n\n")
+            segments.append((f"--- Item {i} ---\n", "bold"))
+            segments.append((_pretty_json(result) + "\n\n", None))
     
     def _toggle_mode(self):
         """Toggle between Simple and Expert mode"""
@@ -2552,7 +3391,7 @@ Supported formats:
             return custom_id if custom_id else None
         else:
             # Extract ID from selection like "716 (GWM - Gateway Module)"
-            match = re.match(r'([0-9A-F]{3})', selection)
+            match = _PRIMARY_MODULE_RX.match(selection)
             return match.group(1) if match else None
     
     def _refresh_display(self):
@@ -2574,13 +3413,13 @@ Supported formats:
         # Generate critical diagnostics if not already done
         if not self.critical_diagnostics and CRITICAL_DIAGNOSTICS_AVAILABLE:
             try:
-                critical_analyzer = CriticalDiagnosticView()
-                self.critical_diagnostics = critical_analyzer.extract_critical_diagnostics(self.current_results)
+                self.critical_diagnostics = self._get_critical_analyzer().extract_critical_diagnostics(self.current_results)
                 
                 # Ensure critical_diagnostics is always a dict or None, never False or other types
                 if not isinstance(self.critical_diagnostics, dict):
                     print(f"Warning: Critical diagnostics returned unexpected type: {type(self.critical_diagnostics)}")
                     self.critical_diagnostics = None
+                self._results_version += 1  # The cached report display may include this view
             except Exception as e:
                 messagebox.showerror("Analysis Error", f"Failed to generate critical diagnostics: {e}")
                 return
@@ -2594,56 +3433,50 @@ Supported formats:
         report_window.rowconfigure(0, weight=1)
         report_window.columnconfigure(0, weight=1)
         
-        # Create scrolled text widget
-        report_text = scrolledtext.ScrolledText(
-            report_window,
+        # Create the report view - the report is read-only and monospace, so its lines
+        # are drawn straight onto a canvas, visible rows only
+        view_frame = ttk.Frame(report_window)
+        view_frame.grid(row=0, column=0, sticky='nsew', padx=10, pady=10)
+        view_frame.rowconfigure(0, weight=1)
+        view_frame.columnconfigure(0, weight=1)
+        
+        scrollbar = ttk.Scrollbar(view_frame, orient=tk.VERTICAL)
+        scrollbar.grid(row=0, column=1, sticky='ns')
+        h_scrollbar = ttk.Scrollbar(view_frame, orient=tk.HORIZONTAL)
+        h_scrollbar.grid(row=1, column=0, sticky='ew')
+        
+        report_view = MonoLogView(
+            view_frame,
             font=('Courier New', 10),
-            wrap=tk.WORD,
             background='black',
             foreground='white',
-            insertbackground='white'
+            tag_styles=_REPORT_WINDOW_TAG_STYLES,
+            yscrollcommand=scrollbar.set,
+            xscrollcommand=h_scrollbar.set
         )
-        report_text.grid(row=0, column=0, sticky='nsew', padx=10, pady=10)
-        
-        # Configure text tags for formatting
-        report_text.tag_config("critical", foreground="red", font=('Courier New', 10, 'bold'))
-        report_text.tag_config("warning", foreground="orange")
-        report_text.tag_config("success", foreground="green")
-        report_text.tag_config("info", foreground="cyan")
-        report_text.tag_config("header", foreground="yellow", font=('Courier New', 12, 'bold'))
-        report_text.tag_config("section", foreground="magenta", font=('Courier New', 11, 'bold'))
+        report_view.grid(row=0, column=0, sticky='nsew')
+        scrollbar.config(command=report_view.yview)
+        h_scrollbar.config(command=report_view.xview)
         
         try:
             # Generate and insert report
             if self.critical_diagnostics:
-                report_content = format_critical_diagnostics_report(self.critical_diagnostics)
+                classified = self._critical_report_window_lines()
             else:
                 # Fallback - generate basic critical report
-                critical_analyzer = CriticalDiagnosticView()
-                critical_data = critical_analyzer.extract_critical_diagnostics(self.current_results)
+                critical_data = self._get_critical_analyzer().extract_critical_diagnostics(self.current_results)
                 report_content = format_critical_diagnostics_report(critical_data)
+                classified = [(_classify_report_window_line(line), line) for line in _iter_lines(report_content)]
             
-            # Insert content with basic formatting
-            lines = report_content.split('\n')
-            for line in lines:
-                if '🚨' in line or 'CRITICAL' in line or '❌' in line:
-                    report_text.insert(tk.END, line + "\n", "critical")
-                elif '⚠️' in line or 'WARNING' in line:
-                    report_text.insert(tk.END, line + "\n", "warning")
-                elif '✅' in line or 'SUCCESS' in line or 'GOOD' in line:
-                    report_text.insert(tk.END, line + "\n", "success")
-                elif line.startswith('╔') or line.startswith('╚') or line.startswith('║'):
-                    report_text.insert(tk.END, line + "\n", "header")
-                elif any(line.startswith(prefix) for prefix in ['🚗 ', '🔋 ', '🔧 ', '📋 ', '🔍 ', '🎯 ', '⏰ ']):
-                    report_text.insert(tk.END, line + "\n", "section")
-                elif line.startswith('  •') or line.startswith('    '):
-                    report_text.insert(tk.END, line + "\n", "info")
-                else:
-                    report_text.insert(tk.END, line + "\n")
+            # The classified list is the backing model for drawing and saving
+            report_view.set_lines(classified)
             
         except Exception as e:
-            report_text.insert(tk.END, f"Error generating report: {e}\n", "critical")
-            report_text.insert(tk.END, "\nFallback: Basic diagnostic information available in main window.\n", "info")
+            report_view.set_lines([
+                ("critical", f"Error generating report: {e}"),
+                ("info", ""),
+                ("info", "Fallback: Basic diagnostic information available in main window."),
+            ])
         
         # Add buttons frame
         button_frame = ttk.Frame(report_window)
@@ -2658,24 +3491,37 @@ Supported formats:
                     filetypes=[("Text files", "*.txt"), ("All files", "*.*")]
                 )
                 if filename:
+                    # Stream the full report from the view's backing list without
+                    # building it as one string
                     with open(filename, 'w', encoding='utf-8') as f:
-                        f.write(report_text.get("1.0", tk.END))
+                        f.writelines(line + '\n' for _, line in report_view.lines)
                     messagebox.showinfo("Saved", f"Critical diagnostic report saved to {filename}")
             except Exception as e:
                 messagebox.showerror("Save Error", f"Failed to save report: {e}")
         
+        def copy_report():
+            """Copy the whole report to the clipboard - the canvas has no text selection"""
+            report_window.clipboard_clear()
+            report_window.clipboard_append('\n'.join(line for _, line in report_view.lines))
+            self.status.set("📋 Critical diagnostic report copied to clipboard")
+        
         ttk.Button(button_frame, text="💾 Save Report", command=save_report).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="📋 Copy Report", command=copy_report).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="❌ Close", command=report_window.destroy).pack(side=tk.RIGHT, padx=5)
         
+        # Page keys scroll the report wherever the focus is in its window
+        report_window.bind('<Prior>', lambda event: report_view.yview('scroll', -1, 'pages'))
+        report_window.bind('<Next>', lambda event: report_view.yview('scroll', 1, 'pages'))
+        
         # Focus on the report window
         report_window.focus_set()
         report_window.lift()
-        
-        # Make report text read-only
-        report_text.config(state='disabled')
     
     def _display_dependencies(self):
         """Display module dependency analysis"""
+        if 'dependencies' not in self._tab_built:
+            return
+        
         self.dependencies_text.config(state=tk.NORMAL)
         self.dependencies_text.delete('1.0', tk.END)
         
@@ -2696,43 +3542,31 @@ Supported formats:
             self.dependencies_text.config(state=tk.DISABLED)
             return
         
-        # Display formatted dependency report
-        tracker = ModuleDependencyTracker()
-        formatted_text = tracker.format_dependency_report_text(self.dependency_report)
-        
-        # Color-code the output
-        for line in formatted_text.split('\n'):
-            if line.startswith('🔗') or line.startswith('📊') or line.startswith('💡') or line.startswith('📡'):
-                self.dependencies_text.insert(tk.END, line + '\n', "header")
-            elif line.startswith('❌') or '❌' in line or 'FAILED' in line.upper():
-                self.dependencies_text.insert(tk.END, line + '\n', "error")
-            elif line.startswith('⚠️') or '⚠️' in line or 'WARNING' in line.upper():
-                self.dependencies_text.insert(tk.END, line + '\n', "warning")
-            elif line.startswith('✅') or '✅' in line or 'Successful:' in line:
-                self.dependencies_text.insert(tk.END, line + '\n', "success")
-            elif '(' in line and ')' in line and any(c.isdigit() for c in line):
-                # Module names with IDs
-                self.dependencies_text.insert(tk.END, line + '\n', "module")
-            elif line.startswith('  '):
-                # Indented lines
-                self.dependencies_text.insert(tk.END, line + '\n', "info")
-            elif '═' in line or '─' in line:
-                # Separator lines
-                self.dependencies_text.insert(tk.END, line + '\n', "header")
-            else:
-                # Normal text
-                self.dependencies_text.insert(tk.END, line + '\n')
+        # Display formatted, color-coded dependency report
+        self._bulk_insert_tagged(self.dependencies_text, self._dependency_report_lines())
         
         self.dependencies_text.config(state=tk.DISABLED)
     
     def _display_security(self):
         """Display enhanced security analysis in the Cybersecurity tab with modern card layout"""
+        if 'cybersecurity' not in self._tab_built:
+            return
+        
         if not self.security_report:
             return
         
-        # Clear existing threat cards
+        # Same analysis as the cards already on screen - nothing to rebuild
+        if self.security_report is self._shown_security_report:
+            return
+        self._shown_security_report = self.security_report
+        
+        # Clear existing cards - pooled threat cards are only hidden for reuse
+        pooled = {str(card['card']) for card in self._threat_card_pool}
         for widget in self.security_cards_frame.winfo_children():
-            widget.destroy()
+            if str(widget) in pooled:
+                widget.pack_forget()
+            else:
+                widget.destroy()
         
         # Check if this is enhanced analysis (with UDS parser)
         is_enhanced = 'enhanced_security_assessment' in self.security_report
@@ -2752,9 +3586,10 @@ Supported formats:
         security_score = assessment.get('security_score', 0)
         risk_level = assessment.get('risk_level', 'UNKNOWN')
         total_threats = basic_analysis.get('total_threats', 0)
+        security_issues = assessment.get('security_issues') or []
         
         self.security_metrics['total'].config(text=str(total_threats))
-        self.security_metrics['critical'].config(text=str(assessment.get('security_issues', []).__len__()))
+        self.security_metrics['critical'].config(text=str(len(security_issues)))
         self.security_metrics['high'].config(text=risk_level)
         self.security_metrics['medium'].config(text=f"{security_score}/100")
         
@@ -2774,7 +3609,6 @@ Supported formats:
         score_text.pack(pady=5)
         
         # Display security issues if any
-        security_issues = assessment.get('security_issues', [])
         if security_issues:
             issues_text = "\n".join([f"• {issue}" for issue in security_issues[:3]])
             issues_label = tk.Label(score_inner, text=issues_text, 
@@ -2817,25 +3651,26 @@ Supported formats:
                                            bg='white', fg='#2c3e50', wrap=tk.WORD)
         exp_text.pack(fill=tk.BOTH, expand=True)
         
-        # Add explanations
-        if explanations.get('what_worked'):
-            exp_text.insert(tk.END, "✅ SUCCESSFUL OPERATIONS:\n", "success")
-            for explanation in explanations['what_worked'][:5]:
-                exp_text.insert(tk.END, f"  • {explanation}\n")
-            exp_text.insert(tk.END, "\n")
-        
-        if explanations.get('what_failed'):
-            exp_text.insert(tk.END, "❌ FAILED OPERATIONS:\n", "error")
-            for explanation in explanations['what_failed'][:5]:
-                exp_text.insert(tk.END, f"  • {explanation}\n")
-            exp_text.insert(tk.END, "\n")
-        
-        if explanations.get('why_failed'):
-            exp_text.insert(tk.END, "🤔 WHY OPERATIONS FAILED:\n", "warning")
-            unique_reasons = list(set(explanations['why_failed'][:5]))
-            for reason in unique_reasons:
-                exp_text.insert(tk.END, f"  • {reason}\n")
-        
+        # Add explanations - one tagged heading and one joined body per section,
+        # the whole card goes to Tk in a single insert
+        segments = []
+        what_worked = explanations.get('what_worked')
+        if what_worked:
+            segments.append(("✅ SUCCESSFUL OPERATIONS:\n", "success"))
+            segments.append(("".join(f"  • {e}\n" for e in what_worked[:5]) + "\n", None))
+        
+        what_failed = explanations.get('what_failed')
+        if what_failed:
+            segments.append(("❌ FAILED OPERATIONS:\n", "error"))
+            segments.append(("".join(f"  • {e}\n" for e in what_failed[:5]) + "\n", None))
+        
+        why_failed = explanations.get('why_failed')
+        if why_failed:
+            segments.append(("🤔 WHY OPERATIONS FAILED:\n", "warning"))
+            # dict.fromkeys drops repeats but keeps the reasons in log order
+            segments.append(("".join(f"  • {r}\n" for r in dict.fromkeys(why_failed[:5])), None))
+        
+        self._bulk_insert(exp_text, segments)
         exp_text.config(state=tk.DISABLED)
     
     def _display_enhanced_recommendations(self, recommendations):
@@ -2883,18 +3718,10 @@ Supported formats:
         fs_frame = tk.Frame(fs_inner, bg='#f4ecf7')
         fs_frame.pack(fill=tk.BOTH, expand=True, padx=15, pady=10)
         
-        summary_text = f"""FAILURES: {failure_summary.get('total_failures', 0)} total
-  • Critical: {failure_summary.get('critical_failures', 0)}
-  • High Impact: {failure_summary.get('high_impact_failures', 0)}
-  • Timeouts: {failure_summary.get('timeout_failures', 0)}
-  • Communication Errors: {failure_summary.get('comm_failures', 0)}
-
-SUCCESSES: {success_summary.get('total_successes', 0)} total
-  • Read Operations: {success_summary.get('read_operations', 0)}
-  • Write Operations: {success_summary.get('write_operations', 0)}
-  • Security Operations: {success_summary.get('security_operations', 0)}
-
-Overall Success Rate: {summary.get('overall_success_rate', 0) * 100:.1f}%"""
+        # Missing counters read as 0
+        values = defaultdict(int, {**failure_summary, **success_summary})
+        values['overall_success_rate'] = summary.get('overall_success_rate', 0) * 100
+        summary_text = _FS_SUMMARY_TEMPLATE.format_map(values)
         
         fs_label = tk.Label(fs_frame, text=summary_text, 
                            font=('Consolas', 10), bg='#f4ecf7', fg='#34495e',
@@ -2916,15 +3743,13 @@ Overall Success Rate: {summary.get('overall_success_rate', 0) * 100:.1f}%"""
         self._draw_severity_chart(severity_stats)
         
         # Update affected modules
-        self.modules_text.config(state=tk.NORMAL)
-        self.modules_text.delete('1.0', tk.END)
+        self.modules_tree.delete(*self.modules_tree.get_children())
         affected = self.security_report.get('affected_modules', [])
         if affected:
             for module in sorted(affected):
-                self.modules_text.insert(tk.END, f"• {module}\n")
+                self.modules_tree.insert('', tk.END, text=f"• {module}")
         else:
-            self.modules_text.insert(tk.END, "No modules affected")
-        self.modules_text.config(state=tk.DISABLED)
+            self.modules_tree.insert('', tk.END, text="No modules affected")
         
         # Check if any threats were found
         if total_threats == 0:
@@ -2945,104 +3770,144 @@ Overall Success Rate: {summary.get('overall_success_rate', 0) * 100:.1f}%"""
         
         # Display threat cards (existing code)
         threats = self.security_report.get('threats', [])
-        severity_colors = {
-            'critical': ('#e74c3c', '#fadbd8'),
-            'high': ('#e67e22', '#fdebd0'),
-            'medium': ('#f39c12', '#fef5e7'),
-            'low': ('#27ae60', '#d5f4e6')
-        }
-        
-        severity_icons = {
-            'critical': '🔴',
-            'high': '🟠',
-            'medium': '🟡',
-            'low': '🟢'
-        }
         
+        # Threat cards are recycled from the pool, new ones are only created when a
+        # log has more threats than any log shown before
+        pool = self._threat_card_pool
         for idx, threat in enumerate(threats, 1):
             severity = threat.get('severity', 'low')
-            border_color, bg_color = severity_colors.get(severity, ('#95a5a6', '#ecf0f1'))
-            icon = severity_icons.get(severity, '⚪')
-            
-            card = tk.Frame(self.security_cards_frame, bg=border_color, relief=tk.RAISED, borderwidth=2)
-            card.pack(fill=tk.X, padx=10, pady=8)
-            
-            inner = tk.Frame(card, bg=bg_color)
-            inner.pack(fill=tk.BOTH, expand=True, padx=2, pady=2)
-            
-            # Header with severity and icon
-            header_frame = tk.Frame(inner, bg=bg_color)
-            header_frame.pack(fill=tk.X, padx=15, pady=(10, 5))
+            border_color, bg_color = _SEVERITY_COLORS.get(severity, _DEFAULT_SEVERITY_COLORS)
+            icon = _SEVERITY_ICONS.get(severity, '⚪')
             
-            icon_label = tk.Label(header_frame, text=icon, font=('Segoe UI Emoji', 16), 
-                                 bg=bg_color, width=2)
-            icon_label.pack(side=tk.LEFT, padx=(0, 10))
+            if idx > len(pool):
+                pool.append(self._create_threat_card())
+            card = pool[idx - 1]
             
-            severity_label = tk.Label(header_frame, text=f"#{idx} - {severity} SEVERITY", 
-                                     font=('Arial', 11, 'bold'), bg=bg_color, fg=border_color)
-            severity_label.pack(side=tk.LEFT)
+            card['card'].config(bg=border_color)
+            for name in ('inner', 'header_frame', 'type_frame', 'desc_frame', 'module_frame'):
+                card[name].config(bg=bg_color)
+            card['icon_label'].config(text=icon, bg=bg_color)
+            card['severity_label'].config(text=f"#{idx} - {severity} SEVERITY", bg=bg_color, fg=border_color)
+            card['type_label'].config(text=f"🎯 Type: {threat.get('type', 'Unknown')}", bg=bg_color)
+            card['desc_label'].config(text=threat.get('description', 'No description'), bg=bg_color)
             
-            # Threat type
-            type_frame = tk.Frame(inner, bg=bg_color)
-            type_frame.pack(fill=tk.X, padx=15, pady=5)
-            
-            type_label = tk.Label(type_frame, text=f"🎯 Type: {threat.get('type', 'Unknown')}", 
-                                 font=('Arial', 10, 'bold'), bg=bg_color, fg='#2c3e50')
-            type_label.pack(anchor=tk.W)
-            
-            # Description
-            desc_frame = tk.Frame(inner, bg=bg_color)
-            desc_frame.pack(fill=tk.X, padx=15, pady=5)
-            
-            desc_label = tk.Label(desc_frame, text=threat.get('description', 'No description'), 
-                                 font=('Arial', 10), bg=bg_color, fg='#34495e', 
-                                 wraplength=700, justify=tk.LEFT)
-            desc_label.pack(anchor=tk.W)
+            # Optional sections are re-packed in order after the fixed ones
+            card['module_frame'].pack_forget()
+            card['rec_frame'].pack_forget()
             
             # Module info if available
             if threat.get('module'):
-                module_frame = tk.Frame(inner, bg=bg_color)
-                module_frame.pack(fill=tk.X, padx=15, pady=5)
-                
-                module_label = tk.Label(module_frame, text=f"📍 Module: {threat['module']}", 
-                                       font=('Arial', 9), bg=bg_color, fg='#7f8c8d')
-                module_label.pack(anchor=tk.W)
+                card['module_label'].config(text=f"📍 Module: {threat['module']}", bg=bg_color)
+                card['module_frame'].pack(fill=tk.X, padx=15, pady=5)
             
             # Recommendation
             if threat.get('recommendation'):
-                rec_frame = tk.Frame(inner, bg='white')
-                rec_frame.pack(fill=tk.X, padx=15, pady=(10, 15))
-                
-                rec_title = tk.Label(rec_frame, text="💡 Recommendation:", 
-                                    font=('Arial', 9, 'bold'), bg='white', fg='#2c3e50')
-                rec_title.pack(anchor=tk.W, padx=10, pady=(8, 2))
-                
-                rec_text = tk.Label(rec_frame, text=threat['recommendation'], 
-                                   font=('Arial', 9), bg='white', fg='#34495e', 
-                                   wraplength=650, justify=tk.LEFT)
-                rec_text.pack(anchor=tk.W, padx=10, pady=(0, 8))
+                card['rec_text'].config(text=threat['recommendation'])
+                card['rec_frame'].pack(fill=tk.X, padx=15, pady=(10, 15))
+            
+            card['card'].pack(fill=tk.X, padx=10, pady=8)
+    
+    def _create_threat_card(self):
+        """Create the widgets of one (pooled) threat card, returned by name and left unpacked"""
+        card = tk.Frame(self.security_cards_frame, relief=tk.RAISED, borderwidth=2)
+        
+        inner = tk.Frame(card)
+        inner.pack(fill=tk.BOTH, expand=True, padx=2, pady=2)
+        
+        # Header with severity and icon
+        header_frame = tk.Frame(inner)
+        header_frame.pack(fill=tk.X, padx=15, pady=(10, 5))
+        
+        icon_label = tk.Label(header_frame, font=('Segoe UI Emoji', 16), width=2)
+        icon_label.pack(side=tk.LEFT, padx=(0, 10))
+        
+        severity_label = tk.Label(header_frame, font=('Arial', 11, 'bold'))
+        severity_label.pack(side=tk.LEFT)
+        
+        # Threat type
+        type_frame = tk.Frame(inner)
+        type_frame.pack(fill=tk.X, padx=15, pady=5)
+        
+        type_label = tk.Label(type_frame, font=('Arial', 10, 'bold'), fg='#2c3e50')
+        type_label.pack(anchor=tk.W)
+        
+        # Description
+        desc_frame = tk.Frame(inner)
+        desc_frame.pack(fill=tk.X, padx=15, pady=5)
+        
+        desc_label = tk.Label(desc_frame, font=('Arial', 10), fg='#34495e',
+                              wraplength=700, justify=tk.LEFT)
+        desc_label.pack(anchor=tk.W)
+        
+        # Module info (packed per threat)
+        module_frame = tk.Frame(inner)
+        module_label = tk.Label(module_frame, font=('Arial', 9), fg='#7f8c8d')
+        module_label.pack(anchor=tk.W)
+        
+        # Recommendation (packed per threat)
+        rec_frame = tk.Frame(inner, bg='white')
+        rec_title = tk.Label(rec_frame, text="💡 Recommendation:",
+                             font=('Arial', 9, 'bold'), bg='white', fg='#2c3e50')
+        rec_title.pack(anchor=tk.W, padx=10, pady=(8, 2))
+        
+        rec_text = tk.Label(rec_frame, font=('Arial', 9), bg='white', fg='#34495e',
+                            wraplength=650, justify=tk.LEFT)
+        rec_text.pack(anchor=tk.W, padx=10, pady=(0, 8))
+        
+        return {
+            'card': card, 'inner': inner, 'header_frame': header_frame,
+            'icon_label': icon_label, 'severity_label': severity_label,
+            'type_frame': type_frame, 'type_label': type_label,
+            'desc_frame': desc_frame, 'desc_label': desc_label,
+            'module_frame': module_frame, 'module_label': module_label,
+            'rec_frame': rec_frame, 'rec_text': rec_text,
+        }
+    
+    def _create_severity_chart_items(self, canvas):
+        """Create the chart's canvas items once - redraws only move and relabel them"""
+        bar_width = _CHART_BAR_WIDTH
+        items = {'bars': [], 'counts': []}
+        
+        for idx, (severity, color) in enumerate(_CHART_SEVERITIES):
+            x = 40 + idx * bar_width
+            
+            # Bar and count on top (positioned on each redraw)
+            items['bars'].append(canvas.create_rectangle(
+                x, 90, x + bar_width - 10, 90,
+                fill=color, outline=color, width=2, tags='severity_chart'))
+            items['counts'].append(canvas.create_text(
+                x + (bar_width - 10) // 2, 80,
+                text='0', font=('Arial', 10, 'bold'), fill=color, tags='severity_chart'))
+            
+            # Label below never changes
+            canvas.create_text(x + (bar_width - 10) // 2, 105,
+                               text=severity[:4], font=('Arial', 8), fill='#2c3e50', tags='severity_chart')
+        
+        items['no_data'] = canvas.create_text(200, 60, text="No data", font=('Arial', 10),
+                                              fill='#7f8c8d', state=tk.HIDDEN)
+        return items
     
     def _draw_severity_chart(self, severity_stats):
         """Draw a simple bar chart for severity breakdown"""
         canvas = self.severity_canvas
-        canvas.delete("all")
+        items = self._chart_items
+        if items is None:
+            items = self._chart_items = self._create_severity_chart_items(canvas)
         
         if not severity_stats:
-            canvas.create_text(200, 60, 
-                             text="No data", font=('Arial', 10), fill='#7f8c8d')
+            canvas.itemconfig('severity_chart', state=tk.HIDDEN)
+            canvas.itemconfig(items['no_data'], state=tk.NORMAL)
             return
-        
-        severities = ['CRITICAL', 'HIGH', 'MEDIUM', 'LOW']
-        colors = ['#e74c3c', '#e67e22', '#f39c12', '#27ae60']
+        canvas.itemconfig(items['no_data'], state=tk.HIDDEN)
+        canvas.itemconfig('severity_chart', state=tk.NORMAL)
         
         # Get max value for scaling
         max_val = max(severity_stats.values()) if severity_stats.values() else 1
         
-        # Draw bars
-        width = 400
-        bar_width = (width - 80) // len(severities)
+        # Resize bars
+        bar_width = _CHART_BAR_WIDTH
         
-        for idx, (severity, color) in enumerate(zip(severities, colors)):
+        for idx, (severity, _color) in enumerate(_CHART_SEVERITIES):
             count = severity_stats.get(severity, 0)
             if max_val > 0:
                 bar_height = (count / max_val) * 80
@@ -3052,24 +3917,26 @@ Overall Success Rate: {summary.get('overall_success_rate', 0) * 100:.1f}%"""
             x = 40 + idx * bar_width
             y = 90 - bar_height
             
-            # Draw bar
-            canvas.create_rectangle(x, y, x + bar_width - 10, 90, 
-                                   fill=color, outline=color, width=2)
-            
-            # Draw count on top
-            canvas.create_text(x + (bar_width - 10) // 2, y - 10, 
-                             text=str(count), font=('Arial', 10, 'bold'), fill=color)
-            
-            # Draw label below
-            canvas.create_text(x + (bar_width - 10) // 2, 105, 
-                             text=severity[:4], font=('Arial', 8), fill='#2c3e50')
+            canvas.coords(items['bars'][idx], x, y, x + bar_width - 10, 90)
+            canvas.coords(items['counts'][idx], x + (bar_width - 10) // 2, y - 10)
+            canvas.itemconfig(items['counts'][idx], text=str(count))
     
     def _display_fdrs(self):
         """Display FDRS analysis results"""
+        if 'fdrs' not in self._tab_built:
+            return
+        
+        # Same analysis as the views already on screen - nothing to rebuild
+        shown = self._shown_fdrs
+        if shown and shown[0] is self.fdrs_analysis and shown[1] is self.fdrs_detailed:
+            return
+        self._shown_fdrs = (self.fdrs_analysis, self.fdrs_detailed)
+        
         if not self.fdrs_analysis:
             # Clear FDRS displays and show welcome message
             self._clear_fdrs_displays()
             return
+        self._fdrs_placeholders_shown = False
         
         # Update FDRS metrics cards
         system_info = self.fdrs_analysis.get('system_info')
@@ -3089,16 +3956,11 @@ Overall Success Rate: {summary.get('overall_success_rate', 0) * 100:.1f}%"""
         self.fdrs_system_text.delete('1.0', tk.END)
         
         if system_info:
-            sys_text = f"""🔧 FDRS System Information
-────────────────────────────────
-Version: {system_info.fdrs_version}
-Server: {system_info.fdsp_server_url}
-Dependency Modules: {len(system_info.dependencies)}
-
-📦 Key Dependencies:
-"""
-            for module, version in system_info.dependencies.items():
-                sys_text += f"  • {module}: {version}\n"
+            sys_text = _FDRS_SYSTEM_TEMPLATE.format(
+                version=system_info.fdrs_version,
+                server=system_info.fdsp_server_url,
+                dependency_count=len(system_info.dependencies),
+            ) + ''.join(f"  • {module}: {version}\n" for module, version in system_info.dependencies.items())
         else:
             sys_text = "No FDRS system information found in log"
         
@@ -3114,32 +3976,39 @@ Dependency Modules: {len(system_info.dependencies)}
             latest = comm_analysis.get('latest_communication', {})
             read_did = comm_analysis.get('read_did_analysis', {})
             
-            comm_text = f"""📡 UDS Communication Analysis
-────────────────────────────────
-Latest Communication:
-  Service: {latest.get('service', 'Unknown')}
-  Status: {latest.get('status', 'Unknown')}
-  Time: {latest.get('timestamp', 'Unknown')}
-  Error: {latest.get('nrc_error', 'None')}
-
-Read DID (0x22) Analysis:
-  Total Attempts: {read_did.get('total_attempts', 0)}
-  Failed Attempts: {read_did.get('failed_attempts', 0)}
-  Success Rate: {read_did.get('success_rate', 0):.1f}%
-"""
+            comm_text = _FDRS_COMM_TEMPLATE.format(
+                service=latest.get('service', 'Unknown'),
+                status=latest.get('status', 'Unknown'),
+                timestamp=latest.get('timestamp', 'Unknown'),
+                nrc_error=latest.get('nrc_error', 'None'),
+                total_attempts=read_did.get('total_attempts', 0),
+                failed_attempts=read_did.get('failed_attempts', 0),
+                success_rate=read_did.get('success_rate', 0),
+            )
         else:
             comm_text = "No detailed communication analysis available"
         
         self.fdrs_comm_text.insert('1.0', comm_text)
         self.fdrs_comm_text.config(state=tk.DISABLED)
         
-        # Update detailed analysis tabs
-        self._update_fdrs_services_tab()
-        self._update_fdrs_errors_tab()
-        self._update_fdrs_recommendations_tab()
+        # Update detailed analysis tabs - only the visible one now, the others when selected
+        self._fdrs_dirty = set(self._fdrs_subtab_updaters)
+        self._refresh_fdrs_subtab()
+    
+    def _on_fdrs_tab_changed(self, event):
+        """Render an FDRS detail sub-tab the first time it is shown for the current analysis"""
+        self._refresh_fdrs_subtab()
+    
+    def _refresh_fdrs_subtab(self):
+        """Update the selected FDRS detail sub-tab if it is out of date"""
+        tab = self.fdrs_notebook.select()
+        if tab in self._fdrs_dirty:
+            self._fdrs_dirty.discard(tab)
+            self._fdrs_subtab_updaters[tab]()
     
     def _update_fdrs_services_tab(self):
         """Update the diagnostic services tab"""
+        self._detach_services_view()
         self.fdrs_services_text.config(state=tk.NORMAL)
         self.fdrs_services_text.delete('1.0', tk.END)
         
@@ -3154,27 +4023,46 @@ Read DID (0x22) Analysis:
             self.fdrs_services_text.config(state=tk.DISABLED)
             return
         
-        services_text = "🔍 UDS Diagnostic Services Detected\n"
-        services_text += "═" * 60 + "\n\n"
+        # Collected as lines and joined once - the text grows linearly with the services
+        lines = ["🔍 UDS Diagnostic Services Detected", "═" * 60, ""]
         
+        # Services logged in the same second share one strftime() call
+        time_strings = {}
         for i, service in enumerate(services, 1):
             status_icon = "✅" if service.status == "SUCCESS" else "❌"
-            services_text += f"{status_icon} Service #{i}\n"
-            services_text += f"  Code: 0x{service.service_code}\n"
-            services_text += f"  Name: {service.service_name}\n"
-            services_text += f"  Status: {service.status}\n"
-            services_text += f"  Request: {service.request_data}\n"
-            services_text += f"  Response: {service.response_data}\n"
-            services_text += f"  Time: {service.timestamp.strftime('%H:%M:%S')}\n"
+            ts = service.timestamp
+            second = (ts.hour, ts.minute, ts.second)
+            time_str = time_strings.get(second)
+            if time_str is None:
+                time_str = time_strings[second] = ts.strftime('%H:%M:%S')
+            lines.extend((
+                f"{status_icon} Service #{i}",
+                f"  Code: 0x{service.service_code}",
+                f"  Name: {service.service_name}",
+                f"  Status: {service.status}",
+                f"  Request: {service.request_data}",
+                f"  Response: {service.response_data}",
+                f"  Time: {time_str}",
+            ))
             
             if service.nrc_code:
-                services_text += f"  NRC: 0x{service.nrc_code} - {service.nrc_description}\n"
+                lines.append(f"  NRC: 0x{service.nrc_code} - {service.nrc_description}")
             
-            services_text += "\n" + "─" * 60 + "\n\n"
+            lines.extend(("", "─" * 60, ""))
         
-        self.fdrs_services_text.insert('1.0', services_text)
+        if len(services) > _VIRTUAL_SERVICES_THRESHOLD:
+            # Long service lists only keep the visible lines in the widget
+            self._services_view = VirtualTextView(self.fdrs_services_text, [(None, line) for line in lines])
+        else:
+            self.fdrs_services_text.insert('1.0', '\n'.join(lines) + '\n')
         self.fdrs_services_text.config(state=tk.DISABLED)
     
+    def _detach_services_view(self):
+        """Return the services tab to a plain text widget"""
+        if self._services_view is not None:
+            self._services_view.detach()
+            self._services_view = None
+    
     def _update_fdrs_errors_tab(self):
         """Update the error analysis tab"""
         self.fdrs_errors_text.config(state=tk.NORMAL)
@@ -3191,17 +4079,20 @@ Read DID (0x22) Analysis:
             errors_text = "✅ No errors detected in FDRS log!\n\n"
             errors_text += "All diagnostic communications completed successfully."
         else:
-            errors_text = "⚠️ Error Analysis\n"
-            errors_text += "═" * 40 + "\n\n"
-            
-            errors_text += f"Total Errors: {error_analysis.get('total_errors', 0)}\n"
-            errors_text += f"NRC 31 Errors: {error_analysis.get('nrc_31_errors', 0)}\n\n"
-            
-            errors_text += "Error Breakdown by NRC Code:\n"
-            errors_text += "─" * 30 + "\n"
+            parts = [
+                "⚠️ Error Analysis\n",
+                "═" * 40 + "\n\n",
+                f"Total Errors: {error_analysis.get('total_errors', 0)}\n",
+                f"NRC 31 Errors: {error_analysis.get('nrc_31_errors', 0)}\n\n",
+                "Error Breakdown by NRC Code:\n",
+                "─" * 30 + "\n",
+            ]
             
-            for nrc, count in error_analysis.get('error_breakdown', {}).items():
-                errors_text += f"  NRC {nrc}: {count} occurrences\n"
+            # Most frequent NRC first; ties keep the analyzer's order
+            breakdown = sorted(error_analysis.get('error_breakdown', {}).items(),
+                               key=lambda item: item[1], reverse=True)
+            parts.extend(f"  NRC {nrc}: {count} occurrences\n" for nrc, count in breakdown)
+            errors_text = ''.join(parts)
         
         self.fdrs_errors_text.insert('1.0', errors_text)
         self.fdrs_errors_text.config(state=tk.DISABLED)
@@ -3218,28 +4109,27 @@ Read DID (0x22) Analysis:
         
         recommendations = self.fdrs_detailed.get('recommendations', [])
         
-        rec_text = "💡 FDRS Troubleshooting Recommendations\n"
-        rec_text += "═" * 50 + "\n\n"
+        parts = ["💡 FDRS Troubleshooting Recommendations\n", "═" * 50 + "\n\n"]
         
         if recommendations:
             for rec in recommendations:
-                rec_text += rec + "\n\n"
+                parts.append(rec + "\n\n")
         else:
-            rec_text += "✅ No specific recommendations - system appears healthy!"
+            parts.append("✅ No specific recommendations - system appears healthy!")
         
-        rec_text += "\n" + "─" * 50 + "\n\n"
-        rec_text += "📋 General FDRS Best Practices:\n\n"
-        rec_text += "• Ensure stable 12V power supply during diagnostics\n"
-        rec_text += "• Verify ECU is in proper diagnostic session\n"
-        rec_text += "• Check CAN bus communication quality\n"
-        rec_text += "• Use appropriate security access credentials\n"
-        rec_text += "• Allow sufficient time delays between operations\n"
+        parts.append(_FDRS_BEST_PRACTICES)
+        rec_text = ''.join(parts)
         
         self.fdrs_recommendations_text.insert('1.0', rec_text)
         self.fdrs_recommendations_text.config(state=tk.DISABLED)
     
     def _clear_fdrs_displays(self):
         """Clear FDRS displays and show welcome message"""
+        # Nothing was rendered over the placeholders since they were last put up
+        if self._fdrs_placeholders_shown:
+            return
+        self._fdrs_placeholders_shown = True
+        
         # Reset metrics
         for metric in self.fdrs_metrics.values():
             metric.config(text="N/A")
@@ -3255,6 +4145,8 @@ Read DID (0x22) Analysis:
         self.fdrs_comm_text.config(state=tk.DISABLED)
         
         # Clear detailed tabs
+        self._fdrs_dirty.clear()
+        self._detach_services_view()
         for text_widget in [self.fdrs_services_text, self.fdrs_errors_text, self.fdrs_recommendations_text]:
             text_widget.config(state=tk.NORMAL)
             text_widget.delete('1.0', tk.END)
@@ -3269,7 +4161,8 @@ Read DID (0x22) Analysis:
     def _clear_results(self):
         """Clear all results"""
         self.results_text.delete('1.0', tk.END)
-        self.current_results = []
+        self.current_results = self._all_results = []
+        self._results_version += 1
         self.file_path.set('')
         self.status.set("Results cleared")
         # Hide NRC 7F alert when clearing
@@ -3288,8 +4181,9 @@ Read DID (0x22) Analysis:
         
         if filename:
             try:
-                with open(filename, 'w') as f:
-                    json.dump(self.current_results, f, indent=2)
+                # Encoded in one go and written with a single call
+                with open(filename, 'wb') as f:
+                    f.write(_json_export_bytes(self.current_results))
                 self.status.set(f"Exported to {filename}")
                 messagebox.showinfo("Success", f"Results exported to:\n{filename}")
             except Exception as e:
@@ -3308,8 +4202,13 @@ Read DID (0x22) Analysis:
         
         if filename:
             try:
-                with open(filename, 'w') as f:
-                    f.write(self.results_text.get('1.0', tk.END))
+                # Copy the widget out in line blocks through a large write buffer, so
+                # the whole view is never held as one Python string
+                text = self.results_text
+                last_line = int(text.index(tk.END).split('.')[0])
+                with open(filename, 'w', buffering=_EXPORT_BUFFER_SIZE) as f:
+                    for line in range(1, last_line, _EXPORT_LINES_PER_BLOCK):
+                        f.write(text.get(f'{line}.0', f'{line + _EXPORT_LINES_PER_BLOCK}.0'))
                 self.status.set(f"Exported to {filename}")
                 messagebox.showinfo("Success", f"Results exported to:\n{filename}")
             except Exception as e:
@@ -3323,12 +4222,14 @@ Read DID (0x22) Analysis:
         
         self.hex_output.delete('1.0', tk.END)
         
+        pieces = []
         for hex_val in hex_values.split():
             try:
                 explanation = HexExplainer.explain_byte(hex_val)
-                self.hex_output.insert(tk.END, f"{hex_val}:\n{explanation}\n\n")
+                pieces.append(f"{hex_val}:\n{explanation}\n\n")
             except Exception as e:
-                self.hex_output.insert(tk.END, f"{hex_val}: Error - {str(e)}\n\n")
+                pieces.append(f"{hex_val}: Error - {str(e)}\n\n")
+        self.hex_output.insert(tk.END, ''.join(pieces))
     
     def _explain_nrc(self):
         """Explain NRC code"""
@@ -3339,26 +4240,42 @@ Read DID (0x22) Analysis:
         self.nrc_output.delete('1.0', tk.END)
         
         try:
-            explanation = NRCCodeExplainer.explain_code(nrc_code)
-            self.nrc_output.insert(tk.END, f"NRC Code: {nrc_code}\n\n")
-            self.nrc_output.insert(tk.END, f"Explanation:\n{explanation}\n")
+            explanation = NRCCodeExplainer.explain(nrc_code)
+            self.nrc_output.insert(tk.END, f"NRC Code: {nrc_code}\n\nExplanation:\n{explanation}\n")
         except Exception as e:
             self.nrc_output.insert(tk.END, f"Error: {str(e)}\n")
     
     def _show_filter_panel(self):
         """Show smart filter panel with AI-powered suggestions"""
         if SMART_FILTER_AVAILABLE and self.smart_filter:
-            SmartFilterPanel(self.root, self.smart_filter, self._apply_smart_filter)
+            # The panel is built once and only hidden on close
+            panel = self._smart_filter_panel
+            if panel is not None and panel.window.winfo_exists():
+                panel.show()
+            else:
+                self._smart_filter_panel = SmartFilterPanel(self.root, self.smart_filter,
+                                                            self._apply_smart_filter)
         else:
             # Fallback to old filter panel
             FilterPanel(self.root, self.config, self._apply_advanced_filters)
     
     def _apply_advanced_filters(self, filters):
-        """Apply advanced filters and re-parse"""
-        self.status.set("Applying advanced filters...")
-        # Reparse with new filters if needed
-        if self.current_filepath:
-            self._parse_log()
+        """Apply advanced filters to the parsed results already in memory"""
+        if not self._all_results:
+            return
+        
+        # Only levels the panel offers can be hidden; results without a severity
+        # (XML matches) or with other levels (SUCCESS, DEBUG, ...) always stay
+        hidden = _ADVANCED_FILTER_SEVERITIES.difference(filters.get('severity_levels') or ())
+        if hidden:
+            self.current_results = [r for r in self._all_results if r.get('severity') not in hidden]
+        else:
+            self.current_results = self._all_results
+        self._results_version += 1
+        
+        self._schedule_render('results', self._display_results)
+        self.status.set(f"Advanced filters: showing {len(self.current_results):,} of "
+                        f"{len(self._all_results):,} items")
     
     def _apply_smart_filter(self, keywords):
         """Apply smart filter to current results"""
@@ -3368,30 +4285,35 @@ Read DID (0x22) Analysis:
         self.active_filter_keywords = keywords
         self.status.set(f"Filtering by: {', '.join(keywords)}")
         
-        # Get current content
-        current_content = self.result_text.get('1.0', tk.END)
+        # Filter the unfiltered report text kept from the last render - no round trip
+        # of the whole widget buffer through Tcl
+        current_content = self._raw_results_content()
         
-        # Apply filter
-        filtered_content, match_count = self.smart_filter.apply_filter(current_content, keywords)
+        # Apply filter - one compiled pattern serves the line filter and the highlights
+        pattern = self.smart_filter.compile(keywords)
+        filtered_content, match_count = self.smart_filter.apply_filter(current_content, keywords,
+                                                                       pattern=pattern)
         
         # Update display
-        self.result_text.config(state=tk.NORMAL)
-        self.result_text.delete('1.0', tk.END)
+        with self._bulk_text_update(self.results_text):
+            self.results_text.delete('1.0', tk.END)
         
-        if match_count > 0:
-            self.result_text.insert(tk.END, f"🔍 Filter Results: {match_count} matches for [{', '.join(keywords)}]\n\n", "header")
-            self.result_text.insert(tk.END, filtered_content)
+            if match_count > 0:
+                self.results_text.insert(tk.END, f"🔍 Filter Results: {match_count} matches for [{', '.join(keywords)}]\n\n", "header",
+                                         filtered_content, '')
             
-            # Highlight matches
-            matches = self.smart_filter.highlight_matches(filtered_content, keywords)
-            for start, end, keyword in matches:
-                # Convert positions to line.column format
-                self.result_text.tag_add("highlight", f"3.0+{start}c", f"3.0+{end}c")
-        else:
-            self.result_text.insert(tk.END, f"🔍 No matches found for: {', '.join(keywords)}\n\n", "warning")
-            self.result_text.insert(tk.END, "Try adjusting your filter keywords or using suggested presets.", "info")
+                # Highlight matches - all ranges go to Tk in one tag add call
+                ranges = []
+                for start, end, keyword in self.smart_filter.highlight_matches(filtered_content, keywords,
+                                                                               pattern=pattern):
+                    # Convert positions to line.column format
+                    ranges += (f"3.0+{start}c", f"3.0+{end}c")
+                if ranges:
+                    self.results_text.tag_add("highlight", *ranges)
+            else:
+                self.results_text.insert(tk.END, f"🔍 No matches found for: {', '.join(keywords)}\n\n", "warning",
+                                         "Try adjusting your filter keywords or using suggested presets.", "info")
         
-        self.result_text.config(state=tk.DISABLED)
         self.status.set(f"Filter applied: {match_count} matches")
         
         # Add to history
@@ -3426,33 +4348,30 @@ Read DID (0x22) Analysis:
         self.status.set("Comparing logs...")
         
         try:
-            # Parse both files
-            if file1.lower().endswith('.xml'):
-                results1 = self.xml_parser.parse_file(file1)
-            else:
-                results1 = self.text_parser.parse_file(file1, [k.strip() for k in self.filters.get().split(',')])
-            
-            if file2.lower().endswith('.xml'):
-                results2 = self.xml_parser.parse_file(file2)
-            else:
-                results2 = self.text_parser.parse_file(file2, [k.strip() for k in self.filters.get().split(',')])
+            # Parse both files concurrently; the parsers keep per-parse state on the
+            # instance, so the second file gets its own pair
+            filters = self._filter_keywords()
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                future1 = pool.submit(self._parse_compare_file, file1, filters,
+                                      self.xml_parser, self.text_parser)
+                future2 = pool.submit(self._parse_compare_file, file2, filters,
+                                      XMLLogParser(), TextLogParser())
+                results1, results2 = future1.result(), future2.result()
             
             # Compare
             comparison = self.comparator.compare_logs(results1, results2)
             
+            # Format each pane fully before touching the widgets, then one insert per pane
+            left_body = self._format_compare_pane(
+                1, comparison['unique_to_log1_count'], comparison['unique_to_log1'])
+            right_body = self._format_compare_pane(
+                2, comparison['unique_to_log2_count'], comparison['unique_to_log2'])
+            
             # Display results
             self.compare_left.delete('1.0', tk.END)
+            self.compare_left.insert(tk.END, left_body)
             self.compare_right.delete('1.0', tk.END)
-            
-            # Unique to file 1
-            self.compare_left.insert(tk.END, f"=== UNIQUE TO FILE 1 ({comparison['unique_to_log1_count']} items) ===\n\n")
-            for item in comparison['unique_to_log1'][:50]:
-                self.compare_left.insert(tk.END, f"{item}\n\n")
-            
-            # Unique to file 2
-            self.compare_right.insert(tk.END, f"=== UNIQUE TO FILE 2 ({comparison['unique_to_log2_count']} items) ===\n\n")
-            for item in comparison['unique_to_log2'][:50]:
-                self.compare_right.insert(tk.END, f"{item}\n\n")
+            self.compare_right.insert(tk.END, right_body)
             
             self.status.set(f"Comparison complete: {comparison['common_count']} common, "
                           f"{comparison['unique_to_log1_count']} unique to file 1, "
@@ -3462,23 +4381,49 @@ Read DID (0x22) Analysis:
             messagebox.showerror("Comparison Error", f"Error comparing logs: {str(e)}")
             self.status.set("Comparison failed")
     
+    def _filter_keywords(self):
+        """Keywords from the filter entry, split only when the entry text changes"""
+        raw = self.filters.get()
+        cached = self._filter_keywords_cache
+        if cached is None or cached[0] != raw:
+            cached = self._filter_keywords_cache = (raw, [k.strip() for k in raw.split(',')])
+        return list(cached[1])
+    
+    @staticmethod
+    def _format_compare_pane(file_number, count, items):
+        """Text for one comparison pane: header plus the first 50 unique items"""
+        parts = [f"=== UNIQUE TO FILE {file_number} ({count} items) ===\n\n"]
+        parts.extend(f"{item}\n\n" for item in items[:50])
+        return ''.join(parts)
+    
+    @staticmethod
+    def _parse_compare_file(path, filters, xml_parser, text_parser):
+        """Parse one side of a comparison with the given parser pair"""
+        if path.lower().endswith('.xml'):
+            return xml_parser.parse_file(path)
+        return text_parser.parse_file(path, filters)
+    
     def _refresh_history(self):
         """Refresh history list"""
-        # Clear existing
-        for item in self.history_tree.get_children():
-            self.history_tree.delete(item)
+        if 'history' not in self._tab_built:
+            return
         
         # Load recent logs
         logs = self.db.get_recent_logs(50)
         
-        for log in logs:
-            self.history_tree.insert('', tk.END, text=str(log['id']), values=(
-                log['parse_date'],
-                log['filename'],
-                log['total_errors'],
-                log['total_successes'],
-                log.get('root_cause_type', '')
-            ))
+        self._populate_history([
+            (str(log['id']), (log['parse_date'], log['filename'], log['total_errors'],
+                              log['total_successes'], log.get('root_cause_type', '')))
+            for log in logs
+        ])
+    
+    def _populate_history(self, rows):
+        """Replace the history tree's rows with (id_text, values) pairs in one pass"""
+        tree = self.history_tree
+        tree.delete(*tree.get_children())
+        insert, end = tree.insert, tk.END
+        for text, values in rows:
+            insert('', end, text=text, values=values)
     
     def _view_history_details(self, event):
         """View details of a history item"""
@@ -3501,21 +4446,29 @@ Read DID (0x22) Analysis:
             text = scrolledtext.ScrolledText(detail_win, wrap=tk.WORD)
             text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
             
-            text.insert(tk.END, f"=== LOG SESSION {log_id} ===\n\n")
-            text.insert(tk.END, f"Filename: {details['filename']}\n")
-            text.insert(tk.END, f"Parse Date: {details['parse_date']}\n")
-            text.insert(tk.END, f"File Type: {details['file_type']}\n")
-            text.insert(tk.END, f"Total Errors: {details['total_errors']}\n")
-            text.insert(tk.END, f"Total Successes: {details['total_successes']}\n")
-            text.insert(tk.END, f"Root Cause: {details.get('root_cause_type', 'N/A')}\n\n")
+            # Collected and inserted with one Tk call
+            parts = [
+                f"=== LOG SESSION {log_id} ===\n\n",
+                f"Filename: {details['filename']}\n",
+                f"Parse Date: {details['parse_date']}\n",
+                f"File Type: {details['file_type']}\n",
+                f"Total Errors: {details['total_errors']}\n",
+                f"Total Successes: {details['total_successes']}\n",
+                f"Root Cause: {details.get('root_cause_type', 'N/A')}\n\n",
+            ]
             
             if details.get('errors'):
-                text.insert(tk.END, f"=== ERRORS ({len(details['errors'])}) ===\n\n")
+                parts.append(f"=== ERRORS ({len(details['errors'])}) ===\n\n")
                 for error in details['errors'][:20]:
-                    text.insert(tk.END, f"Line {error['line_number']}: {error['description'][:100]}\n\n")
+                    parts.append(f"Line {error['line_number']}: {error['description'][:100]}\n\n")
+            
+            text.insert(tk.END, ''.join(parts))
     
     def _search_history(self):
         """Search history"""
+        if 'history' not in self._tab_built:
+            return
+        
         query = self.history_search.get()
         if not query:
             self._refresh_history()
@@ -3524,17 +4477,10 @@ Read DID (0x22) Analysis:
         results = self.db.search_logs(query, 'filename')
         
         # Clear and populate
-        for item in self.history_tree.get_children():
-            self.history_tree.delete(item)
-        
-        for log in results:
-            self.history_tree.insert('', tk.END, text=str(log['id']), values=(
-                log['parse_date'],
-                log['filename'],
-                log['total_errors'],
-                '',
-                ''
-            ))
+        self._populate_history([
+            (str(log['id']), (log['parse_date'], log['filename'], log['total_errors'], '', ''))
+            for log in results
+        ])
     
     def _show_db_stats(self):
         """Show database statistics"""
@@ -3584,13 +4530,21 @@ Read DID (0x22) Analysis:
         def do_find():
             query = search_var.get()
             if query:
-                # Search in results text
-                start_pos = self.results_text.search(query, '1.0', tk.END, nocase=True)
-                if start_pos:
-                    end_pos = f"{start_pos}+{len(query)}c"
-                    self.results_text.tag_remove('highlight', '1.0', tk.END)
-                    self.results_text.tag_add('highlight', start_pos, end_pos)
-                    self.results_text.see(start_pos)
+                # Every match in one Tcl 'search -all' call (tkinter's search() only
+                # finds the first); literal matches are all len(query) characters long
+                text = self.results_text
+                starts = text.tk.splitlist(text.tk.call(
+                    text._w, 'search', '-all', '-nocase', '--', query, '1.0', tk.END))
+                if starts:
+                    length = len(query)
+                    ranges = []
+                    for start_pos in starts:
+                        ranges.append(start_pos)
+                        ranges.append(f"{start_pos}+{length}c")
+                    text.tag_remove('highlight', '1.0', tk.END)
+                    text.tag_add('highlight', *ranges)
+                    text.see(starts[0])
+                    self.status.set(f"Found {len(starts):,} matches for '{query}'")
                     dialog.destroy()
                 else:
                     messagebox.showinfo("Not Found", f"'{query}' not found.")
@@ -3622,10 +4576,9 @@ Tools Menu: Advanced filters, database tools
             import subprocess
             import sys
             
-            # Path to the professional analyzer
-            professional_analyzer_path = os.path.join(os.path.dirname(__file__), "professional_diagnostic_analyzer.py")
+            professional_analyzer_path = _PROFESSIONAL_ANALYZER_PATH
             
-            if os.path.exists(professional_analyzer_path):
+            if os.path.isfile(professional_analyzer_path):
                 # Launch the professional analyzer as a separate process
                 if sys.platform.startswith('win'):
                     # Windows
@@ -3756,9 +4709,18 @@ Created with ❤️ for automotive diagnostics
                 'x': self.root.winfo_x(),
                 'y': self.root.winfo_y()
             }
-            self.config.save_window_geometry(geometry)
+            # Write the file off the UI thread so the window closes right away; not a
+            # daemon thread, so interpreter exit still waits for the write to finish
+            threading.Thread(target=self.config.save_window_geometry, kwargs=geometry,
+                             name="save-geometry").start()
         except:
             pass
+        
+        # Let the DB writer store the sessions still queued; the daemon thread would
+        # otherwise be killed mid-queue (or mid-write) at interpreter exit
+        self._db_writer_closing = True
+        self._db_writer_queue.put(None)
+        self._db_writer_thread.join(timeout=_DB_WRITER_JOIN_TIMEOUT)
             
         # Close application
         self.root.quit()  # Stop the mainloop first
@@ -3776,80 +4738,67 @@ Created with ❤️ for automotive diagnostics
             self.progress_dialog = None
     
     def _parse_xml_with_performance(self, filepath):
-        """Performance-enhanced XML parsing for large files"""
-        def xml_chunk_parser(chunk_data):
-            """Parse a chunk of XML data"""
-            chunk_results = []
-            for line_data in chunk_data:
-                line = line_data['content']
-                # Simple XML tag extraction for performance
-                if any(keyword in line.lower() for keyword in ['error', 'fail', 'success', 'warning']):
-                    chunk_results.append({
-                        'line_number': line_data['line_number'],
-                        'content': line,
-                        'timestamp': 'unknown',
-                        'severity': self._detect_severity(line)
-                    })
-            return chunk_results
+        """Performance-enhanced XML parsing for large files
         
-        # Use performance manager for chunked processing
-        result = self.performance.parse_file_chunked(filepath, xml_chunk_parser, chunk_lines=500)
-        return result.get('results', []) if isinstance(result, dict) else []
+        Streams the document with iterparse so memory stays bounded by the open
+        element branch instead of the whole tree, with the same results as parse_file.
+        """
+        return self.xml_parser.iterparse_file(
+            filepath, progress_callback=self.performance.progress_callback
+        )
     
     def _parse_text_with_performance(self, filepath, keywords):
         """Performance-enhanced text parsing for large files"""
+        # Keyword filter and severity come from one matcher over the line, lowered once
+        match_line = _build_line_matcher(keywords)
+        
         def text_chunk_parser(chunk_data):
             """Parse a chunk of text data"""
             chunk_results = []
             for line_data in chunk_data:
                 line = line_data['content']
                 # Check if line contains any keywords
-                if any(keyword.lower() in line.lower() for keyword in keywords if keyword.strip()):
+                severity = match_line(line.lower())
+                if severity is not None:
                     chunk_results.append({
                         'line_number': line_data['line_number'],
                         'content': line,
                         'timestamp': self._extract_timestamp(line),
-                        'severity': self._detect_severity(line)
+                        'severity': severity
                     })
             return chunk_results
         
-        # Use performance manager for chunked processing
-        result = self.performance.parse_file_chunked(filepath, text_chunk_parser, chunk_lines=1000)
+        # Use performance manager for chunked processing, chunk size scaled to the file
+        try:
+            size = os.path.getsize(filepath)
+        except OSError:
+            size = 0
+        chunk_lines = max(_CHUNK_LINES_MIN, min(_CHUNK_LINES_MAX, size // _CHUNK_BYTES_PER_LINE))
+        result = self.performance.parse_file_chunked(filepath, text_chunk_parser, chunk_lines=chunk_lines)
         return result.get('results', []) if isinstance(result, dict) else []
     
-    def _detect_severity(self, line):
-        """Quick severity detection for performance parsing"""
-        line_lower = line.lower()
-        if any(word in line_lower for word in ['error', 'critical', 'fatal', 'exception']):
-            return 'ERROR'
-        elif any(word in line_lower for word in ['warning', 'warn', 'caution']):
-            return 'WARNING'
-        elif any(word in line_lower for word in ['success', 'pass', 'ok', 'complete']):
-            return 'SUCCESS'
-        else:
-            return 'INFO'
-    
     def _extract_timestamp(self, line):
         """Quick timestamp extraction for performance parsing"""
-        import re
-        # Look for common timestamp patterns
-        patterns = [
-            r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}',
-            r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}',
-            r'\d{2}:\d{2}:\d{2}'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, line)
+        # Every format contains hh:mm:ss, so lines without one are settled by one scan
+        time_match = _PERF_TIME_RX.search(line)
+        if not time_match:
+            return 'unknown'
+        
+        # Look for full date-time patterns first, then fall back to the bare time
+        for rx in _PERF_DATETIME_PATTERNS:
+            match = rx.search(line)
             if match:
                 return match.group()
         
-        return 'unknown'
+        return time_match.group()
 
 
 class SmartFilterPanel:
     """Smart filter panel with AI-powered suggestions and presets"""
     
+    # (icon, preset name) -> button label, shared by every panel opened this session
+    _preset_labels = {}
+    
     def __init__(self, parent, smart_filter, callback):
         """
         Initialize smart filter panel
@@ -3861,6 +4810,14 @@ class SmartFilterPanel:
         """
         self.smart_filter = smart_filter
         self.callback = callback
+        self._search_after_id = None  # Pending debounced suggestion refresh
+        self._last_suggestions = []  # Suggestions currently listed, in list order
+        self._search_seq = 0  # Bumped per lookup; background results for older ones are not shown
+        self._last_query = None  # Normalized query the listed (or pending) suggestions are for
+        self._suggestion_cache = OrderedDict()  # normalized query -> suggestions (LRU)
+        self._tooltip = None  # Shared, withdrawn tooltip Toplevel, built on first hover
+        self._tooltip_label = None
+        self._tooltip_after_id = None  # Pending delayed tooltip show
         
         # Create toplevel window
         self.window = tk.Toplevel(parent)
@@ -3868,6 +4825,12 @@ class SmartFilterPanel:
         self.window.geometry("700x600")
         self.window.transient(parent)
         self.window.grab_set()
+        self.window.bind('<Destroy>', self._on_window_destroy)
+        self.window.protocol("WM_DELETE_WINDOW", self.hide)
+        
+        # Font objects made once per panel and shared by the widgets below
+        self._list_font = tkfont.Font(self.window, family='Arial', size=10)
+        self._tooltip_font = tkfont.Font(self.window, family='Arial', size=9)
         
         # Main container
         main_frame = ttk.Frame(self.window, padding=15)
@@ -3903,9 +4866,12 @@ class SmartFilterPanel:
         suggestions_frame = ttk.LabelFrame(search_frame, text="💡 Suggestions", padding=5)
         suggestions_frame.pack(fill=tk.BOTH, expand=True, pady=(10, 0))
         
-        self.suggestions_list = tk.Listbox(suggestions_frame, height=6, font=('Arial', 10))
-        self.suggestions_list.pack(fill=tk.BOTH, expand=True)
+        suggestions_scroll = ttk.Scrollbar(suggestions_frame, orient=tk.VERTICAL)
+        suggestions_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+        self.suggestions_list = tk.Listbox(suggestions_frame, height=6, font=self._list_font)
+        self.suggestions_list.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         self.suggestions_list.bind('<Double-Button-1>', self._on_suggestion_select)
+        self.suggestions_view = VirtualListbox(self.suggestions_list, suggestions_scroll)
         
         # Presets frame
         presets_frame = ttk.LabelFrame(main_frame, text="📚 Quick Presets", padding=10)
@@ -3915,11 +4881,8 @@ class SmartFilterPanel:
         canvas = tk.Canvas(presets_frame, height=200)
         scrollbar = ttk.Scrollbar(presets_frame, orient="vertical", command=canvas.yview)
         preset_buttons_frame = ttk.Frame(canvas)
-        
-        preset_buttons_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        self._presets_canvas = canvas
+        self._scrollregion_pending = False
         
         canvas.create_window((0, 0), window=preset_buttons_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
@@ -3927,12 +4890,15 @@ class SmartFilterPanel:
         canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        # Add preset buttons
+        # Add preset buttons, two per row
         presets = self.smart_filter.get_all_presets()
-        row = 0
-        col = 0
-        for name, preset in presets.items():
-            btn_text = f"{preset.get('icon', '🔖')} {name}"
+        labels = SmartFilterPanel._preset_labels
+        for i, (name, preset) in enumerate(presets.items()):
+            row, col = divmod(i, 2)
+            icon = preset.get('icon', '🔖')
+            btn_text = labels.get((icon, name))
+            if btn_text is None:
+                btn_text = labels[(icon, name)] = f"{icon} {name}"
             btn = ttk.Button(preset_buttons_frame, text=btn_text, 
                            command=lambda p=preset: self._apply_preset(p),
                            width=25)
@@ -3940,19 +4906,25 @@ class SmartFilterPanel:
             
             # Tooltip - show description
             self._create_tooltip(btn, preset.get('description', ''))
-            
-            col += 1
-            if col > 1:
-                col = 0
-                row += 1
+        
+        # Bound after the grid is filled; later resizes update the scrollregion once per idle
+        preset_buttons_frame.bind("<Configure>", self._schedule_scrollregion_update)
         
         # History frame
         history_frame = ttk.LabelFrame(main_frame, text="🕐 Recent Searches", padding=10)
         history_frame.pack(fill=tk.X, pady=5)
         
-        self.history_list = tk.Listbox(history_frame, height=4, font=('Arial', 10))
-        self.history_list.pack(fill=tk.X)
-        self.history_list.bind('<Double-Button-1>', self._on_history_select)
+        history_scroll = ttk.Scrollbar(history_frame, orient=tk.VERTICAL)
+        history_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+        self.history_tree = ttk.Treeview(history_frame, columns=('query', 'results'), show='headings',
+                                         height=4, selectmode='browse', yscrollcommand=history_scroll.set)
+        history_scroll.config(command=self.history_tree.yview)
+        self.history_tree.heading('query', text='Query')
+        self.history_tree.heading('results', text='Results')
+        self.history_tree.column('query', width=480)
+        self.history_tree.column('results', width=100, anchor=tk.E)
+        self.history_tree.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.history_tree.bind('<Double-Button-1>', self._on_history_select)
         
         self._populate_history()
         
@@ -3961,55 +4933,147 @@ class SmartFilterPanel:
         buttons_frame.pack(fill=tk.X, pady=(10, 0))
         
         ttk.Button(buttons_frame, text="Clear Filter", command=self._clear_filter).pack(side=tk.LEFT, padx=5)
-        ttk.Button(buttons_frame, text="Close", command=self.window.destroy).pack(side=tk.RIGHT, padx=5)
+        ttk.Button(buttons_frame, text="Close", command=self.hide).pack(side=tk.RIGHT, padx=5)
         
         # Focus search entry
         self.search_entry.focus()
     
+    def _schedule_scrollregion_update(self, event=None):
+        """Coalesce the preset canvas's scrollregion updates into one per idle cycle"""
+        if not self._scrollregion_pending:
+            self._scrollregion_pending = True
+            self._presets_canvas.after_idle(self._update_scrollregion)
+    
+    def _update_scrollregion(self):
+        self._scrollregion_pending = False
+        self._presets_canvas.configure(scrollregion=self._presets_canvas.bbox("all"))
+    
+    def show(self):
+        """Bring a hidden panel back with a fresh search and the current history"""
+        # History and learned terms may have changed while hidden
+        self._suggestion_cache.clear()
+        self._search_seq += 1
+        self._last_query = None
+        self.search_var.set('')
+        if self._search_after_id is not None:
+            self.window.after_cancel(self._search_after_id)
+            self._search_after_id = None
+        self._last_suggestions = []
+        self.suggestions_view.set_items([])
+        self._populate_history()
+        
+        self.window.deiconify()
+        self.window.grab_set()
+        self.search_entry.focus()
+    
+    def hide(self):
+        """Close the panel, keeping its widgets for the next show()"""
+        self._search_seq += 1
+        self._last_query = None
+        if self._search_after_id is not None:
+            self.window.after_cancel(self._search_after_id)
+            self._search_after_id = None
+        self._cancel_tooltip()
+        if self._tooltip is not None:
+            self._tooltip.withdraw()
+        self.window.grab_release()
+        self.window.withdraw()
+    
     def _on_search_change(self, *args):
-        """Handle search text change - show suggestions"""
+        """Handle search text change - refresh suggestions once typing pauses"""
+        if self._search_after_id is not None:
+            self.window.after_cancel(self._search_after_id)
+        self._search_after_id = self.window.after(_SUGGESTION_DEBOUNCE_MS, self._do_search_change)
+    
+    def _on_window_destroy(self, event):
+        """Drop a pending suggestion refresh or tooltip when the panel closes"""
+        if event.widget is not self.window:
+            return
+        if self._search_after_id is not None:
+            self.window.after_cancel(self._search_after_id)
+            self._search_after_id = None
+        self._cancel_tooltip()
+    
+    def _do_search_change(self):
+        """Show suggestions for the current search text
+        
+        Cached queries are shown at once; otherwise the lookup runs on a worker thread
+        and only the newest request's result is shown when it comes back.
+        """
+        self._search_after_id = None
         query = self.search_var.get()
-        suggestions = self.smart_filter.get_suggestions(query, max_suggestions=8)
-        
-        # Update suggestions list
-        self.suggestions_list.delete(0, tk.END)
-        for suggestion in suggestions:
-            display_text = f"{suggestion.get('icon', '')} {suggestion['text']} - {suggestion['description']}"
-            self.suggestions_list.insert(tk.END, display_text)
-            # Store the actual text for retrieval
-            self.suggestions_list.itemconfig(tk.END, {'fg': self._get_suggestion_color(suggestion['type'])})
-    
-    def _get_suggestion_color(self, suggestion_type):
-        """Get color for suggestion type"""
-        colors = {
-            'preset': '#3498db',
-            'service': '#9b59b6',
-            'nrc': '#e67e22',
-            'learned': '#2ecc71',
-            'history': '#95a5a6'
-        }
-        return colors.get(suggestion_type, '#000000')
+        # get_suggestions only looks at the lowered, stripped query
+        key = query.lower().strip()
+        if key == self._last_query:
+            return  # Programmatic re-sets, case or padding changes - the list already fits
+        self._last_query = key
+        self._search_seq += 1
+        cache = self._suggestion_cache
+        if key in cache:
+            cache.move_to_end(key)
+            self._show_suggestions(cache[key])
+            return
+        threading.Thread(target=self._search_in_background, args=(query, key, self._search_seq),
+                         name="smart-filter-suggestions", daemon=True).start()
+    
+    def _search_in_background(self, query, key, seq):
+        """Compute suggestions on a worker thread and hand them to the Tk thread"""
+        try:
+            suggestions = self.smart_filter.get_suggestions(query, max_suggestions=8)
+        except Exception:
+            suggestions = None  # Failed lookup - shown as empty but never cached
+        try:
+            self.window.after(0, self._on_suggestions_ready, key, suggestions, seq)
+        except (RuntimeError, tk.TclError):
+            pass  # The panel or the whole application closed meanwhile
+    
+    def _on_suggestions_ready(self, key, suggestions, seq):
+        """Cache and show a finished lookup unless a newer one was requested since
+        
+        Stale results are dropped rather than cached, since show() may have cleared the
+        cache after they were requested; failed lookups (None) are shown empty and a
+        retry of the same query is allowed.
+        """
+        if seq != self._search_seq or not self.window.winfo_exists():
+            return
+        if suggestions is None:
+            self._last_query = None
+            self._show_suggestions([])
+            return
+        cache = self._suggestion_cache
+        cache[key] = suggestions
+        if len(cache) > _SUGGESTION_CACHE_SIZE:
+            cache.popitem(last=False)
+        self._show_suggestions(suggestions)
+    
+    def _show_suggestions(self, suggestions):
+        """List suggestions - only the visible rows reach the Listbox, and only rows
+        with a type color get an itemconfig call"""
+        self._last_suggestions = suggestions
+        suggestion_color = _SUGGESTION_COLORS.get
+        self.suggestions_view.set_items([
+            (f"{suggestion.get('icon', '')} {suggestion['text']} - {suggestion['description']}",
+             suggestion_color(suggestion['type']))
+            for suggestion in suggestions
+        ])
     
     def _on_suggestion_select(self, event):
         """Handle double-click on suggestion"""
         selection = self.suggestions_list.curselection()
         if selection:
-            idx = selection[0]
-            query = self.search_var.get()
-            suggestions = self.smart_filter.get_suggestions(query, max_suggestions=8)
-            if idx < len(suggestions):
-                selected = suggestions[idx]
+            idx = self.suggestions_view.row_index(selection[0])
+            # The listed suggestions, not a fresh lookup - the entry may have changed since
+            if idx < len(self._last_suggestions):
+                selected = self._last_suggestions[idx]
                 self.search_var.set(selected['text'])
                 self._apply_filter()
     
     def _on_history_select(self, event):
         """Handle double-click on history item"""
-        selection = self.history_list.curselection()
-        if selection:
-            history_text = self.history_list.get(selection[0])
-            # Extract just the query part (before " - ")
-            query = history_text.split(' - ')[0]
-            self.search_var.set(query)
+        row = self.history_tree.identify_row(event.y)
+        if row:
+            # The query has its own column - no splitting of a display string
+            self.search_var.set(self.history_tree.set(row, 'query'))
     
     def _apply_preset(self, preset):
         """Apply a preset filter"""
@@ -4022,121 +5086,63 @@ class SmartFilterPanel:
         """Apply the current filter"""
         query = self.search_var.get().strip()
         if query:
-            # Split by comma or space
-            keywords = [k.strip() for k in query.replace(',', ' ').split() if k.strip()]
+            # Split by comma, semicolon or whitespace - split() already drops empty pieces
+            keywords = query.translate(_KEYWORD_SEPARATORS).split()
             if keywords:
                 self.callback(keywords)
-                self.window.destroy()
+                self.hide()
     
     def _clear_filter(self):
         """Clear filter and show all results"""
         self.callback([])
-        self.window.destroy()
+        self.hide()
     
     def _populate_history(self):
         """Populate history list"""
-        history = self.smart_filter.search_history[-10:]  # Last 10 searches
-        for entry in reversed(history):
-            display = f"{entry['query']} - {entry.get('results', 0)} results"
-            self.history_list.insert(tk.END, display)
+        # Last 10 searches, newest first - read straight off the end of the history deque
+        recent = islice(reversed(self.smart_filter.search_history), 10)
+        tree = self.history_tree
+        tree.delete(*tree.get_children())
+        insert, end = tree.insert, tk.END
+        for entry in recent:
+            insert('', end, values=(entry['query'], entry.get('results', 0)))
     
     def _create_tooltip(self, widget, text):
         """Create a simple tooltip"""
         def show_tooltip(event):
-            tooltip = tk.Toplevel()
-            tooltip.wm_overrideredirect(True)
-            tooltip.wm_geometry(f"+{event.x_root+10}+{event.y_root+10}")
-            label = tk.Label(tooltip, text=text, background="lightyellow", 
-                           relief=tk.SOLID, borderwidth=1, font=('Arial', 9))
-            label.pack()
-            widget.tooltip = tooltip
+            # Only shown once the pointer rests - sweeping across the presets does no work
+            self._cancel_tooltip()
+            self._tooltip_after_id = self.window.after(
+                _TOOLTIP_DELAY_MS, self._show_tooltip, text, event.x_root + 10, event.y_root + 10)
         
         def hide_tooltip(event):
-            if hasattr(widget, 'tooltip'):
-                widget.tooltip.destroy()
-                delattr(widget, 'tooltip')
+            self._cancel_tooltip()
+            if self._tooltip is not None:
+                self._tooltip.withdraw()
         
         widget.bind('<Enter>', show_tooltip)
         widget.bind('<Leave>', hide_tooltip)
     
-    def _correlate_logs(self):
-        """Correlate all logs in the workspace"""
-        try:
-            # Show progress (improvement #5)
-            self._show_progress("Correlating logs...")
-            
-            # Placeholder for correlation logic
-            self.results_text.insert(tk.END, "🔗 Cross-Correlation Analysis\n", "heading")
-            self.results_text.insert(tk.END, "=" * 50 + "\n\n", "normal")
-            self.results_text.insert(tk.END, "This feature will correlate multiple log files\n", "info")
-            self.results_text.insert(tk.END, "to identify patterns and relationships.\n\n", "info")
-            
-            self._hide_progress()
-            self.status.set("Log correlation completed")
-            
-        except Exception as e:
-            self._hide_progress()
-            self.status.set(f"Error correlating logs: {str(e)}")
-    
-    def _test_sample_data(self):
-        """Load and analyze sample diagnostic data"""
-        try:
-            # Show progress (improvement #5)
-            self._show_progress("Loading sample data...")
-            
-            # Placeholder for test sample logic
-            self.results_text.insert(tk.END, "🧪 Sample Data Analysis\n", "heading")
-            self.results_text.insert(tk.END, "=" * 50 + "\n\n", "normal")
-            self.results_text.insert(tk.END, "Sample diagnostic data loaded successfully.\n", "success")
-            self.results_text.insert(tk.END, "This demonstrates the analysis capabilities.\n\n", "info")
-            
-            self._hide_progress()
-            self.status.set("Sample data analysis completed")
-            
-        except Exception as e:
-            self._hide_progress()
-            self.status.set(f"Error loading sample data: {str(e)}")
-    
-    def _show_progress(self, message):
-        """Show progress indicator (improvement #5)"""
-        self.progress_label.config(text=message)
-        self.progress_frame.grid()
-        self.progress_bar.start(10)
-        
-        # Disable action buttons to prevent double-clicks
-        for child in self.root.winfo_children():
-            self._disable_buttons_recursive(child)
-        
-        self.root.update_idletasks()
+    def _show_tooltip(self, text, x, y):
+        """Show the panel's shared tooltip window with text at screen position x, y"""
+        self._tooltip_after_id = None
+        # One tooltip window for the whole panel - hovering only retexts and moves it
+        if self._tooltip is None:
+            self._tooltip = tk.Toplevel(self.window)
+            self._tooltip.wm_overrideredirect(True)
+            self._tooltip_label = ttk.Label(self._tooltip, background="lightyellow", relief=tk.SOLID,
+                                            borderwidth=1, font=self._tooltip_font,
+                                            justify=tk.LEFT, wraplength=300)
+            self._tooltip_label.pack()
+        self._tooltip_label.config(text=text)
+        self._tooltip.wm_geometry(f"+{x}+{y}")
+        self._tooltip.deiconify()
     
-    def _hide_progress(self):
-        """Hide progress indicator (improvement #5)"""
-        self.progress_frame.grid_remove()
-        self.progress_bar.stop()
-        
-        # Re-enable action buttons
-        for child in self.root.winfo_children():
-            self._enable_buttons_recursive(child)
-    
-    def _disable_buttons_recursive(self, widget):
-        """Recursively disable buttons"""
-        try:
-            if isinstance(widget, (ttk.Button, tk.Button)):
-                widget.config(state='disabled')
-            for child in widget.winfo_children():
-                self._disable_buttons_recursive(child)
-        except:
-            pass
-    
-    def _enable_buttons_recursive(self, widget):
-        """Recursively enable buttons"""
-        try:
-            if isinstance(widget, (ttk.Button, tk.Button)):
-                widget.config(state='normal')
-            for child in widget.winfo_children():
-                self._enable_buttons_recursive(child)
-        except:
-            pass
+    def _cancel_tooltip(self):
+        """Drop a tooltip that is scheduled but not shown yet"""
+        if self._tooltip_after_id is not None:
+            self.window.after_cancel(self._tooltip_after_id)
+            self._tooltip_after_id = None
 
 
 def main():
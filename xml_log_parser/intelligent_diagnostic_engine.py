@@ -4,8 +4,10 @@ Advanced system that correlates multiple data sources to provide clear pass/fail
 """
 
 import os
+import codecs
 import json
 import logging
+import shutil
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
@@ -14,8 +16,73 @@ from tkinter import ttk, filedialog, messagebox, scrolledtext
 import threading
 import hashlib
 import base64
+from contextlib import contextmanager
 from dataclasses import dataclass, asdict
 import re
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+# Read size when copying a document into storage
+_INGEST_CHUNK_SIZE = 4 << 20
+
+# Documents whose content is read as UTF-8 text
+_TEXT_EXTENSIONS = ('.txt', '.log', '.xml')
+
+
+def _new_checksum():
+    """Hash object for document checksums (BLAKE2b, 128-bit - the same hex width as the old MD5)"""
+    return hashlib.blake2b(digest_size=16)
+
+
+def _trie_pattern(words) -> str:
+    """Regex alternation for words, shaped as a prefix trie with single-child chains merged
+    
+    Shared prefixes ("nrc 3", "u010") are matched once instead of once per word, and at
+    every branch the longer continuation is tried first, so the longest word wins.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[''] = {}  # Terminal marker
+    
+    def branches(node):
+        parts = []
+        for ch in sorted(k for k in node if k):
+            label, child = ch, node[ch]
+            while '' not in child and len(child) == 1:
+                (next_ch, child), = child.items()
+                label += next_ch
+            rest = branches(child) if len(child) > ('' in child) else None
+            if rest is None:
+                parts.append(re.escape(label))
+            else:
+                parts.append(re.escape(label) + '(?:' + rest + (')?' if '' in child else ')'))
+        return '|'.join(parts)
+    
+    return branches(trie)
+
+
+def _normalize_newlines(text: str) -> str:
+    """Fold CRLF and lone CR into LF, as a text-mode read would"""
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+# Plain words the per-document-type checks look for, besides the knowledge base indicators
+_DOCUMENT_TERMS = ('fault', 'error', 'normal', 'pass', 'success', 'complete', 'verification',
+                   'programming', 'replaced', 'repaired', 'updated', 'programmed')
 
 
 @dataclass
@@ -35,6 +102,14 @@ class DocumentReference:
     def __post_init__(self):
         if self.key_findings is None:
             self.key_findings = []
+    
+    @property
+    def text_lower(self) -> str:
+        """extracted_text lowered, computed once per text (kept out of the saved index)"""
+        cached = self.__dict__.get('_text_lower')
+        if cached is None or cached[0] is not self.extracted_text:
+            cached = self.__dict__['_text_lower'] = (self.extracted_text, self.extracted_text.lower())
+        return cached[1]
 
 
 @dataclass
@@ -60,9 +135,27 @@ class IntelligentDiagnosticEngine:
         self.knowledge_base = self._initialize_knowledge_base()
         self.analysis_patterns = self._initialize_analysis_patterns()
         
+        # Lowered indicator words, so a document is scanned once for all of them
+        self._success_terms = frozenset(s.lower() for s in self.knowledge_base["update_success_indicators"])
+        self._failure_terms = frozenset(s.lower() for s in self.knowledge_base["update_failure_indicators"])
+        self._indicator_terms = (self._success_terms | self._failure_terms | frozenset(_DOCUMENT_TERMS)
+                                 | {code.lower() for code in self.knowledge_base["critical_error_codes"]})
+        self._indicator_automaton = self._build_indicator_automaton()
+        self._terms_cache: Dict[str, Tuple[str, frozenset]] = {}  # doc_id -> (scanned text, its terms)
+        if self._indicator_automaton is None:
+            # Lookahead over a trie-shaped alternation: one regex pass reports the longest
+            # word starting at each position, and the shorter words it starts with follow
+            # from the table, so overlapping words ("nrc" in "nrc 31") are still all found
+            terms = sorted(self._indicator_terms, key=len, reverse=True)
+            self._indicator_rx = re.compile('(?=(' + _trie_pattern(terms) + '))')
+            self._indicator_prefixes = {term: frozenset(t for t in terms if term.startswith(t))
+                                        for term in terms}
+        
         # Document storage
         self.doc_storage_dir = Path("document_storage")
         self.doc_storage_dir.mkdir(exist_ok=True)
+        self._index_batch_depth = 0  # > 0 inside batch_updates(): index writes wait for its end
+        self._index_dirty = False
         
         # Load existing documents
         self._load_existing_documents()
@@ -130,6 +223,32 @@ class IntelligentDiagnosticEngine:
             }
         }
     
+    def _build_indicator_automaton(self):
+        """Aho-Corasick automaton over every indicator word, or None without pyahocorasick"""
+        if not AHOCORASICK_AVAILABLE:
+            return None
+        automaton = ahocorasick.Automaton()
+        for term in self._indicator_terms:
+            automaton.add_word(term, term)
+        automaton.make_automaton()
+        return automaton
+    
+    def _find_terms(self, text_lower: str) -> set:
+        """Indicator words (lowered) that occur anywhere in an already lowered text"""
+        if self._indicator_automaton is not None:
+            # One pass over the text reports every word, overlapping ones included
+            return {term for _, term in self._indicator_automaton.iter(text_lower)}
+        prefixes = self._indicator_prefixes
+        return set().union(*[prefixes[term] for term in set(self._indicator_rx.findall(text_lower))])
+    
+    def _document_terms(self, doc_ref: DocumentReference) -> frozenset:
+        """Indicator words in a document, scanned once per extracted text"""
+        cached = self._terms_cache.get(doc_ref.doc_id)
+        if cached is None or cached[0] is not doc_ref.extracted_text:
+            cached = (doc_ref.extracted_text, frozenset(self._find_terms(doc_ref.text_lower)))
+            self._terms_cache[doc_ref.doc_id] = cached
+        return cached[1]
+    
     def add_document(self, filepath: str, doc_type: str, description: str = "") -> str:
         """Add a document to the analysis system"""
         try:
@@ -139,22 +258,10 @@ class IntelligentDiagnosticEngine:
             # Generate document ID
             doc_id = self._generate_doc_id(filepath)
             
-            # Calculate file checksum
-            checksum = self._calculate_checksum(filepath)
-            
-            # Copy document to storage
+            # Copy document to storage, checksumming and extracting its text on the way
             filename = os.path.basename(filepath)
             storage_path = self.doc_storage_dir / f"{doc_id}_{filename}"
-            
-            # Copy file to storage
-            import shutil
-            shutil.copy2(filepath, storage_path)
-            
-            # Extract text content
-            extracted_text = self._extract_text_content(filepath, doc_type)
-            
-            # Extract key findings
-            key_findings = self._extract_key_findings(extracted_text, doc_type)
+            checksum, extracted_text, file_size = self._ingest_stream(filepath, storage_path, doc_type)
             
             # Create document reference
             doc_ref = DocumentReference(
@@ -163,18 +270,21 @@ class IntelligentDiagnosticEngine:
                 filepath=str(storage_path),
                 doc_type=doc_type,
                 upload_time=datetime.now(),
-                file_size=os.path.getsize(filepath),
+                file_size=file_size,
                 checksum=checksum,
                 description=description,
-                extracted_text=extracted_text,
-                key_findings=key_findings
+                extracted_text=extracted_text
             )
             
+            # Extract key findings - from the lowered text the evidence scan reuses later
+            doc_ref.key_findings = self._extract_key_findings(extracted_text, doc_type,
+                                                              self._document_terms(doc_ref))
+            
             # Store document
             self.documents[doc_id] = doc_ref
             
             # Save document index
-            self._save_document_index()
+            self._index_changed()
             
             self.logger.info(f"Added document: {filename} ({doc_type})")
             return doc_id
@@ -189,24 +299,48 @@ class IntelligentDiagnosticEngine:
         file_hash = hashlib.md5(filepath.encode()).hexdigest()[:8]
         return f"doc_{timestamp}_{file_hash}"
     
-    def _calculate_checksum(self, filepath: str) -> str:
-        """Calculate file checksum"""
-        hash_md5 = hashlib.md5()
-        with open(filepath, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_md5.update(chunk)
-        return hash_md5.hexdigest()
+    def _ingest_stream(self, src_path: str, dst_path, doc_type: str) -> Tuple[str, str, int]:
+        """Copy a document into storage in a single read
+        
+        Each chunk is hashed, written to the copy and, for text documents, decoded in
+        the same pass. Returns (checksum, extracted text, size in bytes).
+        """
+        is_text = os.path.splitext(src_path)[1].lower() in _TEXT_EXTENSIONS
+        digest = _new_checksum()
+        decoder = codecs.getincrementaldecoder('utf-8')('ignore') if is_text else None
+        pieces = []
+        size = 0
+        buffer = bytearray(_INGEST_CHUNK_SIZE)
+        view = memoryview(buffer)
+        with open(src_path, 'rb') as src, open(dst_path, 'wb') as dst:
+            while True:
+                n = src.readinto(buffer)
+                if not n:
+                    break
+                chunk = view[:n]
+                digest.update(chunk)
+                dst.write(chunk)
+                if decoder is not None:
+                    pieces.append(decoder.decode(chunk))
+                size += n
+        # Timestamps and permission bits, as shutil.copy2 kept them
+        shutil.copystat(src_path, dst_path)
+        
+        if decoder is None:
+            return digest.hexdigest(), self._extract_text_content(src_path, doc_type), size
+        pieces.append(decoder.decode(b'', final=True))
+        return digest.hexdigest(), _normalize_newlines(''.join(pieces)), size
     
     def _extract_text_content(self, filepath: str, doc_type: str) -> str:
-        """Extract text content from various file types"""
+        """Extract text content from non-text file types
+        
+        Text documents (_TEXT_EXTENSIONS) are decoded by _ingest_stream while they are
+        copied, so only descriptions of the other types are produced here.
+        """
         try:
             file_ext = os.path.splitext(filepath)[1].lower()
             
-            if file_ext in ['.txt', '.log', '.xml']:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    return f.read()
-            
-            elif file_ext in ['.png', '.jpg', '.jpeg', '.bmp', '.tiff']:
+            if file_ext in ['.png', '.jpg', '.jpeg', '.bmp', '.tiff']:
                 # For screenshots, we'll extract any embedded text or return metadata
                 return f"Screenshot file: {os.path.basename(filepath)}\nType: Image\nSize: {os.path.getsize(filepath)} bytes"
             
@@ -225,37 +359,38 @@ class IntelligentDiagnosticEngine:
             self.logger.error(f"Error extracting text from {filepath}: {e}")
             return f"Error reading file: {str(e)}"
     
-    def _extract_key_findings(self, text: str, doc_type: str) -> List[str]:
-        """Extract key findings from document text"""
+    def _extract_key_findings(self, text: str, doc_type: str, found: Optional[frozenset] = None) -> List[str]:
+        """Extract key findings from document text (found: its indicator words, if already scanned)"""
         findings = []
-        text_lower = text.lower()
+        if found is None:
+            found = self._find_terms(text.lower())
         
         # Common patterns based on document type
         if doc_type == 'system_log':
             # Look for update-related findings
-            if any(indicator in text_lower for indicator in self.knowledge_base["update_success_indicators"]):
+            if not found.isdisjoint(self._success_terms):
                 findings.append("Update success indicators found")
             
-            if any(indicator in text_lower for indicator in self.knowledge_base["update_failure_indicators"]):
+            if not found.isdisjoint(self._failure_terms):
                 findings.append("Update failure indicators detected")
             
             # Look for error codes
             for error_code in self.knowledge_base["critical_error_codes"]:
-                if error_code.lower() in text_lower:
+                if error_code.lower() in found:
                     findings.append(f"Critical error code detected: {error_code}")
         
         elif doc_type == 'health_report':
             # Look for system health indicators
-            if "fault" in text_lower or "error" in text_lower:
+            if "fault" in found or "error" in found:
                 findings.append("System faults or errors reported")
-            if "normal" in text_lower or "pass" in text_lower:
+            if "normal" in found or "pass" in found:
                 findings.append("Normal system operation indicators")
         
         elif doc_type == 'work_order':
             # Look for work performed
-            if "replaced" in text_lower or "repaired" in text_lower:
+            if "replaced" in found or "repaired" in found:
                 findings.append("Component replacement or repair performed")
-            if "updated" in text_lower or "programmed" in text_lower:
+            if "updated" in found or "programmed" in found:
                 findings.append("Software update or programming performed")
         
         return findings
@@ -320,30 +455,31 @@ class IntelligentDiagnosticEngine:
     def _analyze_document_for_evidence(self, doc_ref: DocumentReference, analysis_type: str) -> Tuple[Dict[str, List[str]], str]:
         """Analyze individual document for evidence"""
         evidence = {"primary": [], "supporting": [], "contradictory": []}
-        text = doc_ref.extracted_text.lower()
         
         if analysis_type == "software_update":
+            found = self._document_terms(doc_ref)
+            
             # Primary evidence (strong indicators)
-            if any(indicator in text for indicator in self.knowledge_base["update_success_indicators"]):
+            if not found.isdisjoint(self._success_terms):
                 evidence["primary"].append("Update success confirmation found")
             
-            if any(indicator in text for indicator in self.knowledge_base["update_failure_indicators"]):
+            if not found.isdisjoint(self._failure_terms):
                 evidence["primary"].append("Update failure indication detected")
             
             # Supporting evidence
-            if "programming" in text and "complete" in text:
+            if "programming" in found and "complete" in found:
                 evidence["supporting"].append("Programming completion referenced")
             
-            if "verification" in text and ("pass" in text or "success" in text):
+            if "verification" in found and ("pass" in found or "success" in found):
                 evidence["supporting"].append("Verification passed")
             
             # Contradictory evidence
-            if "success" in text and "error" in text:
+            if "success" in found and "error" in found:
                 evidence["contradictory"].append("Mixed success/error indicators")
             
             # Check for critical error codes
             for error_code in self.knowledge_base["critical_error_codes"]:
-                if error_code.lower() in text:
+                if error_code.lower() in found:
                     evidence["primary"].append(f"Critical error code found: {error_code}")
         
         return evidence, f"{doc_ref.filename} ({doc_ref.doc_type})"
@@ -352,9 +488,14 @@ class IntelligentDiagnosticEngine:
                        contradictory_evidence: List[str], analysis_type: str) -> Tuple[str, float, str]:
         """Make final conclusion based on evidence"""
         
-        # Count evidence types
-        success_indicators = len([e for e in primary_evidence if "success" in e.lower() or "pass" in e.lower()])
-        failure_indicators = len([e for e in primary_evidence if "fail" in e.lower() or "error" in e.lower()])
+        # Count evidence types - one pass, each item lowered once; an item can count as both
+        success_indicators = failure_indicators = 0
+        for item in primary_evidence:
+            item = item.lower()
+            if "success" in item or "pass" in item:
+                success_indicators += 1
+            if "fail" in item or "error" in item:
+                failure_indicators += 1
         contradictory_count = len(contradictory_evidence)
         
         # Calculate confidence based on evidence strength
@@ -409,16 +550,45 @@ class IntelligentDiagnosticEngine:
         
         return recommendations
     
+    @contextmanager
+    def batch_updates(self):
+        """Write the document index once when the block ends, e.g. around many add_document calls"""
+        self._index_batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._index_batch_depth -= 1
+            if not self._index_batch_depth and self._index_dirty:
+                self._save_document_index()
+    
+    def _index_changed(self):
+        """Save the document index now, or at the end of the enclosing batch_updates()"""
+        self._index_dirty = True
+        if not self._index_batch_depth:
+            self._save_document_index()
+    
     def _save_document_index(self):
         """Save document index to file"""
         try:
             index_file = self.doc_storage_dir / "document_index.json"
-            index_data = {
-                doc_id: asdict(doc_ref) for doc_id, doc_ref in self.documents.items()
-            }
-            
-            with open(index_file, 'w', encoding='utf-8') as f:
-                json.dump(index_data, f, indent=2, default=str)
+            data = None
+            if ORJSON_AVAILABLE:
+                try:
+                    # Dataclasses and datetimes are encoded natively, no asdict() copies
+                    data = orjson.dumps(self.documents)
+                except TypeError:
+                    pass  # Let the stdlib encoder handle it
+            if data is None:
+                index_data = {
+                    doc_id: asdict(doc_ref) for doc_id, doc_ref in self.documents.items()
+                }
+                data = json.dumps(index_data, default=str).encode('utf-8')
+            
+            # Written aside and renamed over the index, so a crash never leaves half an index
+            tmp_file = index_file.with_suffix('.tmp')
+            tmp_file.write_bytes(data)
+            os.replace(tmp_file, index_file)
+            self._index_dirty = False
                 
         except Exception as e:
             self.logger.error(f"Error saving document index: {e}")
@@ -428,8 +598,11 @@ class IntelligentDiagnosticEngine:
         try:
             index_file = self.doc_storage_dir / "document_index.json"
             if index_file.exists():
-                with open(index_file, 'r', encoding='utf-8') as f:
-                    index_data = json.load(f)
+                if ORJSON_AVAILABLE:
+                    index_data = orjson.loads(index_file.read_bytes())
+                else:
+                    with open(index_file, 'r', encoding='utf-8') as f:
+                        index_data = json.load(f)
                 
                 for doc_id, doc_data in index_data.items():
                     # Convert datetime strings back to datetime objects
@@ -482,9 +655,10 @@ class IntelligentDiagnosticEngine:
                 
                 # Remove from memory
                 del self.documents[doc_id]
+                self._terms_cache.pop(doc_id, None)
                 
                 # Save updated index
-                self._save_document_index()
+                self._index_changed()
                 
                 self.logger.info(f"Removed document: {doc_ref.filename}")
                 return True
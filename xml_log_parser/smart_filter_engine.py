@@ -5,10 +5,14 @@ Provides context-aware search, auto-complete, and intelligent filtering suggesti
 
 import re
 import json
-from collections import defaultdict, Counter
-from typing import List, Dict, Set, Tuple
+from collections import defaultdict, deque, Counter
+from itertools import islice
+from typing import List, Dict, Set, Tuple, Optional, Pattern
 from pathlib import Path
 
+# Searches kept in memory and in the history file
+HISTORY_LIMIT = 100
+
 
 class SmartFilterEngine:
     """
@@ -112,11 +116,15 @@ class SmartFilterEngine:
         
         # Load user presets and history
         self.user_presets = self._load_presets()
-        self.search_history = self._load_history()
+        self.search_history = deque(self._load_history(), maxlen=HISTORY_LIMIT)
         
         # Learning data
         self.frequent_terms = Counter()
         self.term_contexts = defaultdict(set)
+        self._top_terms = None  # frequent_terms.most_common(50), reset whenever terms are learned
+        
+        # (lowered search text, suggestion) for the fixed presets, services and NRCs
+        self._candidates = None
         
     def _load_presets(self) -> Dict:
         """Load user-defined filter presets"""
@@ -147,10 +155,10 @@ class SmartFilterEngine:
         return []
     
     def _save_history(self):
-        """Save search history (keep last 100)"""
+        """Save search history (the deque keeps the last HISTORY_LIMIT)"""
         try:
             with open(self.history_file, 'w') as f:
-                json.dump(self.search_history[-100:], f, indent=2)
+                json.dump(list(self.search_history), f, indent=2)
         except Exception as e:
             print(f"Failed to save history: {e}")
     
@@ -166,6 +174,17 @@ class SmartFilterEngine:
     
     def learn_from_content(self, content: str):
         """Analyze content to learn common terms and patterns"""
+        self.learn_from_chunk(content)
+    
+    def learn_from_chunk(self, chunk: str):
+        """
+        Learn from one piece of a larger log
+        
+        Counts are accumulated, so a log can be fed in line-aligned chunks
+        instead of holding the whole decoded file in memory.
+        """
+        content = chunk
+        
         # Extract and count error codes
         error_codes = re.findall(self.context_patterns['error_codes'], content)
         self.frequent_terms.update(error_codes)
@@ -177,6 +196,41 @@ class SmartFilterEngine:
         # Extract common words (3+ chars, alphanumeric)
         words = re.findall(r'\b[a-zA-Z]{3,}\b', content.lower())
         self.frequent_terms.update(words)
+        self._top_terms = None
+    
+    def _suggestion_candidates(self) -> List[Tuple[str, Dict]]:
+        """
+        Lowered search texts for the built-in presets, UDS services and NRC codes
+        
+        The fields a query is matched against are joined with NUL, which no typed query
+        contains, so one substring test per candidate matches any of its fields.
+        """
+        if self._candidates is None:
+            candidates = []
+            for name, preset in self.builtin_presets.items():
+                candidates.append(('\0'.join([name] + preset['keywords']).lower(), {
+                    "text": ", ".join(preset['keywords'][:3]),
+                    "type": "preset",
+                    "description": f"{preset['icon']} {name}: {preset['description']}",
+                    "icon": preset['icon'],
+                    "preset_name": name
+                }))
+            for code, service in self.uds_services.items():
+                candidates.append((f"{code}\0{service}".lower(), {
+                    "text": f"{code} {service}",
+                    "type": "service",
+                    "description": f"UDS Service: {service}",
+                    "icon": "🔧"
+                }))
+            for code, meaning in self.nrc_codes.items():
+                candidates.append((f"{code}\0{meaning}".lower(), {
+                    "text": f"NRC {code} {meaning}",
+                    "type": "nrc",
+                    "description": f"Negative Response: {meaning}",
+                    "icon": "⚠️"
+                }))
+            self._candidates = candidates
+        return self._candidates
     
     def get_suggestions(self, partial_query: str, max_suggestions: int = 10) -> List[Dict]:
         """
@@ -191,7 +245,7 @@ class SmartFilterEngine:
         if not query_lower:
             # Show popular/recent searches when empty
             if self.search_history:
-                recent = list(reversed(self.search_history[-5:]))
+                recent = islice(reversed(self.search_history), 5)
                 for entry in recent:
                     suggestions.append({
                         "text": entry['query'],
@@ -201,41 +255,16 @@ class SmartFilterEngine:
                     })
             return suggestions
         
-        # Match against built-in presets
-        for name, preset in self.builtin_presets.items():
-            if query_lower in name.lower() or any(query_lower in kw.lower() for kw in preset['keywords']):
-                suggestions.append({
-                    "text": ", ".join(preset['keywords'][:3]),
-                    "type": "preset",
-                    "description": f"{preset['icon']} {name}: {preset['description']}",
-                    "icon": preset['icon'],
-                    "preset_name": name
-                })
-        
-        # Match against UDS services
-        for code, service in self.uds_services.items():
-            if query_lower in code.lower() or query_lower in service.lower():
-                suggestions.append({
-                    "text": f"{code} {service}",
-                    "type": "service",
-                    "description": f"UDS Service: {service}",
-                    "icon": "🔧"
-                })
-        
-        # Match against NRC codes
-        for code, meaning in self.nrc_codes.items():
-            if query_lower in code.lower() or query_lower in meaning.lower():
-                suggestions.append({
-                    "text": f"NRC {code} {meaning}",
-                    "type": "nrc",
-                    "description": f"Negative Response: {meaning}",
-                    "icon": "⚠️"
-                })
+        # Match against built-in presets, UDS services and NRC codes, in that order
+        suggestions.extend(dict(suggestion) for search_text, suggestion in self._suggestion_candidates()
+                           if query_lower in search_text)
         
         # Match against learned frequent terms
         if self.frequent_terms:
+            if self._top_terms is None:
+                self._top_terms = self.frequent_terms.most_common(50)
             matching_terms = [
-                term for term, count in self.frequent_terms.most_common(50)
+                term for term, count in self._top_terms
                 if query_lower in term.lower()
             ]
             for term in matching_terms[:5]:
@@ -290,51 +319,69 @@ class SmartFilterEngine:
             del self.user_presets[name]
             self._save_presets()
     
-    def apply_filter(self, content: str, keywords: List[str], case_sensitive: bool = False) -> Tuple[str, int]:
+    def compile(self, keywords: List[str], case_sensitive: bool = False) -> Optional[Pattern]:
+        """
+        Compile filter keywords into one pattern for apply_filter and highlight_matches
+        
+        Each keyword sits in a lookahead, longest first, so a scan reports every position
+        where a keyword starts - overlapping matches included - with the longest one there.
+        
+        Returns:
+            Compiled pattern, or None without keywords
+        """
+        if not keywords:
+            return None
+        words = dict.fromkeys(keywords if case_sensitive else (k.lower() for k in keywords))
+        alternation = '|'.join(re.escape(w) for w in sorted(words, key=len, reverse=True))
+        return re.compile(f'(?=({alternation}))')
+    
+    def apply_filter(self, content: str, keywords: List[str], case_sensitive: bool = False,
+                     pattern: Optional[Pattern] = None) -> Tuple[str, int]:
         """
         Apply filter keywords to content
         
+        Args:
+            pattern: Result of compile() for these keywords, built here if not given
+        
         Returns:
             (filtered_content, match_count)
         """
         if not keywords:
             return content, 0
         
+        if pattern is None:
+            pattern = self.compile(keywords, case_sensitive)
+        search = pattern.search
+        
+        # Lowercasing never adds or removes newlines, so the lines pair up one to one
         lines = content.split('\n')
-        matched_lines = []
-        match_count = 0
-        
-        for line in lines:
-            line_to_check = line if case_sensitive else line.lower()
-            keywords_to_check = keywords if case_sensitive else [k.lower() for k in keywords]
-            
-            if any(kw in line_to_check for kw in keywords_to_check):
-                matched_lines.append(line)
-                match_count += 1
-        
-        return '\n'.join(matched_lines), match_count
+        lines_to_check = lines if case_sensitive else content.lower().split('\n')
+        matched_lines = [line for line, line_to_check in zip(lines, lines_to_check)
+                         if search(line_to_check)]
+        
+        return '\n'.join(matched_lines), len(matched_lines)
     
-    def highlight_matches(self, text: str, keywords: List[str], case_sensitive: bool = False) -> List[Tuple[int, int, str]]:
+    def highlight_matches(self, text: str, keywords: List[str], case_sensitive: bool = False,
+                          pattern: Optional[Pattern] = None) -> List[Tuple[int, int, str]]:
         """
         Find match positions for highlighting
         
+        One scan over the text; where several keywords start at the same position only
+        the longest is reported, which covers the same characters.
+        
+        Args:
+            pattern: Result of compile() for these keywords, built here if not given
+        
         Returns:
-            List of (start_pos, end_pos, keyword) tuples
+            List of (start_pos, end_pos, keyword) tuples, in position order
         """
-        matches = []
+        if pattern is None:
+            pattern = self.compile(keywords, case_sensitive)
+            if pattern is None:
+                return []
         text_to_search = text if case_sensitive else text.lower()
-        keywords_to_search = keywords if case_sensitive else [k.lower() for k in keywords]
-        
-        for keyword in keywords_to_search:
-            start = 0
-            while True:
-                pos = text_to_search.find(keyword, start)
-                if pos == -1:
-                    break
-                matches.append((pos, pos + len(keyword), keyword))
-                start = pos + 1
-        
-        return sorted(matches, key=lambda x: x[0])
+        
+        return [(m.start(), m.end(1), m.group(1)) for m in pattern.finditer(text_to_search)]
     
     def get_quick_stats(self, content: str) -> Dict:
         """Get quick statistics about content for smart filtering"""
@@ -5,6 +5,7 @@ Provides tooltips, improved drag & drop, loading animations, and better user fee
 
 import tkinter as tk
 from tkinter import ttk
+import tkinter.font as tkfont
 import time
 from typing import Optional, Callable, Dict, Any
 
@@ -346,6 +347,294 @@ class ModernButton:
         """Grid the button"""
         self.button.grid(**kwargs)
 
+class VirtualTextView:
+    """Read-only view of (tag, line) pairs that keeps only the visible lines in a ScrolledText
+    
+    The scrollbar is driven by the position in the backing list instead of the widget
+    contents, so opening or scrolling a very long report only ever inserts one screenful.
+    While attached the widget does not wrap - one line is one display row, so a slice
+    always fits the viewport - and long lines scroll sideways instead.
+    """
+    
+    def __init__(self, text, lines=()):
+        self.text = text
+        self.lines = list(lines)
+        self.first = 0
+        self._line_height = tkfont.Font(font=text.cget('font')).metrics('linespace')
+        
+        # Take the scrollbar over from the widget's own (partial) contents
+        text.vbar.config(command=self.yview)
+        text.config(yscrollcommand='')
+        
+        # Wrapped lines would take several rows and push the end of the slice out of view
+        self._wrap = text.cget('wrap')
+        self._hbar = tk.Scrollbar(text.master, orient='horizontal', command=text.xview)
+        self._hbar.pack(side='bottom', fill='x', before=text)
+        text.config(wrap='none', xscrollcommand=self._hbar.set)
+        
+        text.bind('<Configure>', self._on_configure)
+        text.bind('<MouseWheel>', self._on_mousewheel)
+        text.bind('<Button-4>', lambda event: self._scroll(-3))
+        text.bind('<Button-5>', lambda event: self._scroll(3))
+        text.bind('<Prior>', lambda event: self._scroll(-self.visible_rows()))
+        text.bind('<Next>', lambda event: self._scroll(self.visible_rows()))
+        self.redraw()
+    
+    def detach(self):
+        """Hand the scrollbar back to the widget so it can hold ordinary contents again"""
+        for sequence in ('<Configure>', '<MouseWheel>', '<Button-4>', '<Button-5>', '<Prior>', '<Next>'):
+            self.text.unbind(sequence)
+        self.text.vbar.config(command=self.text.yview)
+        self.text.config(yscrollcommand=self.text.vbar.set, wrap=self._wrap, xscrollcommand='')
+        self.text.xview_moveto(0)
+        self._hbar.destroy()
+    
+    def set_lines(self, lines):
+        """Replace the backing lines and show them from the top"""
+        self.lines = list(lines)
+        self.first = 0
+        self.redraw()
+    
+    def visible_rows(self):
+        """Number of lines that fit the widget's current height"""
+        return max(1, self.text.winfo_height() // self._line_height)
+    
+    def yview(self, *args):
+        """Scrollbar command: 'moveto fraction' or 'scroll n units|pages'"""
+        if args[0] == 'moveto':
+            self.first = int(float(args[1]) * len(self.lines))
+            self.redraw()
+        elif args[0] == 'scroll':
+            step = int(args[1])
+            self._scroll(step * self.visible_rows() if args[2] == 'pages' else step)
+    
+    def _on_configure(self, event):
+        self.redraw()
+    
+    def _on_mousewheel(self, event):
+        return self._scroll(-3 if event.delta > 0 else 3)
+    
+    def _scroll(self, delta):
+        self.first += delta
+        self.redraw()
+        return 'break'
+    
+    def redraw(self):
+        """Re-insert just the lines in the viewport and update the scrollbar"""
+        rows = self.visible_rows()
+        total = len(self.lines)
+        self.first = max(0, min(self.first, total - rows))
+        
+        # Runs of lines sharing a tag are merged into one multi-argument insert
+        args = []
+        run_tag = run_lines = None
+        for tag, line in self.lines[self.first:self.first + rows]:
+            if run_lines is not None and tag == run_tag:
+                run_lines.append(line)
+                continue
+            if run_lines is not None:
+                args += ['\n'.join(run_lines) + '\n', run_tag or '']
+            run_tag, run_lines = tag, [line]
+        if run_lines is not None:
+            args += ['\n'.join(run_lines) + '\n', run_tag or '']
+        
+        state = self.text.cget('state')
+        self.text.config(state='normal')
+        self.text.delete('1.0', 'end')
+        if args:
+            self.text.insert('end', *args)
+        self.text.config(state=state)
+        
+        if total:
+            self.text.vbar.set(self.first / total, min(1.0, (self.first + rows) / total))
+        else:
+            self.text.vbar.set(0.0, 1.0)
+
+class VirtualListbox:
+    """Keeps a list of (text, foreground) rows and shows only the visible ones in a Listbox
+    
+    Like VirtualTextView, the scrollbar tracks the position in the backing list, so a
+    refresh inserts one screenful of rows however long the list grows. Listbox indices
+    (curselection and friends) are relative to the first shown row - use row_index().
+    """
+    
+    def __init__(self, listbox, scrollbar, items=()):
+        self.listbox = listbox
+        self.scrollbar = scrollbar
+        self.items = list(items)
+        self.first = 0
+        self._row_height = tkfont.Font(font=listbox.cget('font')).metrics('linespace') + 1
+        
+        scrollbar.config(command=self.yview)
+        listbox.config(yscrollcommand='')
+        
+        listbox.bind('<Configure>', lambda event: self.redraw())
+        listbox.bind('<MouseWheel>', lambda event: self._scroll(-1 if event.delta > 0 else 1))
+        listbox.bind('<Button-4>', lambda event: self._scroll(-1))
+        listbox.bind('<Button-5>', lambda event: self._scroll(1))
+        self.redraw()
+    
+    def set_items(self, items):
+        """Replace the backing rows and show them from the top"""
+        self.items = list(items)
+        self.first = 0
+        self.redraw()
+    
+    def row_index(self, listbox_index):
+        """Position in items of a row index reported by the Listbox"""
+        return self.first + int(listbox_index)
+    
+    def visible_rows(self):
+        """Number of rows that fit the Listbox (its configured height until it is mapped)"""
+        height = self.listbox.winfo_height()
+        if height <= 1:
+            return max(1, int(self.listbox.cget('height')))
+        return max(1, height // self._row_height)
+    
+    def yview(self, *args):
+        """Scrollbar command: 'moveto fraction' or 'scroll n units|pages'"""
+        if args[0] == 'moveto':
+            self.first = int(float(args[1]) * len(self.items))
+            self.redraw()
+        elif args[0] == 'scroll':
+            step = int(args[1])
+            self._scroll(step * self.visible_rows() if args[2] == 'pages' else step)
+    
+    def _scroll(self, delta):
+        self.first += delta
+        self.redraw()
+        return 'break'
+    
+    def redraw(self):
+        """Re-insert just the rows in the viewport and update the scrollbar"""
+        rows = self.visible_rows()
+        total = len(self.items)
+        self.first = max(0, min(self.first, total - rows))
+        shown = self.items[self.first:self.first + rows]
+        
+        listbox = self.listbox
+        listbox.delete(0, 'end')
+        if shown:
+            listbox.insert('end', *[text for text, _ in shown])
+            itemconfig = listbox.itemconfig
+            for index, (_, foreground) in enumerate(shown):
+                if foreground:
+                    itemconfig(index, fg=foreground)
+        
+        if total:
+            self.scrollbar.set(self.first / total, min(1.0, (self.first + rows) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+class MonoLogView(tk.Canvas):
+    """Read-only monospace view of (tag, line) pairs drawn straight onto a Canvas
+    
+    Lines sit on a fixed grid of one line height per row, so only the rows in the
+    viewport are drawn - no Text B-tree, tag table, undo stack or wrap layout is built
+    for the report. Redraws triggered by scrolling and resizing are coalesced into one
+    per idle cycle. Lines are not wrapped; pass xscrollcommand and hook a scrollbar to
+    the canvas' own xview to reach the end of long lines.
+    """
+    
+    def __init__(self, parent, lines=(), font=('Courier New', 10), foreground='black',
+                 tag_styles=None, yscrollcommand=None, **kwargs):
+        super().__init__(parent, highlightthickness=0, **kwargs)
+        self.lines = list(lines)
+        self.first = 0
+        self._foreground = foreground
+        self._yscrollcommand = yscrollcommand
+        self._redraw_job = None
+        
+        # tag -> (fill, font); untagged lines use the base font and foreground
+        self._font = tkfont.Font(font=font)
+        self._styles = {}
+        for tag, style in (tag_styles or {}).items():
+            self._styles[tag] = (style.get('foreground', foreground),
+                                 tkfont.Font(font=style['font']) if 'font' in style else self._font)
+        self._fonts = [self._font] + [f for _, f in self._styles.values()]
+        self._line_height = max(f.metrics('linespace') for f in self._fonts)
+        self._content_width = 0
+        self._measure_lines()
+        
+        self.bind('<Configure>', lambda event: self.schedule_redraw())
+        self.bind('<MouseWheel>', self._on_mousewheel)
+        self.bind('<Button-4>', lambda event: self._scroll(-3))
+        self.bind('<Button-5>', lambda event: self._scroll(3))
+        self.bind('<Prior>', lambda event: self._scroll(-self.visible_rows()))
+        self.bind('<Next>', lambda event: self._scroll(self.visible_rows()))
+        # Keyboard focus only on a click - merely passing the pointer over keeps it where it was
+        self.bind('<Button-1>', lambda event: self.focus_set())
+        self.bind('<Destroy>', self._on_destroy)
+        self.schedule_redraw()
+    
+    def set_lines(self, lines):
+        """Replace the backing lines and show them from the top"""
+        self.lines = list(lines)
+        self.first = 0
+        self._measure_lines()
+        self.schedule_redraw()
+    
+    def _measure_lines(self):
+        """Width needed by the longest line, in the widest of the view's fonts"""
+        longest = max((line for _, line in self.lines), key=len, default='')
+        self._content_width = 8 + max(f.measure(longest) for f in self._fonts)
+    
+    def visible_rows(self):
+        """Number of whole lines that fit the canvas' current height"""
+        return max(1, self.winfo_height() // self._line_height)
+    
+    def yview(self, *args):
+        """Scrollbar command: 'moveto fraction' or 'scroll n units|pages'"""
+        if args[0] == 'moveto':
+            self.first = int(float(args[1]) * len(self.lines))
+            self.schedule_redraw()
+        elif args[0] == 'scroll':
+            step = int(args[1])
+            self._scroll(step * self.visible_rows() if args[2] == 'pages' else step)
+    
+    def _on_mousewheel(self, event):
+        return self._scroll(-3 if event.delta > 0 else 3)
+    
+    def _scroll(self, delta):
+        self.first += delta
+        self.schedule_redraw()
+        return 'break'
+    
+    def schedule_redraw(self):
+        """Redraw once the pending events are handled, however many requests come in"""
+        if self._redraw_job is None:
+            self._redraw_job = self.after_idle(self._redraw)
+    
+    def _on_destroy(self, event):
+        """Drop a pending redraw so it never runs on the destroyed canvas"""
+        if event.widget is self and self._redraw_job is not None:
+            self.after_cancel(self._redraw_job)
+            self._redraw_job = None
+    
+    def _redraw(self):
+        self._redraw_job = None
+        rows = self.visible_rows()
+        total = len(self.lines)
+        self.first = max(0, min(self.first, total - rows))
+        
+        self.delete('line')
+        line_height = self._line_height
+        default_style = (self._foreground, self._font)
+        for row, (tag, line) in enumerate(self.lines[self.first:self.first + rows + 1]):
+            fill, font = self._styles.get(tag, default_style)
+            self.create_text(4, row * line_height, text=line, anchor='nw',
+                             fill=fill, font=font, tags='line')
+        
+        # Horizontal scrolling is the canvas' own: the scrollregion spans the longest line
+        self.configure(scrollregion=(0, 0, max(self._content_width, self.winfo_width()),
+                                     self.winfo_height()))
+        
+        if self._yscrollcommand:
+            if total:
+                self._yscrollcommand(self.first / total, min(1.0, (self.first + rows) / total))
+            else:
+                self._yscrollcommand(0.0, 1.0)
+
 # Convenience functions
 def add_tooltip(widget, text: str):
     """Quick function to add tooltip to any widget"""
@@ -4,11 +4,16 @@ Parses XML logs, filters for errors/failures/success/pass, and explains hex code
 """
 
 import xml.etree.ElementTree as ET
+import os
 import re
 from datetime import datetime
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Pattern
 import json
 
+# Filter pattern used when no keywords are given - matches nothing, like any() over []
+_NEVER_MATCHES = re.compile(r"(?!)")
+
 class NRCCodeExplainer:
     """Explains Negative Response Codes (NRC) commonly used in automotive diagnostics"""
     
@@ -38,6 +43,7 @@ class NRCCodeExplainer:
     }
     
     @staticmethod
+    @lru_cache(maxsize=2048)
     def explain(nrc_code: str) -> str:
         """Explain an NRC code"""
         nrc_code = nrc_code.upper()
@@ -52,22 +58,29 @@ class HexExplainer:
     @staticmethod
     def explain_byte(hex_value: str) -> Dict[str, Any]:
         """Explain a hex byte value"""
+        # '0a' and '0A' share a cache entry; callers get their own copy to keep
+        explanation = HexExplainer._explain_normalized_byte(hex_value.upper())
+        if explanation is None:
+            return {"error": f"Invalid hex value: {hex_value}"}
+        return dict(explanation)
+    
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def _explain_normalized_byte(hex_value: str) -> Optional[Dict[str, Any]]:
+        """Cached worker for explain_byte on an uppercased value (None if invalid)"""
         try:
             # Remove 0x prefix if present
-            hex_clean = hex_value.replace("0x", "").replace("0X", "")
+            hex_clean = hex_value.replace("0X", "")
             decimal = int(hex_clean, 16)
-            binary = bin(decimal)[2:].zfill(8)
-            
-            explanation = {
-                "hex": f"0x{hex_clean.upper()}",
-                "decimal": decimal,
-                "binary": binary,
-                "ascii": chr(decimal) if 32 <= decimal <= 126 else "Non-printable"
-            }
-            
-            return explanation
         except ValueError:
-            return {"error": f"Invalid hex value: {hex_value}"}
+            return None
+        
+        return {
+            "hex": f"0x{hex_clean}",
+            "decimal": decimal,
+            "binary": bin(decimal)[2:].zfill(8),
+            "ascii": chr(decimal) if 32 <= decimal <= 126 else "Non-printable"
+        }
     
     @staticmethod
     def explain_multi_byte(hex_values: str) -> Dict[str, Any]:
@@ -124,7 +137,81 @@ class XMLLogParser:
             root = tree.getroot()
             
             # Parse all elements recursively
-            self._parse_element(root, filters)
+            self._parse_element(root, self._compile_filters(filters))
+            
+            return self.results
+        
+        except ET.ParseError as e:
+            return [{"error": f"XML Parse Error: {str(e)}"}]
+        except FileNotFoundError:
+            return [{"error": f"File not found: {filepath}"}]
+        except Exception as e:
+            return [{"error": f"Unexpected error: {str(e)}"}]
+    
+    def iterparse_file(self, filepath: str, filters: List[str] = None,
+                       progress_callback=None) -> List[Dict[str, Any]]:
+        """
+        Streaming variant of parse_file for large XML logs
+        
+        Elements are matched as soon as they are complete and then cleared, so only
+        the currently open branch of the document is held in memory. Results are
+        identical to parse_file, in the same document order.
+        
+        Args:
+            filepath: Path to XML log file
+            filters: List of keywords to filter (same defaults as parse_file)
+            progress_callback: Optional callback(percentage, status_text)
+        
+        Returns:
+            List of parsed and filtered log entries
+        """
+        if filters is None:
+            filters = ['error', 'failure', 'success', 'pass']
+        
+        self.results = []
+        matcher = self._compile_filters(filters)
+        
+        try:
+            total_size = os.path.getsize(filepath) or 1
+            with open(filepath, 'rb') as f:
+                paths = []
+                starts = []
+                element_count = 0
+                
+                for event, element in ET.iterparse(f, events=('start', 'end')):
+                    if event == 'start':
+                        paths.append(f"{paths[-1]}/{element.tag}" if paths else element.tag)
+                        starts.append(len(self.results))
+                        continue
+                    
+                    # Element is complete - match it like _parse_element does
+                    current_path = paths.pop()
+                    start = starts.pop()
+                    mark = len(self.results)
+                    
+                    if self._matches_filter(element.tag, matcher):
+                        self._add_result(element, current_path, "tag")
+                    if element.text and element.text.strip():
+                        if self._matches_filter(element.text, matcher):
+                            self._add_result(element, current_path, "text")
+                    for attr_name, attr_value in element.attrib.items():
+                        if self._matches_filter(attr_name, matcher) or self._matches_filter(attr_value, matcher):
+                            self._add_result(element, current_path, "attribute", attr_name, attr_value)
+                    
+                    # Its own results go ahead of its descendants' to keep document (pre-)order
+                    if start < mark < len(self.results):
+                        own = self.results[mark:]
+                        del self.results[mark:]
+                        self.results[start:start] = own
+                    element.clear()
+                    
+                    element_count += 1
+                    if progress_callback and element_count % 5000 == 0:
+                        progress = min(99, int(f.tell() * 100 / total_size))
+                        progress_callback(progress, f"Processed {element_count:,} XML elements")
+            
+            if progress_callback:
+                progress_callback(100, f"Completed processing {element_count:,} XML elements")
             
             return self.results
         
@@ -135,7 +222,7 @@ class XMLLogParser:
         except Exception as e:
             return [{"error": f"Unexpected error: {str(e)}"}]
     
-    def _parse_element(self, element: ET.Element, filters: List[str], parent_path: str = ""):
+    def _parse_element(self, element: ET.Element, filters: Pattern[str], parent_path: str = ""):
         """Recursively parse XML elements"""
         current_path = f"{parent_path}/{element.tag}" if parent_path else element.tag
         
@@ -157,10 +244,16 @@ class XMLLogParser:
         for child in element:
             self._parse_element(child, filters, current_path)
     
-    def _matches_filter(self, text: str, filters: List[str]) -> bool:
-        """Check if text matches any filter keyword"""
-        text_lower = str(text).lower()
-        return any(filter_word.lower() in text_lower for filter_word in filters)
+    @staticmethod
+    def _compile_filters(filters: List[str]) -> Pattern[str]:
+        """Build one alternation over the lowercased filter keywords for a whole parse"""
+        if not filters:
+            return _NEVER_MATCHES
+        return re.compile("|".join(re.escape(filter_word.lower()) for filter_word in filters))
+    
+    def _matches_filter(self, text: str, filters: Pattern[str]) -> bool:
+        """Check if text matches any filter keyword (filters from _compile_filters)"""
+        return filters.search(str(text).lower()) is not None
     
     def _add_result(self, element: ET.Element, path: str, match_type: str, 
                     attr_name: str = None, attr_value: str = None):